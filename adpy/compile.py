@@ -1,26 +1,76 @@
 from __future__ import print_function
 
 import os
+import re
+import sys
+import json
+import time
+import fcntl
+import shutil
+import hashlib
+import threading
 import numpy as np
 import subprocess
+import multiprocessing
 import multiprocessing.pool
 
 from distutils.sysconfig import get_python_inc
 
 from . import config
 
-def compile_gencode(codeDir, moduleName, compiler='ccache gcc', linker='g++', incdirs=None, libdirs=None, libs=None, sources=None, extra_compile_args=None):
-    if incdirs is None:
-        incdirs = []
-    if libdirs is None:
-        libdirs = []
-    if libs is None:
-        libs = []
-    if sources is None:
-        sources = []
-    if extra_compile_args is None:
-        extra_compile_args = []
-    codeDir = os.path.realpath(codeDir)
+_includeRegex = re.compile(r'^\s*#\s*include\s*"([^"]+)"', re.MULTILINE)
+_vectorizedRegex = re.compile(r'^([^:\n]+):\d+:\d+: optimized: loop vectorized using (\d+) byte vectors', re.MULTILINE)
+
+def source_dependencies(src, incdirs):
+    # quoted includes only, system headers are covered by the include paths
+    # being part of the flags
+    deps = []
+    stack = [src]
+    while len(stack) > 0:
+        path = stack.pop()
+        if path in deps:
+            continue
+        deps.append(path)
+        with open(path) as f:
+            headers = _includeRegex.findall(f.read())
+        for header in headers:
+            for inc in [os.path.dirname(path)] + incdirs:
+                dep = os.path.join(inc, header)
+                if os.path.exists(dep):
+                    stack.append(os.path.realpath(dep))
+                    break
+    return deps
+
+def source_signature(cmd, src, incdirs):
+    sha = hashlib.sha1()
+    sha.update(' '.join(cmd).encode('utf-8'))
+    for dep in source_dependencies(src, incdirs):
+        with open(dep, 'rb') as f:
+            sha.update(f.read())
+    return sha.hexdigest()
+
+def vector_report(err):
+    # widest vectors used by a loop of each source in the -fopt-info-vec
+    # output of the compiler
+    report = {}
+    for path, width in _vectorizedRegex.findall(err):
+        name = os.path.basename(path)
+        report[name] = max(report.get(name, 0), int(width))
+    return report
+
+def load_vector_report(codeDir):
+    path = os.path.join(codeDir, 'vectorize.json')
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def get_build(codeDir, moduleName, compiler='ccache gcc', linker='g++', incdirs=None, libdirs=None, libs=None, sources=None, extra_compile_args=None, gen_sources=None):
+    incdirs = list(incdirs or [])
+    libdirs = list(libdirs or [])
+    libs = list(libs or [])
+    sources = list(sources or [])
+    extra_compile_args = list(extra_compile_args or [])
     openmp = config.openmp
     gpu = config.gpu
     gpu_double = config.gpu_double
@@ -31,19 +81,23 @@ def compile_gencode(codeDir, moduleName, compiler='ccache gcc', linker='g++', in
         compiler = 'nvcc -x cu'
         linker = 'nvcc --shared'
 
-    home = os.path.expanduser("~")
     external = (len(sources) == 0)
     incdirs += [get_python_inc(), np.get_include(), codeDir] + config.get_include_dirs(external)
-    sources += config.get_module_sources(external)
-    sources += [os.path.join(config.cppDir, x) for x in config.get_sources()]
-    sources += [x.format(codeExt) for x in ['kernel.{}', 'code.{}']]
+    runtimeSources = list(sources) + config.get_module_sources(external)
+    runtimeSources += [os.path.join(config.cppDir, x) for x in config.get_sources()]
+    if gen_sources is None:
+        genSources = [x.format(codeExt) for x in ['kernel.{}', 'code.{}']]
+    else:
+        genSources = list(gen_sources)
 
     extra_compile_args += ['-std=c++11', '-O3', '-g']
-    extra_compile_args += ["-DMODULE={}".format(moduleName)]
     link_args = []
+    if config.profile_counters and sys.platform.startswith('linux'):
+        extra_compile_args += ['-DPROFILE_COUNTERS']
     if openmp:
         extra_compile_args += ['-fopenmp']
-        link_args = ['-lgomp']
+        # a library before the objects is dropped by as-needed linkers
+        link_args = ['-fopenmp']
     if gpu:
         #cmdclass = {}
         nv_arch="-gencode=arch=compute_52,code=\"sm_52,compute_52\""
@@ -51,40 +105,274 @@ def compile_gencode(codeDir, moduleName, compiler='ccache gcc', linker='g++', in
         extra_compile_args += ['-DGPU']
         if gpu_double:
             extra_compile_args += ['-DGPU_DOUBLE']
-        
+
         libs += ['gomp']
     else:
         extra_compile_args += ['-fPIC', '-Wall', '-march=native']
         extra_compile_args += ['-Wfatal-errors']
         link_args += ['-shared']
+        if config.vectorize:
+            # errno is never read, without this sqrt is a branch that
+            # keeps loops from vectorizing
+            extra_compile_args += ['-fopenmp-simd', '-fno-math-errno', '-fopt-info-vec-optimized']
+
+    build = {}
+    build['module'] = '{}.so'.format(moduleName)
+    build['runtimeSources'] = runtimeSources
+    build['genSources'] = genSources
+    build['sources'] = runtimeSources + genSources
+    # only the module init source depends on the module name, keep
+    # the flags of the others stable so that their objects can be reused
+    build['moduleSource'] = config.get_module_sources(external)[0]
+    build['moduleArgs'] = ["-DMODULE={}".format(moduleName)]
+    build['incpaths'] = incdirs
+    build['compiler'] = compiler.split(' ')
+    build['linker'] = linker.split(' ')
+    build['compile_args'] = extra_compile_args
+    build['link_args'] = link_args
+    build['incdirs'] = ['-I'+inc for inc in incdirs]
+    build['libdirs'] = ['-L'+lib for lib in libdirs]
+    build['libs'] = ['-l' + lib for lib in libs]
+    return build
 
-    module = '{}.so'.format(moduleName)
-    incdirs = ['-I'+inc for inc in incdirs]
-    libdirs = ['-L'+lib for lib in libdirs]
-    compiler = compiler.split(' ')
-    linker = linker.split(' ')
-    libs = ['-l' + lib for lib in libs]
+def compile_gencode(codeDir, moduleName, jobs=None, **kwargs):
+    if jobs is None:
+        jobs = multiprocessing.cpu_count()
+    codeDir = os.path.realpath(codeDir)
+    build = get_build(codeDir, moduleName, **kwargs)
+    sources = build['sources']
+    module = build['module']
+    compiler = build['compiler']
+    incdirs = build['incdirs']
+    extra_compile_args = build['compile_args']
+    incpaths = build['incpaths']
     objects = [os.path.basename(src).split('.')[0] + '.o' for src in sources]
+    report = '-fopt-info-vec-optimized' in extra_compile_args
 
     print('Compiling module', os.path.join(codeDir, module))
 
-    def single_compile(src):
-        cmd = compiler + extra_compile_args + incdirs + [src, '-c']
-        with open(os.path.join(codeDir, 'output.log'), 'a') as f, open(os.path.join(codeDir, 'error.log'), 'a') as fe: 
-            f.write(' '.join(cmd))
-            #print(' '.join(cmd))
-            subprocess.check_call(cmd, stdout=f, stderr=fe, cwd=codeDir)
-
-    n = len(sources)
-    #n = 4
-    #n = 1
-    #res = list(multiprocessing.pool.ThreadPool(n).imap(single_compile, sources))
-    for src in sources:
-        single_compile(src)
-
-    cmd = linker + link_args + objects + libdirs + libs + ['-o', module]
+    manifestFile = os.path.join(codeDir, 'objects.json')
+    manifest = {}
+    if os.path.exists(manifestFile):
+        with open(manifestFile) as f:
+            manifest = json.load(f)
+    logLock = threading.Lock()
+    # the logs hold the last build
+    for name in ['output.log', 'error.log']:
+        open(os.path.join(codeDir, name), 'w').close()
+
+    def log(cmd, out, err):
+        with logLock:
+            with open(os.path.join(codeDir, 'output.log'), 'a') as f, open(os.path.join(codeDir, 'error.log'), 'a') as fe:
+                f.write(' '.join(cmd) + '\n')
+                f.write(out.decode('utf-8', 'replace'))
+                fe.write(err.decode('utf-8', 'replace'))
+
+    def single_compile(args):
+        src, obj = args
+        cmd = compiler + extra_compile_args + incdirs + [src, '-c', '-o', obj]
+        if src == build['moduleSource']:
+            cmd += build['moduleArgs']
+        signature = source_signature(cmd, os.path.join(codeDir, src), incpaths)
+        if manifest.get(obj) == signature and os.path.exists(os.path.join(codeDir, obj)):
+            return obj, signature, None, None
+        start = time.time()
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=codeDir)
+        out, err = proc.communicate()
+        log(cmd, out, err)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        width = None
+        if report:
+            width = vector_report(err.decode('utf-8', 'replace')).get(os.path.basename(src), 0)
+        return obj, signature, time.time()-start, width
+
+    n = min(max(jobs, 1), len(sources))
+    start = time.time()
+    pool = multiprocessing.pool.ThreadPool(n)
+    try:
+        res = pool.map(single_compile, list(zip(sources, objects)))
+    finally:
+        pool.close()
+        pool.join()
+
+    timings = {}
+    vectors = load_vector_report(codeDir)
+    for src, (obj, signature, elapsed, width) in zip(sources, res):
+        manifest[obj] = signature
+        timings[os.path.basename(src)] = elapsed
+        if width is not None:
+            vectors[os.path.basename(src)] = width
+        if elapsed is None:
+            print('\t{}: up to date'.format(os.path.basename(src)))
+        else:
+            print('\t{}: {:.2f}s'.format(os.path.basename(src), elapsed))
+    # objects of earlier graphs built here are not kept
+    manifest = dict([(obj, manifest[obj]) for obj in objects])
+    prune_gencode(codeDir, objects + [os.path.basename(src) for src in build['genSources']])
+    with open(manifestFile, 'w') as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+    if report:
+        with open(os.path.join(codeDir, 'vectorize.json'), 'w') as f:
+            json.dump(vectors, f, indent=4, sort_keys=True)
+
+    cmd = build['linker'] + build['link_args'] + objects + build['libdirs'] + build['libs'] + ['-o', module]
     #print(' '.join(cmd))
-    with open(os.path.join(codeDir, 'output.log'), 'a') as f, open(os.path.join(codeDir, 'error.log'), 'a') as fe: 
-        f.write(' '.join(cmd))
+    with open(os.path.join(codeDir, 'output.log'), 'a') as f, open(os.path.join(codeDir, 'error.log'), 'a') as fe:
+        f.write(' '.join(cmd) + '\n')
         subprocess.check_call(cmd, stderr=subprocess.STDOUT, cwd=codeDir)
-    #print()
+    print('\ttotal: {:.2f}s with {} jobs'.format(time.time()-start, n))
+    return timings
+
+def prune_gencode(codeDir, keep):
+    # objects and generated kernel sources not in keep are removed
+    for name in os.listdir(codeDir):
+        kernel = name.startswith('kernel_') and os.path.splitext(name)[1] in ['.cpp', '.cu']
+        if (name.endswith('.o') or kernel) and name not in keep:
+            os.remove(os.path.join(codeDir, name))
+
+def prune_cache(cacheDir, size, keep=()):
+    # the least recently used modules are removed until the cache holds
+    # at most size bytes, modules in keep stay
+    modules = []
+    for name in os.listdir(cacheDir):
+        path = os.path.join(cacheDir, name)
+        if not name.endswith('.so'):
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        modules.append((stat.st_mtime, path, stat.st_size))
+    total = sum([x[2] for x in modules])
+    for _, path, nBytes in sorted(modules):
+        if total <= size:
+            break
+        if path in keep:
+            continue
+        for remove in [path, path[:-len('.so')] + '.vectorize.json']:
+            try:
+                os.remove(remove)
+            except OSError:
+                pass
+        total -= nBytes
+
+def module_signature(moduleName, genSources, **kwargs):
+    kwargs.pop('jobs', None)
+    # the build directory is left out so that every case shares the key
+    build = get_build('', moduleName, **kwargs)
+    incpaths = [inc for inc in build['incpaths'] if inc != '']
+    sha = hashlib.sha1()
+    for key in ['compiler', 'linker', 'compile_args', 'moduleArgs', 'link_args', 'incdirs', 'libdirs', 'libs']:
+        sha.update(' '.join(build[key]).encode('utf-8'))
+    for key in ['gpu', 'gpu_double', 'openmp', 'profile', 'gc']:
+        sha.update('{}={}'.format(key, getattr(config, key)).encode('utf-8'))
+    sha.update(np.dtype(config.precision).name.encode('utf-8'))
+    sha.update(sys.version.encode('utf-8'))
+    sha.update(np.__version__.encode('utf-8'))
+    deps = []
+    for src in build['runtimeSources']:
+        deps.extend(source_dependencies(src, incpaths))
+    for inc in config.get_include_dirs():
+        paths = [os.path.join(inc, x) for x in sorted(os.listdir(inc))]
+        deps.extend([path for path in paths if os.path.isfile(path) and os.access(path, os.R_OK)])
+    for dep in sorted(set(deps)):
+        with open(dep, 'rb') as f:
+            sha.update(f.read())
+    for name in sorted(genSources.keys()):
+        sha.update(name.encode('utf-8'))
+        sha.update(genSources[name].encode('utf-8'))
+    return sha.hexdigest()
+
+class FileLock(object):
+    # with remove the file is deleted on release, for locks guarding
+    # something the holders check for again once they acquire them
+    def __init__(self, path, remove=False):
+        self.path = path
+        self.remove = remove
+        self.f = None
+
+    def __enter__(self):
+        self.f = open(self.path, 'a')
+        fcntl.flock(self.f, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *args):
+        if self.remove:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+        fcntl.flock(self.f, fcntl.LOCK_UN)
+        self.f.close()
+
+def write_gencode(codeDir, genSources):
+    for name, string in genSources.items():
+        with open(os.path.join(codeDir, name), 'w') as f:
+            f.write(string)
+
+def compile_cached(codeDir, moduleName, genSources, cacheDir, **kwargs):
+    # the compiled module is installed in the cache under a key of
+    # everything that goes into it, processes building the same module
+    # concurrently wait on the lock and load the installed copy
+    key = module_signature(moduleName, genSources, **kwargs)
+    cached = os.path.join(cacheDir, '{}-{}.so'.format(moduleName, key))
+    # the vectorization report of the build is kept next to the module
+    cachedReport = os.path.join(cacheDir, '{}-{}.vectorize.json'.format(moduleName, key))
+    def restore():
+        print('Loading cached module', cached)
+        # the modules used last are evicted last
+        try:
+            os.utime(cached, None)
+        except OSError:
+            pass
+        if os.path.exists(cachedReport):
+            shutil.copyfile(cachedReport, os.path.join(codeDir, 'vectorize.json'))
+        return cached, {}
+    if os.path.exists(cached):
+        return restore()
+    if not os.path.exists(cacheDir):
+        try:
+            os.makedirs(cacheDir)
+        except OSError:
+            if not os.path.isdir(cacheDir):
+                raise
+    with FileLock(cached + '.lock', remove=True):
+        if os.path.exists(cached):
+            return restore()
+        with FileLock(os.path.join(codeDir, 'build.lock')):
+            write_gencode(codeDir, genSources)
+            timings = compile_gencode(codeDir, moduleName, **kwargs)
+            if config.vectorize and os.path.exists(os.path.join(codeDir, 'vectorize.json')):
+                shutil.copyfile(os.path.join(codeDir, 'vectorize.json'), cachedReport)
+            tmp = '{}.{}.tmp'.format(cached, os.getpid())
+            shutil.copyfile(os.path.join(codeDir, '{}.so'.format(moduleName)), tmp)
+            os.rename(tmp, cached)
+    if config.cacheSize is not None:
+        prune_cache(cacheDir, config.cacheSize, keep=[cached])
+    return cached, timings
+
+def build_module(codeDir, moduleName, genSources, cacheDir=None, **kwargs):
+    # returns the path of the module, the compile times of the sources
+    # and the total time. modules building in the same directory wait
+    # on each other, it is run in worker threads and processes
+    start = time.time()
+    if cacheDir is not None:
+        modulePath, timings = compile_cached(codeDir, moduleName, genSources, cacheDir, **kwargs)
+    else:
+        with FileLock(os.path.join(codeDir, 'build.lock')):
+            write_gencode(codeDir, genSources)
+            timings = compile_gencode(codeDir, moduleName, **kwargs)
+        modulePath = os.path.join(codeDir, '{}.so'.format(moduleName))
+    return modulePath, timings, time.time()-start
+
+def load_module(moduleName, path):
+    try:
+        import importlib.util
+    except ImportError:
+        import imp
+        return imp.load_dynamic(moduleName, path)
+    spec = importlib.util.spec_from_file_location(moduleName, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
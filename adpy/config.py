@@ -4,21 +4,53 @@ import os
 gpu = False
 gpu_double = False
 precision = np.float64
+# generated code counts calls and time of every kernel and Function,
+# see Function.getProfile
 profile = False
+# also read the cycle and cache miss counters of linux perf_event
+profile_counters = False
 gc = False
 compile = True
 openmp = False
+# algebraic simplification and CSE of the kernel scalar graphs
+optimize = True
+# consecutive elementwise kernels of a Function run in a single loop
+fuse = True
+# kernel loops carry omp simd pragmas, the compiler reports which
+# kernels vectorized
+vectorize = False
+# parallel scatter of Collate under openmp, 'atomic', 'private' or
+# 'color', Kernel(func, scatter=...) overrides it for a kernel
+scatter = 'atomic'
+# reductions give the same bits for any number of threads
+reproducible = False
 codeExt = 'cpp'
+# compiled modules are shared through a content addressed cache,
+# defaults to gencode/cache in the case directory
+cache = True
+cacheDir = None
+# bytes of modules the cache keeps, the least recently used are removed
+# beyond it, None keeps all
+cacheSize = 2**30
 
 def set_config(config):
     globals()['gpu']  = config.gpu
     globals()['gpu_double']  = config.gpu_double
     globals()['precision']  = config.precision
     globals()['profile']  = config.profile
+    globals()['profile_counters'] = getattr(config, 'profile_counters', profile_counters)
     globals()['gc']  = config.gc
     globals()['compile'] = config.compile
     globals()['openmp'] = config.openmp
     globals()['codeExt'] = config.codeExt
+    globals()['optimize'] = getattr(config, 'optimize', optimize)
+    globals()['fuse'] = getattr(config, 'fuse', fuse)
+    globals()['vectorize'] = getattr(config, 'vectorize', vectorize)
+    globals()['scatter'] = getattr(config, 'scatter', scatter)
+    globals()['reproducible'] = getattr(config, 'reproducible', reproducible)
+    globals()['cache'] = getattr(config, 'cache', cache)
+    globals()['cacheDir'] = getattr(config, 'cacheDir', cacheDir)
+    globals()['cacheSize'] = getattr(config, 'cacheSize', cacheSize)
 
 from . import cpp
 cppDir = os.path.realpath(os.path.dirname(cpp.__file__))
@@ -44,6 +76,8 @@ def get_module_sources(external=True):
 
 def get_gen_sources():
     codeFile = 'code.{}'.format(codeExt)
-    kernelCodeFile = 'kernel.{}'.format(codeExt)
     kernelHeaderFile = 'kernel.hpp'
-    return codeFile, kernelCodeFile, kernelHeaderFile
+    return codeFile, kernelHeaderFile
+
+def get_kernel_source(name):
+    return 'kernel_{}.{}'.format(name, codeExt)
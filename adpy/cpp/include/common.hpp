@@ -2,6 +2,7 @@
 #define COMMON_HPP
 
 #include <cstdint>
+#include <cstdlib>
 #include <cstdio>
 #include <cstring>
 #include <cmath>
@@ -33,6 +34,27 @@ typedef int32_t integer;
 typedef int64_t bigInteger;
 
 #define NDIMS 4
+// buffers start and end on cache line boundaries, so that vectorized
+// kernel loops need no peeling for alignment
+#define MEMORY_ALIGNMENT 64
+// iterations per partial result of a reproducible reduction
+#define REDUCE_BLOCK 1024
+
+// combines partial results pairwise in an order that depends only on
+// their number
+template <typename dtype, typename Op>
+dtype reduce_pairwise(vector<dtype>& partials, dtype initial, Op op) {
+    size_t n = partials.size();
+    if (n == 0) {
+        return initial;
+    }
+    for (size_t stride = 1; stride < n; stride *= 2) {
+        for (size_t k = 0; k + stride < n; k += 2*stride) {
+            partials[k] = op(partials[k], partials[k + stride]);
+        }
+    }
+    return partials[0];
+}
 
 // crtp?
 class MemoryBuffer {
@@ -102,7 +124,10 @@ class MemoryBuffer {
 class CPUMemoryBuffer: public MemoryBuffer {
     public:
     void alloc(void **data, bigInteger size) {
-        *data = malloc(size);
+        size = (size + MEMORY_ALIGNMENT - 1)/MEMORY_ALIGNMENT*MEMORY_ALIGNMENT;
+        if (posix_memalign(data, MEMORY_ALIGNMENT, size) != 0) {
+            *data = NULL;
+        }
         if (*data == NULL) {
             cout << size << " alloc failed" << endl;
             exit(1);
@@ -22,10 +22,83 @@ char* PyString_AsString(PyObject* result);
 #define GET_MODULE(name, mod) _GET_MODULE(name, mod)
 
 
+// arguments of the generated functions, positional only, the last one
+// is the bitmask of the call options
+#if PY_VERSION_HEX >= 0x03070000
+    #define FUNCTION_ARGS PyObject *const *args, Py_ssize_t nargs
+    #define FUNCTION_ARG(i) args[i]
+    #define FUNCTION_NARGS nargs
+    #define FUNCTION_FLAGS METH_FASTCALL
+#else
+    #define FUNCTION_ARGS PyObject *args
+    #define FUNCTION_ARG(i) PyTuple_GET_ITEM(args, i)
+    #define FUNCTION_NARGS PyTuple_GET_SIZE(args)
+    #define FUNCTION_FLAGS METH_VARARGS
+#endif
+
 PyObject* PyTuple_CreateNone(int);
-map<string, int> PyOptions_Parse(PyObject*);
 long long current_timestamp();
 
+// iterations of a scatter kernel grouped by color, no two iterations
+// of a color write the same row. color c runs order[offsets[c]] to
+// order[offsets[c+1]-1]
+struct Coloring {
+    integer n = -1;
+    integer count = 0;
+    vector<integer> order;
+    vector<integer> offsets;
+};
+const Coloring& scatter_coloring(bigInteger key, integer n, const vector<const integer*>& indices, const vector<integer>& strides);
+
+// calls and time of a kernel, external function or Function when
+// profiling, loads, stores and flops are per iteration. hardware
+// counters are -1 when not available
+struct ProfileEntry {
+    string kind;
+    double loads = 0;
+    double stores = 0;
+    double flops = 0;
+    bigInteger calls = 0;
+    bigInteger iterations = 0;
+    double time = 0;
+    bigInteger cycles = 0;
+    bigInteger cacheMisses = 0;
+};
+struct ProfileTimer {
+    double start;
+    bigInteger cycles;
+    bigInteger cacheMisses;
+};
+ProfileEntry& profile_entry(const char* name, const char* kind, double loads=0, double stores=0, double flops=0);
+ProfileTimer profile_start();
+void profile_stop(ProfileEntry& entry, const ProfileTimer& timer, integer n);
+PyObject* get_profile(PyObject *self, PyObject *args);
+PyObject* reset_profile(PyObject *self, PyObject *args);
+
+// array of an input of a generated function, a new reference. objects
+// that are aligned C contiguous arrays of the type are used in place,
+// others are converted once and counted by name
+PyArrayObject* getInput(PyObject *object, int typenum, const char* name, bool convert=true);
+PyObject* get_conversions(PyObject *self, PyObject *args);
+PyObject* reset_conversions(PyObject *self, PyObject *args);
+
+// keeps the array an input is read from alive for the call
+struct ArrayRef {
+    PyArrayObject* array;
+    ArrayRef(PyArrayObject* array) : array(array) {}
+    ~ArrayRef() { Py_XDECREF(array); }
+};
+
+template <typename dtype>
+int arrayType() {
+    if (typeid(dtype) == typeid(double)) {
+        return NPY_DOUBLE;
+    } else if (typeid(dtype) == typeid(float)) {
+        return NPY_FLOAT;
+    }
+    return NPY_INT32;
+}
+
 template <template<typename, integer, integer, integer> class derivedArrType, typename dtype, integer shape1, integer shape2=1, integer shape3=1>
 void getArray(PyArrayObject *array, derivedArrType<dtype, shape1, shape2, shape3>& tmp, bool keepMemory=false, int64_t id=0) {
     static_assert(shape3 == 1, "shape3 exceeded");
@@ -1,5 +1,6 @@
 #define NO_IMPORT_ARRAY
 #include "interface.hpp"
+#include <chrono>
 
 #ifdef PY3
 char* PyString_AsString(PyObject* result) {
@@ -25,17 +26,6 @@ PyObject* PyTuple_CreateNone(int n) {
     return outputs;
 }
 
-map<string, int> PyOptions_Parse(PyObject* dict) {
-    PyObject *key2, *value2;
-    map<string, int> options;
-    Py_ssize_t pos2 = 0;
-    while (PyDict_Next(dict, &pos2, &key2, &value2)) {
-        string ckey2 = PyString_AsString(key2);
-        options[ckey2] = PyObject_IsTrue(value2);
-    }
-    return options;
-}
-
 long long mil = 0;
 long long current_timestamp() {
     struct timeval te; 
@@ -43,3 +33,219 @@ long long current_timestamp() {
     long long curr_time = te.tv_sec*1000000LL + te.tv_usec; // caculate microseconds
     return curr_time;
 }
+
+const Coloring& scatter_coloring(bigInteger key, integer n, const vector<const integer*>& indices, const vector<integer>& strides) {
+    // colorings of static index arrays are computed once, key 0 is
+    // recomputed on every call
+    static map<bigInteger, Coloring> cache;
+    Coloring& coloring = cache[key];
+    if (key != 0 && coloring.n == n) {
+        return coloring;
+    }
+    // greedy, an iteration takes the first color none of its rows has
+    vector<vector<integer>> rowColors;
+    vector<integer> color(n);
+    vector<integer> forbidden;
+    integer count = 0;
+    for (integer i = 0; i < n; i++) {
+        for (size_t k = 0; k < indices.size(); k++) {
+            integer row = indices[k][(bigInteger)i*strides[k]];
+            if (row >= (integer) rowColors.size()) {
+                rowColors.resize(row + 1);
+            }
+            for (integer c: rowColors[row]) {
+                forbidden[c] = i;
+            }
+        }
+        integer c = 0;
+        while (c < count && forbidden[c] == i) {
+            c++;
+        }
+        if (c == count) {
+            count++;
+            forbidden.push_back(-1);
+        }
+        color[i] = c;
+        for (size_t k = 0; k < indices.size(); k++) {
+            integer row = indices[k][(bigInteger)i*strides[k]];
+            vector<integer>& colors = rowColors[row];
+            if (colors.empty() || colors.back() != c) {
+                colors.push_back(c);
+            }
+        }
+    }
+    // iterations sorted by color, in their original order within one
+    coloring.offsets.assign(count + 1, 0);
+    for (integer i = 0; i < n; i++) {
+        coloring.offsets[color[i] + 1]++;
+    }
+    for (integer c = 0; c < count; c++) {
+        coloring.offsets[c + 1] += coloring.offsets[c];
+    }
+    coloring.order.resize(n);
+    vector<integer> next(coloring.offsets.begin(), coloring.offsets.end() - 1);
+    for (integer i = 0; i < n; i++) {
+        coloring.order[next[color[i]]++] = i;
+    }
+    coloring.n = n;
+    coloring.count = count;
+    return coloring;
+}
+
+#ifdef PROFILE_COUNTERS
+#include <linux/perf_event.h>
+#include <sys/syscall.h>
+#include <unistd.h>
+
+// counters of the calling thread, -1 if the kernel does not allow it
+static int perf_counter(uint64_t config) {
+    struct perf_event_attr attr;
+    memset(&attr, 0, sizeof(attr));
+    attr.type = PERF_TYPE_HARDWARE;
+    attr.size = sizeof(attr);
+    attr.config = config;
+    attr.exclude_kernel = 1;
+    attr.exclude_hv = 1;
+    return syscall(__NR_perf_event_open, &attr, 0, -1, -1, 0);
+}
+
+static bigInteger perf_read(int fd) {
+    long long value;
+    if (fd < 0 || read(fd, &value, sizeof(value)) != sizeof(value)) {
+        return -1;
+    }
+    return value;
+}
+#endif
+
+static map<string, ProfileEntry>& profile_entries() {
+    static map<string, ProfileEntry> entries;
+    return entries;
+}
+
+ProfileEntry& profile_entry(const char* name, const char* kind, double loads, double stores, double flops) {
+    // generated code keeps the reference, entries are never erased
+    ProfileEntry& entry = profile_entries()[name];
+    entry.kind = kind;
+    entry.loads = loads;
+    entry.stores = stores;
+    entry.flops = flops;
+    return entry;
+}
+
+ProfileTimer profile_start() {
+    ProfileTimer timer;
+    timer.cycles = -1;
+    timer.cacheMisses = -1;
+    #ifdef PROFILE_COUNTERS
+        static int cycles = perf_counter(PERF_COUNT_HW_CPU_CYCLES);
+        static int cacheMisses = perf_counter(PERF_COUNT_HW_CACHE_MISSES);
+        timer.cycles = perf_read(cycles);
+        timer.cacheMisses = perf_read(cacheMisses);
+    #endif
+    timer.start = chrono::duration<double>(chrono::steady_clock::now().time_since_epoch()).count();
+    return timer;
+}
+
+void profile_stop(ProfileEntry& entry, const ProfileTimer& timer, integer n) {
+    double end = chrono::duration<double>(chrono::steady_clock::now().time_since_epoch()).count();
+    entry.time += end - timer.start;
+    entry.calls += 1;
+    entry.iterations += n;
+    ProfileTimer now = timer;
+    #ifdef PROFILE_COUNTERS
+        now = profile_start();
+    #endif
+    if (timer.cycles < 0 || now.cycles < 0) {
+        entry.cycles = -1;
+    } else if (entry.cycles >= 0) {
+        entry.cycles += now.cycles - timer.cycles;
+    }
+    if (timer.cacheMisses < 0 || now.cacheMisses < 0) {
+        entry.cacheMisses = -1;
+    } else if (entry.cacheMisses >= 0) {
+        entry.cacheMisses += now.cacheMisses - timer.cacheMisses;
+    }
+}
+
+PyObject* get_profile(PyObject *self, PyObject *args) {
+    PyObject* profile = PyDict_New();
+    for (auto& item: profile_entries()) {
+        const ProfileEntry& entry = item.second;
+        PyObject* value = Py_BuildValue("{s:s,s:L,s:L,s:d,s:d,s:d,s:d,s:L,s:L}",
+            "kind", entry.kind.c_str(),
+            "calls", (long long) entry.calls,
+            "iterations", (long long) entry.iterations,
+            "time", entry.time,
+            "loads", entry.loads*entry.iterations,
+            "stores", entry.stores*entry.iterations,
+            "flops", entry.flops*entry.iterations,
+            "cycles", (long long) entry.cycles,
+            "cache_misses", (long long) entry.cacheMisses);
+        PyDict_SetItemString(profile, item.first.c_str(), value);
+        Py_DECREF(value);
+    }
+    return profile;
+}
+
+PyObject* reset_profile(PyObject *self, PyObject *args) {
+    for (auto& item: profile_entries()) {
+        ProfileEntry& entry = item.second;
+        entry.calls = 0;
+        entry.iterations = 0;
+        entry.time = 0;
+        entry.cycles = 0;
+        entry.cacheMisses = 0;
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static map<string, bigInteger>& conversion_counts() {
+    static map<string, bigInteger> counts;
+    return counts;
+}
+
+PyArrayObject* getInput(PyObject *object, int typenum, const char* name, bool convert) {
+    // arrays and buffer protocol objects are viewed without a copy
+    PyArrayObject* array = (PyArrayObject*) PyArray_FromAny(object, NULL, 0, 0, 0, NULL);
+    if (array == NULL) {
+        return NULL;
+    }
+    bool inPlace = PyArray_Check(object) || PyObject_CheckBuffer(object);
+    if (inPlace && PyArray_TYPE(array) == typenum && PyArray_ISCARRAY_RO(array) && PyArray_ISNOTSWAPPED(array)) {
+        return array;
+    }
+    // the code writes to static and reusable inputs, not to a copy
+    if (!convert) {
+        if (PyArray_TYPE(array) != typenum) {
+            PyArray_Descr* expected = PyArray_DescrFromType(typenum);
+            PyErr_Format(PyExc_TypeError, "%s: written input of dtype '%c', expected '%c'", name, PyArray_DESCR(array)->type, expected->type);
+            Py_DECREF(expected);
+        } else {
+            PyErr_Format(PyExc_ValueError, "%s: written input is not a C contiguous array", name);
+        }
+        Py_DECREF(array);
+        return NULL;
+    }
+    conversion_counts()[name] += 1;
+    PyArrayObject* converted = (PyArrayObject*) PyArray_FromAny((PyObject*) array, PyArray_DescrFromType(typenum), 0, 0, NPY_ARRAY_IN_ARRAY | NPY_ARRAY_FORCECAST, NULL);
+    Py_DECREF(array);
+    return converted;
+}
+
+PyObject* get_conversions(PyObject *self, PyObject *args) {
+    PyObject* conversions = PyDict_New();
+    for (auto& item: conversion_counts()) {
+        PyObject* value = PyLong_FromLongLong(item.second);
+        PyDict_SetItemString(conversions, item.first.c_str(), value);
+        Py_DECREF(value);
+    }
+    return conversions;
+}
+
+PyObject* reset_conversions(PyObject *self, PyObject *args) {
+    conversion_counts().clear();
+    Py_INCREF(Py_None);
+    return Py_None;
+}
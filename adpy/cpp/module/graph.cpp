@@ -31,7 +31,12 @@ PyObject* initialize(PyObject *self, PyObject *args) {
 
 PyMethodDef StaticMethods[] = {
     {"initialize",  initialize, METH_VARARGS, "Execute a shell command."},
+    {"get_profile",  get_profile, METH_NOARGS, "Profile counters by kernel and Function."},
+    {"reset_profile",  reset_profile, METH_NOARGS, "Zero the profile counters."},
+    {"get_conversions",  get_conversions, METH_NOARGS, "Inputs copied to convert them by Function and argument."},
+    {"reset_conversions",  reset_conversions, METH_NOARGS, "Zero the conversion counters."},
 };
+static const int nStaticMethods = sizeof(StaticMethods)/sizeof(PyMethodDef);
 extern PyMethodDef ExtraMethods[];
 static PyMethodDef* Methods;
 
@@ -51,9 +56,9 @@ initFunc(void)
         n++;
     }
     n++;
-    Methods = (PyMethodDef*) malloc(sizeof(PyMethodDef)*(1+n));
-    memcpy(Methods, StaticMethods, sizeof(PyMethodDef)*1);
-    memcpy(Methods + 1, ExtraMethods, sizeof(PyMethodDef)*n);
+    Methods = (PyMethodDef*) malloc(sizeof(PyMethodDef)*(nStaticMethods+n));
+    memcpy(Methods, StaticMethods, sizeof(PyMethodDef)*nStaticMethods);
+    memcpy(Methods + nStaticMethods, ExtraMethods, sizeof(PyMethodDef)*n);
 
     #ifdef PY3
         static struct PyModuleDef moduledef = {
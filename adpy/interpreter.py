@@ -0,0 +1,182 @@
+import operator
+import numpy as np
+
+from . import config
+from .scalar import *
+from .variable import Variable, TensorFunctionOp, graphTopologicalSort
+
+# evaluates Function graphs with numpy instead of compiled code, every
+# scalar op of a kernel is one array operation over the n iterations.
+# used when config.compile is False
+
+# arrays that persist across calls, static variables, tapes and the
+# reusable outputs read by the next call, by id
+_shared = {}
+
+def _dtype(dtype):
+    if dtype == 'integer':
+        return np.int32
+    return config.precision
+
+def _binary(op, a, b):
+    if op.op is operator.truediv and np.asarray(a).dtype.kind == 'i' and np.asarray(b).dtype.kind == 'i':
+        # C integer division truncates
+        return np.fix(np.true_divide(a, b)).astype(np.int32)
+    elif op.op is operator.lt:
+        return np.less(a, b).astype(np.int32)
+    elif op.op is operator.pow:
+        return np.power(np.asarray(a, dtype=config.precision), b)
+    return op.op(a, b)
+
+def _unary(op, a):
+    if op.op is SQRT:
+        return np.sqrt(a)
+    elif op.op is operator.invert:
+        return np.equal(a, 0).astype(np.int32)
+    elif op.op is operator.abs:
+        return np.abs(a)
+    return op.op(a)
+
+def runKernel(func, n, inputs, outputs):
+    """Run the kernel of a TensorFunction over n iterations, inputs and
+    outputs are arrays of the rows of its tensors starting at the
+    indexed row, outputs are updated in place"""
+    inputs = dict([(tensor.name, x.reshape(x.shape[0], -1)) for tensor, x in zip(func._inputTensors, inputs)])
+    outputs = dict([(tensor.name, x.reshape(x.shape[0], -1)) for tensor, x in zip(func._outputTensors, outputs) if x is not None])
+    values = {}
+    for op in func._sortedOps:
+        if isinstance(op, (Scalar, IntegerScalar)) and not isinstance(op, OpBase):
+            name, size, index, cellTensor = func._inputTensorIndices[op]
+            # cell tensors are only read through Extract and Singular
+            if isinstance(op, IntegerScalar) or not cellTensor:
+                values[op] = inputs[name][:n, index]
+            continue
+        elif isinstance(op, ConstantOp):
+            value = op.constant
+        elif isinstance(op, IndexOp):
+            value = np.arange(0, n, dtype=np.int32)
+        elif isinstance(op, Extract):
+            a, b = op.args
+            name, size, index, _ = func._inputTensorIndices[a]
+            value = inputs[name][values[b], index]
+        elif isinstance(op, Singular):
+            a, = op.args
+            name, size, index, _ = func._inputTensorIndices[a]
+            value = inputs[name][0, index]
+        elif isinstance(op, Collate):
+            for name, size, index, _ in func._outputTensorIndices[op]:
+                for a, b in zip(op.args[::2], op.args[1::2]):
+                    np.add.at(outputs[name][:, index], values[b], np.broadcast_to(values[a], (n,)))
+            continue
+        elif isinstance(op, Reduce):
+            a, = op.args
+            x = np.broadcast_to(values[a], (n,))
+            if n == 0:
+                continue
+            for name, size, index, _ in func._outputTensorIndices[op]:
+                out = outputs[name]
+                if op.opType == 'sum':
+                    out[0, index] += x.sum()
+                elif op.opType == 'max':
+                    out[0, index] = max(x.max(), out[0, index])
+                else:
+                    out[0, index] = min(x.min(), out[0, index])
+            continue
+        elif isinstance(op, BinaryOp):
+            value = _binary(op, values[op.args[0]], values[op.args[1]])
+        elif isinstance(op, UnaryOp):
+            value = _unary(op, values[op.args[0]])
+        elif isinstance(op, ConditionalOp):
+            cond, a, b = [values[x] for x in op.args]
+            value = np.where(cond, a, b)
+        else:
+            raise Exception('op not recognised', op)
+        values[op] = value
+        for name, size, index, cellTensor in func._outputTensorIndices.get(op, []):
+            if not cellTensor:
+                outputs[name][:n, index] += value
+
+def run(function, args, options):
+    """Call a Function, args and options as for the compiled module"""
+    assert len(args) == len(function._inputs)
+    arrays = {}
+    integers = {}
+    for index, (inp, arg) in enumerate(zip(function._inputs, args)):
+        key = ('reuse', function.module.index, function._reuseId(index))
+        if isinstance(inp, IntegerScalar):
+            integers[inp.name] = int(arg)
+        elif index in function._io_map and key in _shared and not options['replace_reusable']:
+            # the output of the last call, as in the compiled code
+            arrays[inp.name] = _shared[key]
+        elif inp.static:
+            # written in place, not through a copy
+            x = np.asarray(arg)
+            name = '{}:{}'.format(function.name, index)
+            if x.dtype != _dtype(inp.dtype):
+                raise TypeError("{}: written input of dtype '{}', expected '{}'".format(name, x.dtype.char, np.dtype(_dtype(inp.dtype)).char))
+            if not x.flags.c_contiguous:
+                raise ValueError('{}: written input is not a C contiguous array'.format(name))
+            arrays[inp.name] = x
+        else:
+            arrays[inp.name] = np.array(arg, dtype=_dtype(inp.dtype))
+
+    def value(x):
+        if isinstance(x, int):
+            return x
+        return integers[x.name]
+
+    def array(var):
+        if var.name not in arrays:
+            shape = (value(var.shape[0]),) + var.shape[1:]
+            if var.name in function._tape or var.name in function._leaves:
+                # tapes persist across calls, the forward function refills them
+                key = ('tape', var.name)
+                if key not in _shared or _shared[key].shape != shape:
+                    _shared[key] = np.zeros(shape, _dtype(var.dtype))
+                if var.name in function._tape:
+                    _shared[key][:] = 0
+                arrays[var.name] = _shared[key]
+            elif var.static:
+                key = ('static', var.name)
+                if key not in _shared:
+                    _shared[key] = np.zeros(shape, _dtype(var.dtype))
+                arrays[var.name] = _shared[key]
+            else:
+                arrays[var.name] = np.zeros(shape, _dtype(var.dtype))
+        return arrays[var.name]
+
+    outputs = [x for x in function._outputs if x is not None]
+    sortedOps = graphTopologicalSort(outputs, function._children.copy(), function._leaves)
+    for op in sortedOps:
+        if isinstance(op, TensorFunctionOp):
+            func = op.func
+            n = value(op.indices)
+            m = len(op.outputs)
+            kernelArgs = []
+            for arg in op.args:
+                kernelArgs.append(array(arg)[value(arg.index):])
+            runKernel(func, n, kernelArgs[:-m], kernelArgs[-m:])
+        elif isinstance(op, Variable):
+            continue
+        else:
+            raise Exception('interpreter does not run', op.name)
+
+    results = []
+    for index, out in enumerate(function._outputs):
+        if out is None:
+            results.append(None)
+            continue
+        x = array(out)
+        if out.static:
+            results.append(x.copy() if options['return_static'] else None)
+            if options['zero_static']:
+                x[:] = 0
+        elif index in function._io_map.values():
+            key = list(function._io_map.keys())[list(function._io_map.values()).index(index)]
+            _shared[('reuse', function.module.index, function._reuseId(key))] = x
+            results.append(x.copy() if options['return_reusable'] else None)
+        else:
+            results.append(x.copy())
+    if len(results) == 1:
+        return results[0]
+    return tuple(results)
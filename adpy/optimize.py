@@ -0,0 +1,209 @@
+import math
+import operator
+
+from .scalar import *
+from .variable import graphGetChildren, graphTopologicalSort
+
+# rewrites on the scalar graph of a kernel before code generation. nodes
+# are rebuilt bottom up through the hash consing constructors of OpBase,
+# so with commutative operands put in a canonical order, structurally
+# equal expressions collapse to the same node (CSE). the algebraic
+# identities assume finite values, x*0 and x-x fold to 0 like they would
+# under -ffast-math
+
+def _isConstant(x, value=None):
+    if not isinstance(x, ConstantOp):
+        return False
+    return value is None or x.constant == value
+
+def _fold(op, a, b):
+    x, y = a.constant, b.constant
+    if op is operator.truediv:
+        # C integer division truncates, leave it to the compiler
+        if isinstance(x, int) and isinstance(y, int):
+            return None
+        if y == 0:
+            return None
+    if op is operator.pow:
+        if x == 0 and y < 0:
+            return None
+        # pow returns a double
+        return ConstantOp(float(x)**y)
+    if op is operator.lt:
+        return ConstantOp(int(x < y))
+    return ConstantOp(op(x, y))
+
+def rebuild(op, args):
+    if isinstance(op, BinaryOp):
+        return type(op)(op.op, args[0], args[1], op.comparison)
+    elif isinstance(op, UnaryOp):
+        return type(op)(op.op, args[0])
+    elif isinstance(op, Reduce):
+        return Reduce(op.opType, args[0])
+    return type(op)(*args)
+
+class Simplifier(object):
+    def __init__(self):
+        self.rank = {}
+        self.replace = {}
+
+    def _rank(self, x):
+        if x not in self.rank:
+            self.rank[x] = len(self.rank)
+        return self.rank[x]
+
+    def binary(self, op, a, b):
+        cls = binaryOpClass[op]
+        if cls in [AddOp, MulOp] and self._rank(b) < self._rank(a):
+            a, b = b, a
+        return cls(op, a, b, op is operator.lt)
+
+    def unary(self, op, a):
+        return unaryOpClass[op](op, a)
+
+    def neg(self, a):
+        if isinstance(a, NegOp):
+            return a.args[0]
+        if _isConstant(a):
+            return ConstantOp(-a.constant)
+        return self.unary(operator.neg, a)
+
+    def simplifyBinary(self, op, a, b):
+        if _isConstant(a) and _isConstant(b):
+            folded = _fold(op.op, a, b)
+            if folded is not None:
+                return folded
+        if isinstance(op, AddOp):
+            if _isConstant(a, 0):
+                return b
+            if _isConstant(b, 0):
+                return a
+            if isinstance(b, NegOp):
+                return self.binary(operator.sub, a, b.args[0])
+            if isinstance(a, NegOp):
+                return self.binary(operator.sub, b, a.args[0])
+        elif isinstance(op, SubOp):
+            if a is b:
+                return ConstantOp(0.)
+            if _isConstant(b, 0):
+                return a
+            if _isConstant(a, 0):
+                return self.neg(b)
+            if isinstance(b, NegOp):
+                return self.binary(operator.add, a, b.args[0])
+            if isinstance(a, NegOp):
+                return self.neg(self.binary(operator.add, a.args[0], b))
+        elif isinstance(op, MulOp):
+            if _isConstant(a, 0) or _isConstant(b, 0):
+                return ConstantOp(0.)
+            if _isConstant(a, 1):
+                return b
+            if _isConstant(b, 1):
+                return a
+            if _isConstant(a, -1):
+                return self.neg(b)
+            if _isConstant(b, -1):
+                return self.neg(a)
+            if isinstance(a, NegOp) and isinstance(b, NegOp):
+                return self.binary(operator.mul, a.args[0], b.args[0])
+            if isinstance(a, NegOp):
+                return self.neg(self.binary(operator.mul, a.args[0], b))
+            if isinstance(b, NegOp):
+                return self.neg(self.binary(operator.mul, a, b.args[0]))
+        elif isinstance(op, DivOp):
+            if _isConstant(a, 0):
+                return ConstantOp(0.)
+            if _isConstant(b, 1):
+                return a
+            if _isConstant(b, -1):
+                return self.neg(a)
+            if isinstance(a, NegOp) and isinstance(b, NegOp):
+                return self.binary(operator.truediv, a.args[0], b.args[0])
+            if isinstance(a, NegOp):
+                return self.neg(self.binary(operator.truediv, a.args[0], b))
+            if isinstance(b, NegOp):
+                return self.neg(self.binary(operator.truediv, a, b.args[0]))
+        elif isinstance(op, PowerOp):
+            if _isConstant(b, 1):
+                return a
+            if _isConstant(b, 0):
+                return ConstantOp(1.)
+        return self.binary(op.op, a, b)
+
+    def simplifyUnary(self, op, a):
+        if isinstance(op, NegOp):
+            return self.neg(a)
+        elif isinstance(op, InvertOp):
+            if isinstance(a, InvertOp):
+                return a.args[0]
+            if _isConstant(a):
+                return ConstantOp(int(not a.constant))
+        elif isinstance(op, AbsOp):
+            if isinstance(a, NegOp):
+                a = a.args[0]
+            if isinstance(a, AbsOp):
+                return a
+            if _isConstant(a):
+                return ConstantOp(abs(a.constant))
+        elif isinstance(op, SqrtOp):
+            if _isConstant(a) and a.constant >= 0:
+                return ConstantOp(math.sqrt(a.constant))
+        return self.unary(op.op, a)
+
+    def simplifyConditional(self, cond, a, b):
+        if a is b:
+            return a
+        if _isConstant(cond):
+            return a if cond.constant else b
+        if isinstance(cond, InvertOp):
+            return ConditionalOp(cond.args[0], b, a)
+        return ConditionalOp(cond, a, b)
+
+    def simplifyCollate(self, args):
+        # scattering zeros leaves the output unchanged
+        pairs = []
+        for a, b in zip(args[::2], args[1::2]):
+            if not _isConstant(a, 0):
+                pairs.extend([a, b])
+        if len(pairs) == 0:
+            return ConstantOp(0.)
+        return Collate(*pairs)
+
+    def simplify(self, op):
+        args = tuple([self.replace.get(x, x) for x in op.args])
+        if not isinstance(op, OpBase) or len(args) == 0:
+            new = op
+        elif isinstance(op, BinaryOp):
+            new = self.simplifyBinary(op, *args)
+        elif isinstance(op, UnaryOp):
+            new = self.simplifyUnary(op, *args)
+        elif isinstance(op, ConditionalOp):
+            new = self.simplifyConditional(*args)
+        elif isinstance(op, Collate):
+            new = self.simplifyCollate(args)
+        elif isinstance(op, Reduce) and op.opType == 'sum' and _isConstant(args[0], 0):
+            new = args[0]
+        else:
+            new = rebuild(op, args)
+        self._rank(new)
+        self.replace[op] = new
+        return new
+
+def simplify(sortedOps):
+    """Simplify the scalar graph given by its topologically sorted ops,
+    returns a map from every op to its replacement"""
+    simplifier = Simplifier()
+    for op in sortedOps:
+        simplifier.simplify(op)
+    return simplifier.replace
+
+def substitute(outputs, replace):
+    """Rebuild the graph of outputs with the scalars in replace
+    substituted, None outputs are kept"""
+    roots = [x for x in outputs if x is not None]
+    children, _ = graphGetChildren(roots)
+    new = dict(replace)
+    for op in graphTopologicalSort(roots, children):
+        if op not in new:
+            new[op] = rebuild(op, [new.get(x, x) for x in op.args]) if len(op.args) > 0 else op
+    return [None if x is None else new[x] for x in outputs]
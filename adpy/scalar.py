@@ -3,15 +3,30 @@ import numbers
 dtype = 'scalar'
 
 import functools
+# without a 1 or 0 to start from, which would add a node
 def prod(factors):
-    return functools.reduce(operator.mul, factors, 1)
+    return functools.reduce(operator.mul, factors)
+
+def total(terms):
+    return functools.reduce(operator.add, terms)
 
 class Container(object):
     pass
 
+def _sumTangents(tangents):
+    # None is a zero tangent
+    tangents = [x for x in tangents if x is not None]
+    if len(tangents) == 0:
+        return None
+    return total(tangents)
+
 SQRT = 123412341234
 
+# graphs of kernels have millions of nodes, the nodes have slots
+# instead of a dict
 class ArithBase(object):
+    __slots__ = ()
+
     def _binaryOp(self, b, op):
         raise NotImplementedError(self, b, op)
 
@@ -61,6 +76,7 @@ class ArithBase(object):
         return self._unaryOp(SQRT)
 
 class IntegerScalar(ArithBase):
+    __slots__ = ('name', 'args', 'dtype')
     _index = 0
     def __init__(self):
         index = IntegerScalar._index
@@ -74,6 +90,7 @@ class IntegerScalar(ArithBase):
     #    return binaryOpClass[op](op, self, b, comparison)
 
 class Scalar(ArithBase):
+    __slots__ = ('name', 'args', 'dtype')
     _index = 0
     def __new__(cls, *args, **kwargs):
         return object.__new__(cls)
@@ -94,15 +111,15 @@ class Scalar(ArithBase):
         return unaryOpClass[op](op, self)
 
 class OpBase(Scalar):
+    __slots__ = ()
     _cache = {}
     def __new__(cls, *args, **kwargs):
         assert len(kwargs) == 0
-        #key = (cls,) + args
-        key = (cls,) + args + tuple([type(x) for x in args])
-        if key in OpBase._cache:
-            obj = OpBase._cache[key]
-        else:
-            obj = Scalar.__new__(cls, *args, **kwargs)
+        # args are nodes, hashed by identity, or op and flags
+        key = (cls,) + args
+        obj = OpBase._cache.get(key)
+        if obj is None:
+            obj = object.__new__(cls)
             OpBase._cache[key] = obj
         return obj
 
@@ -116,7 +133,21 @@ class OpBase(Scalar):
     def grad(self, gradient):
         raise NotImplementedError(self)
 
+    def tangent(self, tangents):
+        # tangents of the args, None if zero, at least one is not
+        raise NotImplementedError(self)
+
 class ConstantOp(OpBase):
+    __slots__ = ('constant',)
+    def __new__(cls, constant):
+        # 1 and 1. are equal keys
+        key = (cls, constant, type(constant))
+        obj = OpBase._cache.get(key)
+        if obj is None:
+            obj = object.__new__(cls)
+            OpBase._cache[key] = obj
+        return obj
+
     def __init__(self, constant):
         assert isinstance(constant, float) or isinstance(constant, int)
         self.constant = constant
@@ -130,8 +161,12 @@ class ConstantOp(OpBase):
 
     def grad(self, gradient):
         return []
+
+    def tangent(self, tangents):
+        return None
         
 class IndexOp(OpBase):
+    __slots__ = ()
     def __init__(self):
         self.args = tuple()
         self.dtype = 'integer'
@@ -139,7 +174,11 @@ class IndexOp(OpBase):
     def c_code(self, names):
         return '{} {} = i;'.format(self.dtype, names[self])
 
+    def tangent(self, tangents):
+        return None
+
 class BinaryOp(OpBase):
+    __slots__ = ('op', 'comparison')
     def __init__(self, op, a, b, comparison=False):
         #print(type(a), type(b))
         assert isinstance(a, Scalar)
@@ -155,17 +194,27 @@ class BinaryOp(OpBase):
         return '{} {} = {};'.format(typeString, names[self], op.join(argNames))
 
 class AddOp(BinaryOp):
+    __slots__ = ()
     def grad(self, gradient):
         grads = []
         for inp in self.args:
             grads.append(gradient)
         return grads
 
+    def tangent(self, tangents):
+        return _sumTangents(tangents)
+
 class SubOp(BinaryOp):
+    __slots__ = ()
     def grad(self, gradient):
         return [gradient, -gradient]
 
+    def tangent(self, tangents):
+        ta, tb = tangents
+        return _sumTangents([ta, None if tb is None else -tb])
+
 class MulOp(BinaryOp):
+    __slots__ = ()
     def grad(self, gradient):
         grads = []
         for index, inp in enumerate(self.args):
@@ -173,16 +222,30 @@ class MulOp(BinaryOp):
             grads.append(prod(factors))
         return grads
 
+    def tangent(self, tangents):
+        a, b = self.args
+        ta, tb = tangents
+        return _sumTangents([None if ta is None else ta*b, None if tb is None else a*tb])
+
 class DivOp(BinaryOp):
+    __slots__ = ()
     def grad(self, gradient):
         x, y = self.args
         z = gradient
         return [z/y, -(z*x)/(y*y)]
 
+    def tangent(self, tangents):
+        x, y = self.args
+        tx, ty = tangents
+        return _sumTangents([tx, None if ty is None else -self*ty])/y
+
 class LessThanOp(BinaryOp):
-    pass
+    __slots__ = ()
+    def tangent(self, tangents):
+        return None
 
 class PowerOp(BinaryOp):
+    __slots__ = ()
     def c_code(self, names):
         argNames = [names[inp] for inp in self.args]
         return '{} {} = pow({}, {});'.format(dtype, names[self], argNames[0], argNames[1]);
@@ -191,7 +254,15 @@ class PowerOp(BinaryOp):
         x, n = self.args
         return [gradient*n*x**(n-1), None]
 
+    def tangent(self, tangents):
+        x, n = self.args
+        tx, tn = tangents
+        if tx is None:
+            return None
+        return tx*n*x**(n-1)
+
 class UnaryOp(OpBase):
+    __slots__ = ('op',)
     def __init__(self, op, a):
         self.op = op
         assert isinstance(a, Scalar)
@@ -203,21 +274,36 @@ class UnaryOp(OpBase):
         return '{} {} = {}({});'.format(dtype, names[self], op, argNames[0]);
 
 class NegOp(UnaryOp):
+    __slots__ = ()
     def grad(self, gradient):
         return [-gradient]
 
+    def tangent(self, tangents):
+        return -tangents[0]
+
 class AbsOp(UnaryOp):
+    __slots__ = ()
     def grad(self, gradient):
         x = self.args[0]
         return [ConditionalOp(x < 0, -gradient, gradient)]
 
+    def tangent(self, tangents):
+        x, t = self.args[0], tangents[0]
+        return ConditionalOp(x < 0, -t, t)
+
 class SqrtOp(UnaryOp):
+    __slots__ = ()
     def grad(self, gradient):
         x = self.args[0]
         return [gradient/(2*self)]
 
+    def tangent(self, tangents):
+        return tangents[0]/(2*self)
+
 class InvertOp(UnaryOp):
-    pass
+    __slots__ = ()
+    def tangent(self, tangents):
+        return None
 
 unaryOpClass = {operator.abs: AbsOp,
                 operator.neg: NegOp,
@@ -243,6 +329,7 @@ binaryOpClass = {operator.truediv: DivOp,
                   operator.pow: PowerOp}
 
 class ConditionalOp(OpBase):
+    __slots__ = ()
     def __init__(self, cond, a, b):
         self.args = (cond, a, b)
         assert isinstance(cond, Scalar)
@@ -268,7 +355,14 @@ class ConditionalOp(OpBase):
         grads.append(ConditionalOp(~cond, gradient, zero))
         return grads
 
+    def tangent(self, tangents):
+        cond, x1, x2 = self.args
+        _, t1, t2 = tangents
+        zero = ConstantOp(0.)
+        return ConditionalOp(cond, zero if t1 is None else t1, zero if t2 is None else t2)
+
 class Extract(OpBase):
+    __slots__ = ()
     def __init__(self, *args):
         self.args = tuple(args)
         x, b = args
@@ -278,8 +372,13 @@ class Extract(OpBase):
     def grad(self, gradient):
         x, b = self.args        
         return [Collate(gradient, b), None]
+
+    def tangent(self, tangents):
+        x, b = self.args
+        return Extract(tangents[0], b)
         
 class Collate(OpBase):
+    __slots__ = ()
     def __init__(self, *args):
         self.args = tuple(args)
         n = len(self.args)//2
@@ -297,7 +396,15 @@ class Collate(OpBase):
             grads.append(None)
         return grads
 
+    def tangent(self, tangents):
+        args = []
+        for t, b in zip(tangents[::2], self.args[1::2]):
+            if t is not None:
+                args.extend([t, b])
+        return Collate(*args)
+
 class Reduce(OpBase):
+    __slots__ = ('opType',)
     def __init__(self, opType, x):
         assert isinstance(x, Scalar)
         self.opType = opType
@@ -310,7 +417,15 @@ class Reduce(OpBase):
         else:
             return [None]
 
+    def tangent(self, tangents):
+        # max and min are not differentiated, as in grad
+        if self.opType == 'sum':
+            return Reduce('sum', tangents[0])
+        else:
+            return None
+
 class Singular(OpBase):
+    __slots__ = ()
     def __init__(self, x):
         assert isinstance(x, Scalar)
         self.args = (x,)
@@ -318,3 +433,6 @@ class Singular(OpBase):
     def grad(self, gradient):
         x, = self.args
         return [Reduce('sum', gradient)]
+
+    def tangent(self, tangents):
+        return Singular(tangents[0])
@@ -2,11 +2,15 @@ import numpy as np
 #class Variable:
 #    pass
 import operator
+import hashlib
 import numbers
+import gc
+import contextlib
 
 from . import config
 from .scalar import *
 from .variable import *
+from .optimize import simplify, substitute
 
 
 class Tensor(ArithBase):
@@ -17,8 +21,13 @@ class Tensor(ArithBase):
         Tensor._index += 1
         self.name = 'Tensor_{}'.format(index)
         self.shape = shape
-        self.size = np.prod(shape)
-        self.strides = [x//8 for x in np.zeros(shape, np.float64).strides]
+        # row major strides in elements
+        self.strides = []
+        size = 1
+        for x in shape[::-1]:
+            self.strides.insert(0, size)
+            size *= x
+        self.size = size
         #print('tensor', shape, scalars)
         if scalars is None:
             self.scalars = []
@@ -95,7 +104,7 @@ class Tensor(ArithBase):
 
     def dot(self, b):
         assert self.shape == b.shape
-        res = sum([self.scalars[i]*b.scalars[i] for i in range(0, self.size)])
+        res = total([self.scalars[i]*b.scalars[i] for i in range(0, self.size)])
         return Tensor((1,), [res])
 
     
@@ -119,9 +128,7 @@ class Tensor(ArithBase):
 
     def trace(self):
         n = self._checkMatrix()
-        res = 0.
-        for i in range(0, n):
-            res += self.scalars[i*n + i]
+        res = total([self.scalars[i*n + i] for i in range(0, n)])
         return Tensor((1,), [res])
 
     def transpose(self):
@@ -137,7 +144,7 @@ class Tensor(ArithBase):
         assert b.shape == (n,)
         res = []
         for i in range(0, n):
-            res.append(sum([self.scalars[i*n + j]*b.scalars[j] for j in range(0, n)]))
+            res.append(total([self.scalars[i*n + j]*b.scalars[j] for j in range(0, n)]))
         return Tensor((n,), res)
 
     def matmul(self, b):
@@ -150,7 +157,7 @@ class Tensor(ArithBase):
             b = b.flatten()
         for i in range(0, n):
             for j in range(0, n):
-                res.append(sum(self.scalars[i*n + k]*b[k*n + j] for k in range(0, n)))
+                res.append(total([self.scalars[i*n + k]*b[k*n + j] for k in range(0, n)]))
         return Tensor(self.shape, res)
 
     # reduction
@@ -218,12 +225,30 @@ class Tensor(ArithBase):
     def min(cls, x1, x2):
         return Tensor.switch(x1 < x2, x1, x2)
 
+@contextlib.contextmanager
+def noCollection():
+    # scalar graphs have no reference cycles, the collector would only
+    # traverse the millions of nodes they are made of. only around the
+    # graph walks and code generation of adpy, not user code
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
 class TensorFunction(object):
     _index = 0
 
-    def __init__(self, name, inputs, outputs, grad=True):
-        if not Function._init:
-            Function.reset()
+    def __init__(self, name, inputs, outputs, grad=True, scatter=None):
+        with noCollection():
+            self._init(name, inputs, outputs, grad, scatter)
+
+    def _init(self, name, inputs, outputs, grad, scatter):
+        # the module its code is generated into
+        self.module = Module.get()
+        self._scatterOption = scatter
 
         index = TensorFunction._index
         TensorFunction._index += 1
@@ -238,27 +263,110 @@ class TensorFunction(object):
             self._inputs.extend(inp.scalars)
             for index, i in enumerate(inp.scalars):
                 self._inputTensorIndices[i] = (inp.name, len(inp.scalars), index, inp.cellTensor)
-        self._outputTensorIndices = {}
         self._outputTensors = outputs
         self._outputs = []
         for out in outputs:
             self._outputs.extend(out.scalars)
-            for index, i in enumerate(out.scalars):
-                self._outputTensorIndices[i] = (out.name, len(out.scalars), index, out.cellTensor)
         #self.func = lambdify(self._inputs, self._outputs)
 
         _outputs = [x for x in self._outputs if x is not None]
         self._children, _ = graphGetChildren(_outputs)
-        self._inputsUsed = [inp.scalars[0] in self._children for inp in self._inputTensors]
+        self._outputTensorIndices, outputs = self._indexOutputs(self._outputs)
+        if len(outputs) == len(_outputs):
+            children = self._children.copy()
+        else:
+            children, _ = graphGetChildren(outputs)
 
         self._loads = 0
         self._stores = 0
         self._flops = 0
-        self._genCode(self._inputs, _outputs, self._children.copy())
+        self._ops = 0
+        self._opsRemoved = 0
+        self._vectorized = False
+        self._genCode(self._inputs, outputs, children)
+        self.module.kernels[self.name] = self
         OpBase.clear_cache()
+        # tangent kernels by the inputs they differentiate, see getTangent
+        self._tangents = {}
         if grad:
             self.grad = self._getAdjoint()
 
+    def _indexOutputs(self, scalars):
+        # an op can be stored to more than one output after simplification,
+        # None and zero components are not stored as outputs accumulate
+        indices = {}
+        outputs = []
+        i = 0
+        for out in self._outputTensors:
+            for index in range(0, out.size):
+                op = scalars[i]
+                i += 1
+                if op is None or (isinstance(op, ConstantOp) and op.constant == 0):
+                    continue
+                if op not in indices:
+                    indices[op] = []
+                    outputs.append(op)
+                indices[op].append((out.name, out.size, index, out.cellTensor))
+        return indices, outputs
+
+    def _simplify(self, sortedOps):
+        replace = simplify(sortedOps)
+        scalars = []
+        for op in self._outputs:
+            new = replace.get(op, op)
+            # cell tensor inputs are not loaded, cannot be stored directly
+            if new is None:
+                pass
+            elif not isinstance(new, OpBase) and self._inputTensorIndices[new][3]:
+                new = op
+            # scatters and reductions write to a single cell tensor
+            elif isinstance(new, (Collate, Reduce)) and new in scalars:
+                new = op
+            scalars.append(new)
+        self._outputTensorIndices, outputs = self._indexOutputs(scalars)
+        children, _ = graphGetChildren(outputs)
+        newOps = graphTopologicalSort(outputs, children)
+        self._opsRemoved = len(sortedOps) - len(newOps)
+        return newOps
+
+    def fuse(self, func, intermediates, dropped):
+        """Fuse with func, a kernel that reads outputs of this one at the
+        same index. intermediates maps input indices of func to the
+        output indices of this kernel they are read from, the fused
+        kernel takes the other inputs of both and the outputs of both
+        except the dropped ones"""
+        # fresh tensors for the consumer, the same kernel can be on both sides
+        replace = {}
+        inputs = list(self._inputTensors)
+        for index, inp in enumerate(func._inputTensors):
+            if index in intermediates:
+                out = self._outputTensors[intermediates[index]]
+                # outputs start from zero
+                scalars = [ConstantOp(0.) if x is None else x for x in out.scalars]
+            else:
+                if inp.dtype == 'integer':
+                    new = Tensor(inp.shape, [IntegerScalar() for x in inp.scalars])
+                else:
+                    new = Tensor(inp.shape)
+                new.cellTensor = inp.cellTensor
+                inputs.append(new)
+                scalars = new.scalars
+            for x, y in zip(inp.scalars, scalars):
+                replace[x] = y
+        outputs = [out for index, out in enumerate(self._outputTensors) if index not in dropped]
+        for out in func._outputTensors:
+            new = Tensor(out.shape, substitute(out.scalars, replace))
+            new.cellTensor = out.cellTensor
+            new.dtype = out.dtype
+            outputs.append(new)
+        scatter = self._scatterOption or func._scatterOption
+        # the same pair can be fused dropping different outputs
+        name = 'fused_' + kernelDigest(inputs, outputs, scatter)
+        kernels = Module.get().kernels
+        if 'Function_' + name in kernels:
+            return kernels['Function_' + name]
+        return TensorFunction(name, inputs, outputs, grad=False, scatter=scatter)
+
     def _getAdjoint(self):
         gradOutputs = []
         for out in self._outputTensors:
@@ -286,16 +394,61 @@ class TensorFunction(object):
         inputs = self._inputTensors + gradOutputs
         loc = self.name.find('_')
         name = self.name[loc+1:] + '_grad'
-        return TensorFunction(name, inputs, outputs, grad=False)
+        return TensorFunction(name, inputs, outputs, grad=False, scatter=self._scatterOption)
+
+
+    def getTangent(self, active):
+        """Kernel computing the outputs and their tangents in one pass,
+        it takes the tangents of the input tensors flagged in active as
+        extra inputs and returns the tangents of the scalar outputs after
+        the outputs"""
+        active = tuple(active)
+        if active in self._tangents:
+            return self._tangents[active]
+        assert len(active) == len(self._inputTensors)
+        tangents = {}
+        tangentInputs = []
+        for inp, x in zip(self._inputTensors, active):
+            if not x:
+                continue
+            assert inp.dtype == dtype
+            tangent = Tensor(inp.shape)
+            tangent.cellTensor = inp.cellTensor
+            tangentInputs.append(tangent)
+            for i, j in zip(inp.scalars, tangent.scalars):
+                tangents[i] = j
+        _outputs = [x for x in self._outputs if x is not None]
+        children, _ = graphGetChildren(_outputs)
+        for op in graphTopologicalSort(_outputs, children):
+            if not isinstance(op, OpBase):
+                continue
+            argTangents = [tangents.get(x, None) for x in op.args]
+            if any([x is not None for x in argTangents]):
+                tangents[op] = op.tangent(argTangents)
+        tangentOutputs = []
+        for out in self._outputTensors:
+            if out.dtype != dtype:
+                continue
+            tangent = Tensor(out.shape, [tangents.get(x, None) for x in out.scalars])
+            tangent.cellTensor = out.cellTensor
+            tangent.dtype = out.dtype
+            tangentOutputs.append(tangent)
+        inputs = list(self._inputTensors) + tangentInputs
+        outputs = list(self._outputTensors) + tangentOutputs
+        loc = self.name.find('_')
+        name = self.name[loc+1:] + '_tangent'
+        if not all([x for x, inp in zip(active, self._inputTensors) if inp.dtype == dtype]):
+            name += '_' + ''.join([str(int(x)) for x in active])
+        self._tangents[active] = TensorFunction(name, inputs, outputs, grad=False, scatter=self._scatterOption)
+        return self._tangents[active]
 
-    
     def _diff(self, outputs, inputs, gradients=None):
         if gradients is None:
             gradients = {}
             for out in outputs:
                 gradients[out] = 1.
         children = self._children.copy()
-        def _diffFunc(out):
+        def _gradArgs(out):
             assert children[out] == 0
             grads = []
             if gradients[out] == None:
@@ -303,51 +456,203 @@ class TensorFunction(object):
             elif isinstance(out, OpBase):
                 grads = out.grad(gradients[out])
             assert len(grads) == len(out.args)
-            for grad, inp in zip(grads, out.args):
-                if inp not in gradients or gradients[inp] is None:
-                    gradients[inp] = grad
-                elif grad is not None:
-                    # combining collates
-                    if isinstance(gradients[inp], Collate):
-                        args = gradients[inp].args + grad.args
-                        gradients[inp] = Collate(*args)
-                    else:
-                        gradients[inp] += grad
-                children[inp] -= 1
-                if children[inp] == 0:
-                    _diffFunc(inp)
+            return iter(list(zip(grads, out.args)))
         for out in outputs:
-            if children[out] == 0:
-                _diffFunc(out)
+            if children[out] != 0:
+                continue
+            # explicit stack instead of recursion, deep accumulation
+            # chains would otherwise exceed the recursion limit
+            stack = [_gradArgs(out)]
+            while len(stack) > 0:
+                for grad, inp in stack[-1]:
+                    if inp not in gradients or gradients[inp] is None:
+                        gradients[inp] = grad
+                    elif grad is not None:
+                        # combining collates
+                        if isinstance(gradients[inp], Collate):
+                            args = gradients[inp].args + grad.args
+                            gradients[inp] = Collate(*args)
+                        else:
+                            gradients[inp] += grad
+                    children[inp] -= 1
+                    if children[inp] == 0:
+                        stack.append(_gradArgs(inp))
+                        break
+                else:
+                    stack.pop()
         return [gradients.get(inp, None) for inp in inputs]
 
+    def _setScatter(self, sortedOps):
+        # how the iterations of a parallel loop scatter to the same rows:
+        # 'atomic' updates, 'private' per thread copies of the outputs
+        # summed after the loop, or 'color' running the loop once per
+        # color of iterations that write distinct rows. the last two
+        # give results independent of timing, coloring also of the
+        # number of threads
+        self._scatter = None
+        self._scatterIndices = []
+        self._scatterOutputs = []
+        collates = [op for op in sortedOps if isinstance(op, Collate)]
+        if len(collates) == 0 or not config.openmp or config.gpu:
+            return
+        self._scatter = self._scatterOption or config.scatter
+        assert self._scatter in ['atomic', 'private', 'color']
+        # reproducible reductions run in blocks of iterations, not colors
+        if self._scatter == 'color' and config.reproducible and any([isinstance(op, Reduce) for op in sortedOps]):
+            self._scatter = 'private'
+        names = [inp.name for inp in self._inputTensors]
+        outNames = [out.name for out in self._outputTensors]
+        for op in collates:
+            for tensorIndex in self._outputTensorIndices[op]:
+                index = outNames.index(tensorIndex[0])
+                if index not in self._scatterOutputs:
+                    self._scatterOutputs.append(index)
+            for b in op.args[1::2]:
+                # rows are colored from the index arrays, computed
+                # indices are left to atomics
+                if isinstance(b, OpBase) or b not in self._inputTensorIndices:
+                    if self._scatter == 'color':
+                        self._scatter = 'atomic'
+                    continue
+                name, size, component, _ = self._inputTensorIndices[b]
+                key = (names.index(name), size, component)
+                if key not in self._scatterIndices:
+                    self._scatterIndices.append(key)
+
+    def _genLoop(self, codeFile, body, accumulators, sortedOps):
+        # CPU loop around the body. reductions accumulate into locals,
+        # with openmp or simd they are reduction variables, reproducible
+        # reductions instead sum fixed blocks of iterations whose partial
+        # results are combined pairwise
+        codeFile.write('\tinteger i;\n')
+        initial = {'sum': '0', 'max': 'numeric_limits<{0}>::lowest()', 'min': 'numeric_limits<{0}>::max()'}
+        combine = {'sum': 'a + b', 'max': 'max(a, b)', 'min': 'min(a, b)'}
+        clauses = ''.join([' reduction({}:{})'.format('+' if opType == 'sum' else opType, acc) for acc, opType, _ in accumulators])
+        # iterations of a scatter can write the same location
+        self._vectorized = config.vectorize and not any([isinstance(op, Collate) for op in sortedOps])
+        blocked = config.reproducible and len(accumulators) > 0
+
+        def declare(indent):
+            for acc, opType, _ in accumulators:
+                codeFile.write('{0}{1} {2} = {3};\n'.format(indent, dtype, acc, initial[opType].format(dtype)))
+
+        private = []
+        if self._scatter == 'private':
+            codeFile.write('\tinteger nThreads = omp_get_max_threads();\n')
+            for index in self._scatterOutputs:
+                out = self._outputTensors[index]
+                size = '(bigInteger) {}_rows*{}'.format(out.name, out.size)
+                private.append((out.name, size))
+                codeFile.write('\tvector<{}> Buffer_{}(nThreads*{});\n'.format(out.dtype, out.name, size))
+        privateString = ''.join(['\t\t{0}* Private_{1} = &Buffer_{1}[(bigInteger) omp_get_thread_num()*{2}];\n'.format(dtype, name, size) for name, size in private])
+
+        if blocked:
+            codeFile.write('\tinteger nBlocks = (n + REDUCE_BLOCK - 1)/REDUCE_BLOCK;\n')
+            for acc, _, _ in accumulators:
+                codeFile.write('\tvector<{}> Partial_{}(nBlocks);\n'.format(dtype, acc))
+            if config.openmp:
+                codeFile.write('\t#pragma omp parallel for private(i) schedule(static)\n')
+            codeFile.write('\tfor (integer block = 0; block < nBlocks; block++) {\n')
+            codeFile.write(privateString)
+            declare('\t\t')
+            if self._vectorized:
+                codeFile.write('\t\t#pragma omp simd{}\n'.format(clauses))
+            codeFile.write('\t\tfor (i = block*REDUCE_BLOCK; i < min(n, (block + 1)*REDUCE_BLOCK); i++) {\n')
+            for code in body:
+                codeFile.write('\t' + code)
+            codeFile.write('\t\t}\n')
+            for acc, _, _ in accumulators:
+                codeFile.write('\t\tPartial_{0}[block] = {0};\n'.format(acc))
+            codeFile.write('\t}\n')
+            for acc, opType, _ in accumulators:
+                codeFile.write('\t{0} {1} = reduce_pairwise<{0}>(Partial_{1}, {2}, []({0} a, {0} b) {{ return {3}; }});\n'.format(dtype, acc, initial[opType].format(dtype), combine[opType]))
+        else:
+            declare('\t')
+            if self._scatter == 'color':
+                codeFile.write('\tinteger j;\n')
+                codeFile.write('\tfor (integer c = 0; c < nColors; c++) {\n')
+                codeFile.write('\t#pragma omp parallel for private(i, j){}\n'.format(clauses))
+                codeFile.write('\tfor (j = Colors[c]; j < Colors[c+1]; j++) {\n')
+                codeFile.write('\t\ti = Order[j];\n')
+            else:
+                if config.openmp and self._vectorized:
+                    codeFile.write('\t#pragma omp parallel for simd private(i){}\n'.format(clauses))
+                elif config.openmp and self._scatter == 'private':
+                    # iterations are split the same way on every call
+                    codeFile.write('\t#pragma omp parallel for private(i) schedule(static){}\n'.format(clauses))
+                elif config.openmp:
+                    codeFile.write('\t#pragma omp parallel for private(i){}\n'.format(clauses))
+                elif self._vectorized:
+                    codeFile.write('\t#pragma omp simd{}\n'.format(clauses))
+                codeFile.write('\tfor (i = 0; i < n; i++) {\n')
+            codeFile.write(privateString)
+            for code in body:
+                codeFile.write(code)
+            codeFile.write('\t}\n')
+            if self._scatter == 'color':
+                codeFile.write('\t}\n')
+
+        # partial sums are added in thread order
+        for name, size in private:
+            codeFile.write('\t#pragma omp parallel for\n')
+            codeFile.write('\tfor (bigInteger k = 0; k < {}; k++) {{\n'.format(size))
+            codeFile.write('\t\tfor (integer t = 0; t < nThreads; t++) {\n')
+            codeFile.write('\t\t\t{0}[k] += Buffer_{0}[t*{1} + k];\n'.format(name, size))
+            codeFile.write('\t\t}\n')
+            codeFile.write('\t}\n')
+        for acc, opType, outputs in accumulators:
+            for output in outputs:
+                if opType == 'sum':
+                    codeFile.write('\t{}[0] += {};\n'.format(output, acc))
+                else:
+                    codeFile.write('\t{0}[0] = {2}({1}, {0}[0]);\n'.format(output, acc, opType))
+
     def _genCode(self, inputs, outputs, children):
         sortedOps = graphTopologicalSort(outputs, children)
-        codeFile = Function.kernelCodeFile
-        headerFile = Function.kernelHeaderFile
-
-        memString = '' 
-        for inp in self._inputTensors:
-            memString += 'const {}* __restrict__ {}, '.format(inp.dtype, inp.name)
-        for out in self._outputTensors:
-            memString += '{}* __restrict__ {}, '.format(out.dtype, out.name)
+        if config.optimize:
+            sortedOps = self._simplify(sortedOps)
+        self._ops = len(sortedOps)
+        # the interpreter evaluates the same ops
+        self._sortedOps = sortedOps
+        codeFile = StringIO()
+        headerFile = self.module.kernelHeaderFile
+        self.module.kernelCodeFiles[self.name] = codeFile
+        codeFile.write('#include "common.hpp"\n')
+        codeFile.write('#include "gpu.hpp"\n')
+
+        # parameters that are never read or written are left out,
+        # TensorFunctionOp passes only the used arguments
+        ops = set(sortedOps)
+        self._inputsUsed = [any([x in ops for x in inp.scalars]) for inp in self._inputTensors]
+        stored = set([x[0] for indices in self._outputTensorIndices.values() for x in indices])
+        self._outputsUsed = [out.name in stored for out in self._outputTensors]
+
+        self._setScatter(sortedOps)
+
+        memString = 'int n, ' 
+        for inp, used in zip(self._inputTensors, self._inputsUsed):
+            if used:
+                memString += 'const {}* __restrict__ {}, '.format(inp.dtype, inp.name)
+        for out, used in zip(self._outputTensors, self._outputsUsed):
+            if used:
+                memString += '{}* __restrict__ {}, '.format(out.dtype, out.name)
+        if self._scatter == 'color':
+            memString += 'const integer* __restrict__ Order, const integer* __restrict__ Colors, integer nColors, '
+        elif self._scatter == 'private':
+            for index in self._scatterOutputs:
+                memString += 'integer {}_rows, '.format(self._outputTensors[index].name)
         if config.gpu:
-            memString = '__global__ void {}(int n, {})'.format(self.name, memString[:-2])
+            memString = '__global__ void {}({})'.format(self.name, memString[:-2])
         else:
-            memString = '\nvoid {}(int n, {})'.format(self.name, memString[:-2])
+            memString = '\nvoid {}({})'.format(self.name, memString[:-2])
         headerFile.write(memString + ';\n')
         codeFile.write(memString + ' {\n') 
+        codeFile.write('\t// {} ops, {} removed by simplification\n'.format(self._ops, self._opsRemoved))
         #codeFile.write('\tlong long start = current_timestamp();\n')
-        if config.gpu:
-            #codeFile.write('\tinteger i = threadIdx.x + blockDim.x*blockIdx.x + gridDim.x*blockDim.x*blockIdx.y;\n')
-            #codeFile.write('\tif (i < n) {\n')
-            codeFile.write('\tinteger i = threadIdx.x + blockDim.x*blockIdx.x;\n')
-            codeFile.write('\tfor (; i < n; i += blockDim.x*gridDim.x) {\n')
-        else:
-            codeFile.write('\tinteger i;\n')
-            if config.openmp:
-                codeFile.write('\t#pragma omp parallel for private(i)\n')
-            codeFile.write('\tfor (i = 0; i < n; i++) {\n')
+        # the loop body is generated first, reductions on the CPU
+        # accumulate into locals declared before the loop
+        body = []
+        accumulators = []
         names = {}
         int_size = 4
         if config.gpu and not config.gpu_double:
@@ -384,36 +689,40 @@ class TensorFunction(object):
                 #self._loads += float_size
             elif isinstance(op, Collate):
                 #print len(op.args)
-                tensorIndex = self._outputTensorIndices[op]
-                assert tensorIndex[3]
-                n = len(op.args)//2
-                for i in range(0, n):
-                    a, b = op.args[2*i], op.args[2*i+1]
-                    assert b.dtype == 'integer'
-                    if config.gpu:
-                        code += 'atomicAdd(&{}[{}*{} + {}], {});\n\t\t'.format(tensorIndex[0], names[b], tensorIndex[1], tensorIndex[2], names[a])
-                    elif config.openmp:
-                        #code += '//invalid in openmp;\n\t\t'
-                        raise Exception("redo this for max/min")
-                        code += '#pragma omp atomic\n\t\t'
-                        code += '{}[{}*{} + {}] += {};\n\t\t'.format(tensorIndex[0], names[b], tensorIndex[1], tensorIndex[2], names[a])
-                        #code += '__sync_fetch_and_add(&{}[{}*{} + {}], {});\n\t\t'.format(tensorIndex[0], names[b], tensorIndex[1], tensorIndex[2], names[a])
-                    else:
-                        code += '{}[{}*{} + {}] += {};\n\t\t'.format(tensorIndex[0], names[b], tensorIndex[1], tensorIndex[2], names[a])
-                    self._stores += float_size
-                    self._loads += float_size
-                    self._flops += 1
+                # the same scatter to every output it is stored to
+                for tensorIndex in self._outputTensorIndices[op]:
+                    assert tensorIndex[3]
+                    n = len(op.args)//2
+                    for i in range(0, n):
+                        a, b = op.args[2*i], op.args[2*i+1]
+                        assert b.dtype == 'integer'
+                        if config.gpu:
+                            code += 'atomicAdd(&{}[{}*{} + {}], {});\n\t\t'.format(tensorIndex[0], names[b], tensorIndex[1], tensorIndex[2], names[a])
+                        elif self._scatter == 'atomic':
+                            code += '#pragma omp atomic\n\t\t'
+                            code += '{}[{}*{} + {}] += {};\n\t\t'.format(tensorIndex[0], names[b], tensorIndex[1], tensorIndex[2], names[a])
+                        elif self._scatter == 'private':
+                            code += 'Private_{}[{}*{} + {}] += {};\n\t\t'.format(tensorIndex[0], names[b], tensorIndex[1], tensorIndex[2], names[a])
+                        else:
+                            code += '{}[{}*{} + {}] += {};\n\t\t'.format(tensorIndex[0], names[b], tensorIndex[1], tensorIndex[2], names[a])
+                        self._stores += float_size
+                        self._loads += float_size
+                        self._flops += 1
             elif isinstance(op, Reduce):
                 a, = op.args
-                tensorIndex = self._outputTensorIndices[op]
-                assert tensorIndex[3]
+                tensorIndices = self._outputTensorIndices[op]
+                assert all([tensorIndex[3] for tensorIndex in tensorIndices])
                 if config.gpu:
-                    code += 'reduce{}<{}>(n, {}, &{}[0]);\n\t\t'.format(op.opType.capitalize(), dtype, names[a], tensorIndex[0])
+                    for tensorIndex in tensorIndices:
+                        code += 'reduce{}<{}>(n, {}, &{}[0]);\n\t\t'.format(op.opType.capitalize(), dtype, names[a], tensorIndex[0])
                 else:
+                    # one accumulator merged into every output
+                    acc = 'Reduce_{}'.format(index)
+                    accumulators.append((acc, op.opType, [tensorIndex[0] for tensorIndex in tensorIndices]))
                     if op.opType == 'sum':
-                        code += '{}[0] += {};\n\t\t'.format(tensorIndex[0], names[a])
+                        code += '{} += {};\n\t\t'.format(acc, names[a])
                     else:
-                        code += '{0}[0] = {2}({1}, {0}[0]);\n\t\t'.format(tensorIndex[0], names[a], op.opType)
+                        code += '{0} = {2}({1}, {0});\n\t\t'.format(acc, names[a], op.opType)
                 #self._stores += float_size
                 self._flops += 1
             else:
@@ -421,37 +730,95 @@ class TensorFunction(object):
                 if isinstance(op, UnaryOp) or isinstance(op, BinaryOp):
                     self._flops += 1
 
-            if op in self._outputTensorIndices:
-                tensorIndex = self._outputTensorIndices[op]
+            for tensorIndex in self._outputTensorIndices.get(op, []):
                 if not tensorIndex[3]:
                     code += '\n\t\t{}[i*{} + {}] += {};'.format(tensorIndex[0], tensorIndex[1], tensorIndex[2], names[op])
                     self._stores += float_size
                     self._loads += float_size
                     self._flops += 1
 
-            codeFile.write('\t\t' + code + '\n')
-        codeFile.write('\t}\n')
+            body.append('\t\t' + code + '\n')
+
+        if config.gpu:
+            #codeFile.write('\tinteger i = threadIdx.x + blockDim.x*blockIdx.x + gridDim.x*blockDim.x*blockIdx.y;\n')
+            #codeFile.write('\tif (i < n) {\n')
+            codeFile.write('\tinteger i = threadIdx.x + blockDim.x*blockIdx.x;\n')
+            codeFile.write('\tfor (; i < n; i += blockDim.x*gridDim.x) {\n')
+            for code in body:
+                codeFile.write(code)
+            codeFile.write('\t}\n')
+        else:
+            self._genLoop(codeFile, body, accumulators, sortedOps)
         #codeFile.write('\tlong long end = current_timestamp(); mil += end-start; printf("c module {}: %lld\\n", mil);\n'.format(self.name))
         codeFile.write('}\n')
         return
 
-import random, string
-random.seed(3)
-def randomName(N):
-    return ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(N))
-
-
-def Kernel(func):
+def _nodeKey(op):
+    if isinstance(op, ConstantOp):
+        return 'ConstantOp ' + repr(op.constant)
+    elif isinstance(op, Reduce):
+        return 'Reduce ' + op.opType
+    return type(op).__name__
+
+# config the generated code of kernels depends on
+_codegenOptions = ['gpu', 'gpu_double', 'openmp', 'optimize', 'reproducible', 'scatter', 'vectorize']
+
+def kernelDigest(inputs, outputs, scatter=None):
+    """Hash of the scalar graph and the signature of a kernel, nodes are
+    numbered in the order they are sorted, so the hash is the same for
+    identical kernels traced separately and across runs"""
+    ids = {}
+    lines = [repr([scatter] + [getattr(config, x) for x in _codegenOptions])]
+    for index, inp in enumerate(inputs):
+        lines.append('{} {} {}'.format(inp.shape, inp.dtype, inp.cellTensor))
+        for component, x in enumerate(inp.scalars):
+            ids[x] = 'i{}_{}'.format(index, component)
+    roots = [x for out in outputs for x in out.scalars if x is not None]
+    children, _ = graphGetChildren(roots)
+    for op in graphTopologicalSort(roots, children):
+        if op not in ids:
+            ids[op] = str(len(ids))
+            lines.append(' '.join([_nodeKey(op)] + [ids[x] for x in op.args]))
+    for out in outputs:
+        scalars = ['-' if x is None else ids[x] for x in out.scalars]
+        lines.append(' '.join(['{} {} {}'.format(out.shape, out.dtype, out.cellTensor)] + scalars))
+    return hashlib.md5('\n'.join(lines).encode('utf-8')).hexdigest()[:16]
+
+def _canonical(value):
+    # values keyed with their types, 1 and 1. trace different kernels
+    if isinstance(value, tuple):
+        return (tuple,) + tuple([_canonical(x) for x in value])
+    return (type(value), value)
+
+def Kernel(func, scatter=None):
+    """func is traced and its code generated once for every signature,
+    the shapes without the rows and dtypes of the args, the keyword args
+    and the config the code depends on, it is called with. The variants
+    are in specializations, hits and misses count the calls that reused
+    one and that traced one. Calls with keyword args that cannot be
+    hashed are traced every time"""
     assert callable(func)
     def ParamFunc(indices=None, outputs=None):
         def Func(*args, **kwargs):
-            if not hasattr(ParamFunc, 'tensorFunc'):
-                name = randomName(12)
-                #print 'here', name
+            assert all([isinstance(x, Variable) for x in args])
+            # kernels generated before a compile are not in the next module
+            module = Module.get()
+            if ParamFunc.generation != module.index:
+                ParamFunc.specializations = {}
+                ParamFunc.generation = module.index
+            signature = tuple([(x.shape[1:], x.dtype) for x in args]) + tuple([(key, _canonical(value)) for key, value in sorted(kwargs.items())])
+            signature += tuple([getattr(config, x) for x in _codegenOptions])
+            try:
+                hash(signature)
+            except TypeError:
+                signature = None
+            if signature in ParamFunc.specializations:
+                ParamFunc.hits += 1
+                ParamFunc.tensorFunc, outputsInfo = ParamFunc.specializations[signature]
+            else:
+                ParamFunc.misses += 1
                 tensorArgs = []
-                #print len(args), len(kwargs)
                 for x in args:
-                    assert isinstance(x, Variable)
                     if x.dtype == dtype:
                         tensorArgs.append(Tensor(x.shape[1:]))
                     elif x.dtype == 'integer':
@@ -459,23 +826,34 @@ def Kernel(func):
                     else:
                         raise Exception(x.dtype)
 
+                # the collector stays on in user code, it can make cycles
                 tensorOutputs = func(*tensorArgs, **kwargs)
-                shape = args[0].shape[0]
                 if not isinstance(tensorOutputs, tuple):
                     tensorOutputs = (tensorOutputs,)
-                ParamFunc.outputsInfo = [((shape,) + x.shape, x.dtype) for x in tensorOutputs]
-                ParamFunc.tensorFunc = TensorFunction(name, tensorArgs, tensorOutputs)
+                outputsInfo = [(x.shape, x.dtype) for x in tensorOutputs]
+                # identical kernels, from other wrappers of the same
+                # function or other functions, are generated once
+                with noCollection():
+                    name = kernelDigest(tensorArgs, tensorOutputs, scatter)
+                tensorFunc = module.kernels.get('Function_' + name)
+                if tensorFunc is None:
+                    tensorFunc = TensorFunction(name, tensorArgs, tensorOutputs, scatter=scatter)
+                if signature is not None:
+                    ParamFunc.specializations[signature] = (tensorFunc, outputsInfo)
+                ParamFunc.tensorFunc = tensorFunc
+            shape = args[0].shape[0]
+            outputsInfo = [((shape,) + x[0], x[1]) for x in outputsInfo]
 
             _indices = indices
             if _indices == None:
-                _indices = ParamFunc.outputsInfo[0][0][0]
+                _indices = shape
             assert isinstance(_indices, int) or isinstance(_indices, IntegerScalar)
             if outputs is None:
-                _outputs = tuple([Zeros(x[0]) for x in ParamFunc.outputsInfo])
+                _outputs = tuple([Zeros(x[0]) for x in outputsInfo])
             else:
-                assert len(outputs) == len(ParamFunc.outputsInfo)
+                assert len(outputs) == len(outputsInfo)
                 assert [out1.shape == out2[0] and out1.dtype == out2[1] \
-                        for out1, out2 in zip(outputs, ParamFunc.outputsInfo)]
+                        for out1, out2 in zip(outputs, outputsInfo)]
                 #args = args + outputs
                 _outputs = outputs
             ret = TensorFunctionOp(ParamFunc.tensorFunc, args, _outputs, _indices).outputs
@@ -483,4 +861,8 @@ def Kernel(func):
                 return ret[0]
             return ret
         return Func
+    ParamFunc.specializations = {}
+    ParamFunc.generation = None
+    ParamFunc.hits = 0
+    ParamFunc.misses = 0
     return ParamFunc
@@ -1,14 +1,17 @@
 
-import os, sys, subprocess, shutil
+import os, sys, subprocess, shutil, hashlib
 scriptDir = os.path.dirname(os.path.realpath(__file__))
 
 from . import config
 from .scalar import *
-from .compile import compile_gencode
+from .compile import build_module, load_module, load_vector_report
 
 import numpy as np
 import time
 import sys
+import multiprocessing
+import multiprocessing.pool
+from collections import OrderedDict
 try:
     from cStringIO import StringIO
 except ImportError:
@@ -16,42 +19,46 @@ except ImportError:
 
 _dtype = dtype
 
-def graphGetChildren(outputs):
+def graphGetChildren(outputs, leaves=()):
+    # depth first traversal with an explicit stack of nodes, args are
+    # pushed in reverse so nodes are visited in the same order as the
+    # recursive version without being limited by the recursion depth.
+    # the arguments of variables named in leaves are not visited
     children = {}
     inputs = []
 
-    def _childrenFunc(out):
-        if len(out.args) == 0:
-            inputs.append(out)
-        for inp in out.args:
-            if inp in children:
-                children[inp] += 1
-            else:
-                children[inp] = 1
-                _childrenFunc(inp)
-
-    output = Container()
-    output.args = tuple(outputs)
-    _childrenFunc(output)
+    hasLeaves = len(leaves) > 0
+    stack = list(outputs)[::-1]
+    while len(stack) > 0:
+        inp = stack.pop()
+        if inp in children:
+            children[inp] += 1
+            continue
+        children[inp] = 1
+        leaf = hasLeaves and isinstance(inp, Variable) and inp.name in leaves
+        if not inp.args or leaf:
+            inputs.append(inp)
+        else:
+            stack.extend(inp.args[::-1])
     for out in outputs:
         children[out] -= 1
     return children, inputs
 
-def graphTopologicalSort(outputs, children):
-    output = Container()
-    output.args = tuple(outputs)
+def graphTopologicalSort(outputs, children, leaves=()):
     for out in outputs:
         children[out] += 1
-    children[output] = 0
     sortedOps = []
-    def _sort(out):
-        sortedOps.append(out)
-        for inp in out.args:
-            children[inp] -= 1
-            if children[inp] == 0:
-                _sort(inp)
-    _sort(output)
-    return sortedOps[1:][::-1]
+    hasLeaves = len(leaves) > 0
+    stack = list(outputs)[::-1]
+    while len(stack) > 0:
+        inp = stack.pop()
+        children[inp] -= 1
+        if children[inp] == 0:
+            sortedOps.append(inp)
+            leaf = hasLeaves and isinstance(inp, Variable) and inp.name in leaves
+            if not leaf:
+                stack.extend(inp.args[::-1])
+    return sortedOps[::-1]
 
 class Variable(ArithBase):
     _index = 0
@@ -103,7 +110,8 @@ class Variable(ArithBase):
 
     def staticId(self):
         if self.static:
-            return hash(self.name)
+            # stable across processes, unlike hash(), so generated code is reproducible
+            return int(hashlib.md5(self.name.encode('utf-8')).hexdigest()[:15], 16)
         else:
             return 0
 
@@ -172,6 +180,9 @@ class FunctionOp(object):
         assert len(outputs) == len(_inputs)
         return inputs, outputs, gradOutputs
 
+    def usedArgs(self):
+        return self.args
+
     def _gradOutputRefs(self, gradOutputs):
         gradOutputs = list(gradOutputs)
         for index, out in enumerate(gradOutputs):
@@ -214,23 +225,100 @@ class TensorFunctionOp(FunctionOp):
         self.func = func
         self._init(func.name, args, outputs)
         self.indices = indices
-        self.info = inspect.stack()[2:]
+        self.info = ['{}:{}:{}'.format(os.path.basename(frame[1]), frame[2], frame[3]) for frame in inspect.stack(0)[2:]]
         
+    def usedArgs(self):
+        # the kernel skips parameters it never reads or writes, it is
+        # not called at all if it stores nothing
+        func = self.func
+        if not any(func._outputsUsed):
+            return tuple()
+        used = func._inputsUsed + func._outputsUsed
+        return tuple([inp for inp, x in zip(self.args, used) if x])
+
+    def _offset(self, inp):
+        if isinstance(inp.index, int):
+            return inp.index
+        return inp.index.name
+
     def getCallString(self):
         #callString = '\n/* ' + str(self.info) + ' */\n'
         callString = ''
-        for inp in self.args:
-            if isinstance(inp.index, int):
-                offset = '({})'.format(inp.index)
-            else:
-                offset = '({})'.format(inp.index.name)
+        for inp in self.usedArgs():
+            offset = '({})'.format(self._offset(inp))
             callString += '&{}{}, '.format(inp.name, offset)
             #if hasattr(inp, 'dtype'):
             #    callString += '/* {} */  '.format(inp.dtype)
         #for out in self.outputs:
         #    callString += '{}, '.format(out.name)
+        func = self.func
+        if func._scatter == 'color':
+            callString += 'coloring.order.data(), coloring.offsets.data(), coloring.count, '
+        elif func._scatter == 'private':
+            # rows of the per thread copies of the scattered outputs
+            for index in func._scatterOutputs:
+                out = self.args[len(func._inputTensors) + index]
+                callString += '{}.shape - {}, '.format(out.name, self._offset(out))
         return callString[:-2]
+
+    def getColoring(self, indices):
+        """Expression for the coloring of the iterations of the kernel,
+        computed from the index arrays it scatters with. It is cached
+        if they are all static"""
+        pointers, strides, names = [], [], []
+        for index, size, component in self.func._scatterIndices:
+            inp = self.args[index]
+            pointers.append('&{}({}) + {}'.format(inp.name, self._offset(inp), component))
+            strides.append(str(size))
+            names.append('{}:{}'.format(inp.name, component))
+        key = 0
+        if all([self.args[index].static for index, _, _ in self.func._scatterIndices]):
+            key = int(hashlib.md5(':'.join([self.name] + names).encode('utf-8')).hexdigest()[:15], 16)
+        return 'scatter_coloring({}L, {}, {{{}}}, {{{}}})'.format(key, indices, ', '.join(pointers), ', '.join(strides))
     
+    def fuse(self, op, children, varChildren, exclude):
+        """Returns a TensorFunctionOp running op in the same loop as this
+        one, or None if they cannot be fused. op reads the outputs of this
+        op at the same index from registers, they are only stored if
+        something else uses them"""
+        if not isinstance(op, TensorFunctionOp) or self.indices != op.indices:
+            return None
+        n, m = len(self.outputs), len(op.outputs)
+        inputs, outputs = self.args[:-n], self.args[-n:]
+        opInputs, opOutputs = op.args[:-m], op.args[-m:]
+        # reads of this op would be reordered with the writes of op, and
+        # outputs are restrict pointers that cannot alias
+        opNames = set([x.name for x in opOutputs])
+        if set([x.name for x in self.args]) & opNames:
+            return None
+        names = [out.name for out in outputs]
+        intermediates = {}
+        stored = set()
+        for index, inp in enumerate(opInputs):
+            if inp.name not in names:
+                continue
+            outIndex = names.index(inp.name)
+            out = outputs[outIndex]
+            # the value in the register is the whole array element only
+            # for a zero initialised array this op alone writes
+            if not isinstance(out, Zeros) or out.static or children[out] != 1 or \
+               inp.index != out.index or \
+               self.func._outputTensors[outIndex].cellTensor or \
+               op.func._inputTensors[index].cellTensor:
+                return None
+            intermediates[index] = outIndex
+            if out.name in exclude or varChildren[out.name] != 2:
+                stored.add(outIndex)
+        if len(intermediates) == 0:
+            return None
+        dropped = set(intermediates.values()) - stored
+        func = self.func.fuse(op.func, intermediates, dropped)
+        args = inputs + tuple([x for index, x in enumerate(opInputs) if index not in intermediates])
+        outputs = tuple([x for index, x in enumerate(outputs) if index not in dropped])
+        fused = TensorFunctionOp(func, args, outputs + opOutputs, self.indices)
+        fused.info = self.info
+        return fused
+
     def grad(self, grad):
         n = len(self.outputs)
         args, outputs, gradOutputs = self._grad(grad)
@@ -268,27 +356,310 @@ class ExternalFunctionOp(FunctionOp):
         FunctionOp.insert_cache(gradInputs)
         return gradInputs + gradOutputs
 
-class Function(object):
+def _itemsize(dtype):
+    if dtype == 'integer':
+        return 4
+    elif config.gpu and not config.gpu_double:
+        return 4
+    return np.dtype(config.precision).itemsize
+
+def _rows(shape, sizes):
+    if isinstance(shape, int):
+        return shape
+    return sizes[shape.name]
+
+def _tapeBytes(variables, sizes):
+    sizes = sizes or {}
+    return sum([_rows(var.shape[0], sizes)*int(np.prod(var.shape[1:]))*_itemsize(var.dtype) for var in variables])
+
+class Module(object):
+    """A compilation unit, the Functions and kernels created while it is
+    the current module, their generated sources and the extension module
+    they are built into. Modules are built independently, several can
+    compile at once in the background and be loaded side by side"""
     _index = 0
-    _init = False
+    # module new Functions and kernels are added to
+    current = None
+
+    def __init__(self, name=None):
+        Module._index += 1
+        self.index = Module._index
+        self.name = name
+        # extension modules loaded in a process need different names
+        self.moduleName = '{}_{}'.format(name or 'graph', self.index)
+        self.codeDir = None
+        self.modulePath = None
+        self.codeFile = StringIO()
+        # one translation unit per kernel, so that only changed kernels are recompiled
+        self.kernelCodeFiles = OrderedDict()
+        self.kernelHeaderFile = StringIO()
+        # kernels generated for the module by name
+        self.kernels = {}
+        self.funcs = []
+        self.codeFile.write('#include "code.hpp"\n')
+        # no Functions or kernels are added once it is built
+        self.built = False
+        self.module = None
+        self.compileTimes = None
+        # seconds spent in code generation, compilation and loading
+        self.buildTimes = OrderedDict()
+        # kernel name to the width in bytes of the vectors its loop uses,
+        # 0 if it did not vectorize
+        self.vectorized = None
+        # 'interpreter' while a tiered compile runs, 'compiled' once the
+        # module is loaded, see compile
+        self.tier = None
+        # called with the module when it switches to compiled code
+        self.tierUpHooks = []
+        self._tierInit = True
+        self._initArgs = ((), {})
+        # tapes written by interpreted calls, not in the compiled module
+        self._tapes = set()
+        # static and reusable arrays of the Functions by their key in the
+        # interpreter, copied into the compiled module on the switch
+        self._state = OrderedDict()
+        # batched inputs copied before the call, see getConversions
+        self._conversions = {}
+        self._pool = None
+        self._result = None
+        self._error = None
+        self._previous = []
+
+    @classmethod
+    def get(cls):
+        if cls.current is None or cls.current.built:
+            cls.current = Module()
+        return cls.current
+
+    def __enter__(self):
+        self._previous.append(Module.current)
+        Module.current = self
+        return self
+
+    def __exit__(self, *args):
+        Module.current = self._previous.pop()
+
+    def createCodeDir(self, case, replace=True):
+        # named modules build in their own directory, so that they
+        # compile concurrently and keep their objects across rebuilds
+        self.codeDir = case + 'gencode/'
+        if self.name is not None:
+            self.codeDir += self.name + '/'
+        # objects from previous builds are kept for incremental compilation
+        if replace and not os.path.exists(self.codeDir):
+            os.makedirs(self.codeDir)
+
+    def build(self, case='./', replace=True, compiler_args={}, background=None):
+        """Generate the code of the Functions and compile it, in a worker
+        thread or process if background is 'thread' or 'process'. load
+        waits for the compilation"""
+        # the interpreter runs the graphs directly, nothing to build
+        if not config.compile:
+            self.built = True
+            return self
+        if self.codeDir is None:
+            self.createCodeDir(case, replace=replace)
+
+        start = time.time()
+        # kernels fused by the Functions are added to this module
+        with self:
+            for func in self.funcs:
+                func._genCode([x for x in func._outputs if x is not None])
+        self.built = True
+        self._genStateCode()
+        self.codeFile.write("PyMethodDef ExtraMethods[] = {\n")
+        for func in self.funcs:
+            self.codeFile.write('\t{{"{0}",(PyCFunction)(void(*)(void))Function_{0}, FUNCTION_FLAGS, "boo"}},\n'.format(func.name))
+        self.codeFile.write('\t{"set_state",(PyCFunction)(void(*)(void))set_state, FUNCTION_FLAGS, "Copy an array of the interpreter into the module."},\n')
+        self.codeFile.write("\n\t\t{NULL, NULL, 0, NULL}        /* Sentinel */\n\t};\n")
+
+        self.modulePath = os.path.join(self.codeDir, '{}.so'.format(self.moduleName))
+        self.buildTimes['codegen'] = time.time()-start
+        self.buildTimes['compile'] = 0.
+        if replace:
+            genSources = OrderedDict()
+            for name, string in zip(config.get_gen_sources(), [self.codeFile, self.kernelHeaderFile]):
+                genSources[name] = string.getvalue()
+                string.close()
+            for name, string in self.kernelCodeFiles.items():
+                genSources[config.get_kernel_source(name)] = string.getvalue()
+                string.close()
+            compiler_args = dict(compiler_args)
+            compiler_args['gen_sources'] = [name for name in genSources if not name.endswith('.hpp')]
+            cacheDir = None
+            if config.cache:
+                cacheDir = config.cacheDir
+                if cacheDir is None:
+                    cacheDir = os.path.join(self.codeDir, 'cache')
+            args = (self.codeDir, self.moduleName, genSources, cacheDir)
+            if background is None:
+                self._result = build_module(*args, **compiler_args)
+            else:
+                pools = {'thread': multiprocessing.pool.ThreadPool, 'process': multiprocessing.Pool}
+                self._pool = pools[background](1)
+                self._result = self._pool.apply_async(build_module, args, compiler_args)
+        return self
+
+    def _genStateCode(self):
+        # set_state(index, array) stores the array as the static or
+        # reusable array at that index of _state
+        codeFile = self.codeFile
+        keepMemory = {True: 'true', False: 'false'}[not config.gc]
+        codeFile.write('\nstatic PyObject* set_state(PyObject *self, FUNCTION_ARGS) {\n')
+        codeFile.write('\tassert(FUNCTION_NARGS == 2);\n')
+        codeFile.write('\tinteger index = (integer) PyInt_AsLong(FUNCTION_ARG(0));\n')
+        for index, (key, (arrType, dtype, stateId)) in enumerate(self._state.items()):
+            codeFile.write('\tif (index == {}) {{\n'.format(index))
+            codeFile.write('\t\tArrayRef Ref_state(getInput(FUNCTION_ARG(1), arrayType<{}>(), "set_state:{}", false));\n'.format(dtype, index))
+            codeFile.write('\t\tif (Ref_state.array == NULL) return NULL;\n')
+            # statics are shared by id, reusable arrays come from the pool
+            codeFile.write('\t\t{} state(PyArray_DIMS(Ref_state.array)[0], false, {}, {}L);\n'.format(arrType, keepMemory, stateId if key[0] == 'static' else 0))
+            if config.gpu:
+                codeFile.write('\t\tstate.toDevice(({}*) PyArray_DATA(Ref_state.array));\n'.format(dtype))
+            else:
+                codeFile.write('\t\tmemcpy(state.data, PyArray_DATA(Ref_state.array), state.bufSize);\n')
+            if key[0] == 'reuse':
+                codeFile.write('\t\tstate.reuse_release("{}");\n'.format(stateId))
+            codeFile.write('\t}\n')
+        codeFile.write('\tPy_INCREF(Py_None);\n')
+        codeFile.write('\treturn Py_None;\n')
+        codeFile.write('}\n\n')
+
+    def ready(self):
+        """Whether the compilation started by build has finished"""
+        return self._pool is None or self._result.ready()
+
+    def failed(self):
+        """Whether the compilation started by build failed, wait raises
+        its error"""
+        if self._pool is not None:
+            return self._result.ready() and not self._result.successful()
+        return self._error is not None
+
+    def wait(self):
+        if self._pool is not None:
+            try:
+                self._result = self._result.get()
+            except Exception as e:
+                self._error = e
+                self._result = None
+            finally:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
+        if self._error is not None:
+            raise self._error
+        if self._result is not None:
+            self.modulePath, self.compileTimes, self.buildTimes['compile'] = self._result
+            self._result = None
+
+    def load(self, init=True):
+        """Load the built module and bind its Functions"""
+        if not config.compile:
+            return self
+        self.wait()
+        start = time.time()
+        self.module = load_module(self.moduleName, self.modulePath)
+        for func in self.funcs:
+            func._func = getattr(self.module, func.name)
+            func._options = Function._getOptions(func.defaultOptions)
+        self.buildTimes['load'] = time.time()-start
+        if config.vectorize and not config.gpu:
+            report = load_vector_report(self.codeDir)
+            self.vectorized = OrderedDict([(name, report.get(config.get_kernel_source(name))) for name in self.kernelCodeFiles])
+
+        if init:
+            args, kwargs = self._initArgs
+            self.module.initialize(*args, **kwargs)
+        return self
+
+    def compile(self, case='./', init=True, replace=True, compiler_args={}, tiered=False):
+        """Build and load the module. A tiered compile returns once the
+        code is generated, the Functions run in the interpreter until the
+        module compiling in a background process is loaded, see tierUp"""
+        if tiered and config.compile:
+            self.build(case, replace=replace, compiler_args=compiler_args, background='process')
+            self.tier = 'interpreter'
+            self._tierInit = init
+            return self
+        self.build(case, replace=replace, compiler_args=compiler_args)
+        return self.load(init)
+
+    def tierUp(self, wait=False, func=None):
+        """Load a tiered module if its compilation has finished, or once it
+        has with wait. The switch waits while a tape written in the
+        interpreter is outstanding, unless func writes all of them again.
+        Static and reusable arrays of the interpreter are copied into the
+        module. A failed compilation keeps the Functions in the interpreter,
+        wait raises its error. Returns whether the Functions run compiled
+        code"""
+        if self.tier != 'interpreter':
+            return True
+        if not (wait or self.ready()):
+            return False
+        if not wait and self.failed():
+            return False
+        if not self._tapes.issubset(func._tape if func is not None else ()):
+            if wait:
+                self.wait()
+            return False
+        self.load(self._tierInit)
+        from . import interpreter
+        for index, key in enumerate(self._state):
+            if key in interpreter._shared:
+                self.module.set_state(index, interpreter._shared.pop(key))
+        self.tier = 'compiled'
+        self._tapes = set()
+        for hook in self.tierUpHooks:
+            hook(self)
+        return True
+
+    def initialize(self, *args, **kwargs):
+        # a tiered module is initialized with them once it is loaded
+        self._initArgs = (args, kwargs)
+        if self.module is not None:
+            self.module.initialize(*args, **kwargs)
+
+    def getProfile(self):
+        """Counters of the kernels, external functions and Functions
+        called since the last reset, by name. Needs config.profile"""
+        profile = OrderedDict()
+        for name, entry in sorted(self.module.get_profile().items(), key=lambda x: -x[1]['time']):
+            time = max(entry['time'], 1e-12)
+            entry['bandwidth'] = (entry['loads'] + entry['stores'])/time
+            entry['flop_rate'] = entry['flops']/time
+            profile[name] = entry
+        return profile
+
+    def resetProfile(self):
+        self.module.reset_profile()
 
-    _module = None
-    codeDir = None
-    codeFile = None
-    kernelCodeFile = None
-    kernelHeaderFile = None
-    funcs = None
+    def getConversions(self):
+        """Calls that copied an input to convert it to an aligned C
+        contiguous array of its type, by 'Function:argument index'. Static
+        and reusable inputs are written in place, calls raise instead"""
+        conversions = self.module.get_conversions()
+        for key, count in self._conversions.items():
+            conversions[key] = conversions.get(key, 0) + count
+        return conversions
 
+    def resetConversions(self):
+        self._conversions = {}
+        self.module.reset_conversions()
+
+class Function(object):
     defaultOptions = {'return_static': True, 
                       'zero_static': False,
                       'replace_static': False,
                       'return_reusable': True,
                       'replace_reusable': False,
                      }
+    # bits of the options argument of the generated functions
+    optionNames = ['return_static', 'zero_static', 'replace_static', 'return_reusable', 'replace_reusable']
 
     def __init__(self, name, inputs, outputs, **kwargs):
-        if not Function._init:
-            Function.reset()
+        # the module it is compiled into
+        self.module = Module.get()
         self._io_map = kwargs.get('io_map', {})
         if config.gpu:
             self.arrType = 'gpuArrType'
@@ -310,14 +681,25 @@ class Function(object):
         assert all([isinstance(x, Variable) for x in outputs])
         self._inputs = inputs
         self._outputs = outputs
+        # arrays written to the tape for an adjoint, and arrays read from
+        # the tape of the forward function, by name
+        self._tape = OrderedDict()
+        self._leaves = kwargs.get('leaves', OrderedDict())
         _outputs = [x for x in self._outputs if x is not None]
-        self._children, discoveredInputs = graphGetChildren(_outputs)
-        discoveredInputs = [x for x in discoveredInputs if not isinstance(x, Zeros)]
+        self._children, discoveredInputs = graphGetChildren(_outputs, self._leaves)
+        discoveredInputs = [x for x in discoveredInputs if not (isinstance(x, Zeros) or x.name in self._leaves)]
         assert set(discoveredInputs).issubset(set(inputs))
         
-        self._genCode(_outputs)
+        # code is generated on compile, once the tape is known
         FunctionOp.clear_cache()
-        Function.funcs.append(self.name)
+        # indices of the inputs with a leading batch axis, see getBatched
+        self._batch = kwargs.get('batch', ())
+        # Hessian vector Functions by the names of their inputs
+        self._hessianVectors = {}
+        # compiled function and default options bitmask, bound on compile
+        self._func = None
+        self._options = None
+        self.module.funcs.append(self)
 
     def grad(self):
         #gradOutputs = []
@@ -342,10 +724,171 @@ class Function(object):
                 inp2.static = inp1.static
         return gradOutputs, gradInputs
 
-    def getAdjoint(self):
+    def getAdjoint(self, policy='recompute', sizes=None):
+        """Adjoint of the function, the policy decides what happens to the
+        forward intermediates its kernels read: 'recompute' evaluates them
+        again, 'store' has every call of this function save them to a tape
+        and an integer keeps as many as fit in that many bytes, recomputing
+        the cheapest. With a tape the adjoint reads the intermediates of the
+        last forward call, which has to be made with the same inputs"""
         gradOutputs, gradInputs = self.grad()
+        name = self.name + '_grad'
+        leaves = OrderedDict()
+        if policy != 'recompute':
+            if policy == 'store':
+                budget = None
+            else:
+                assert isinstance(policy, int)
+                budget = policy
+            name = '{}_{}'.format(name, policy)
+            leaves = self._checkpoint(gradInputs, budget, sizes)
+            self._tape.update(leaves)
         adj_io_map = {v + len(self._inputs): k for k, v in self._io_map.items()}
-        return Function(self.name + '_grad', self._inputs + tuple(gradOutputs), tuple(gradInputs), io_map=adj_io_map)
+        return Function(name, self._inputs + tuple(gradOutputs), tuple(gradInputs), io_map=adj_io_map, leaves=leaves)
+
+    def _checkpoint(self, gradInputs, budget, sizes):
+        # forward arrays that can be taped are written from zero by a
+        # single kernel, the tape holds those at which the adjoint stops
+        # reading the forward graph. over the budget, the array that is
+        # cheapest to recompute per byte is dropped, the arrays its
+        # producer reads may take its place on the tape
+        reusable = [self._outputs[index].name for index in self._io_map.values()]
+        producers = {}
+        for op in self._children:
+            if not isinstance(op, FunctionOp):
+                continue
+            n = len(op.outputs)
+            for root, out in zip(op.args[-n:], op.outputs):
+                if isinstance(root, Zeros) and not root.static and self._children[root] == 1 and root.name not in reusable:
+                    producers[out.name] = (op, out)
+
+        outputs = [x for x in gradInputs if x is not None]
+        dropped = set()
+        while True:
+            leaves = set(producers) - dropped
+            _, discovered = graphGetChildren(outputs, leaves)
+            tape = OrderedDict()
+            for var in discovered:
+                if var.name in leaves:
+                    tape[var.name] = producers[var.name][1]
+            if budget is None or _tapeBytes(tape.values(), sizes) <= budget:
+                return tape
+
+            def cost(name):
+                op, var = producers[name]
+                if not isinstance(op, TensorFunctionOp):
+                    return float('inf')
+                return float(op.func._flops)/(_itemsize(var.dtype)*np.prod(var.shape[1:]))
+            dropped.add(min(tape.keys(), key=cost))
+
+    def getTangent(self, inputs=None):
+        """Function computing the outputs and their directional derivatives
+        along the tangents of inputs, all the scalar array inputs by default.
+        The tangents are extra arguments after the inputs and are returned
+        after the outputs, every kernel computes its outputs and their
+        tangents in one pass"""
+        # the tangents of the tape would be needed too
+        assert len(self._leaves) == 0
+        if inputs is None:
+            inputs = [x for x in self._inputs if isinstance(x, Variable) and x.dtype == _dtype]
+        names = set([x.name for x in inputs])
+        primals = {}
+        tangents = {}
+        tangentInputs = []
+        for inp in self._inputs:
+            if isinstance(inp, Variable) and inp.name in names:
+                assert inp.dtype == _dtype
+                tangent = Variable(inp.shape, inp.dtype)
+                tangent.name = inp.name + '_tan'
+                tangents[inp] = tangent
+                tangentInputs.append(tangent)
+        zeros = {}
+        def tangentOf(var):
+            # arrays that do not depend on inputs have zero tangents
+            if var not in tangents:
+                if var.name not in zeros:
+                    zeros[var.name] = Zeros(var.shape, var.dtype)
+                    zeros[var.name].name = var.name + '_tan'
+                tangents[var] = zeros[var.name][var.index]
+            return tangents[var]
+
+        _outputs = [x for x in self._outputs if x is not None]
+        for op in graphTopologicalSort(_outputs, self._children.copy()):
+            if isinstance(op, TensorFunctionOp):
+                n = len(op.outputs)
+                _inputs, _outputs = op.args[:-n], op.args[-n:]
+                active = [x in tangents for x in _inputs]
+                func = op.func.getTangent(active)
+                args = [primals[x] for x in _inputs] + [tangents[x] for x in _inputs if x in tangents]
+                outputs = [primals[x] for x in _outputs] + [tangentOf(x) for x in _outputs if x.dtype == _dtype]
+                tangentOp = TensorFunctionOp(func, tuple(args), tuple(outputs), op.indices)
+                tangentOp.info = ['tangent'] + op.info
+                primals[op] = tangentOp.outputs[:n]
+                tangents[op] = dict(zip([index for index, x in enumerate(_outputs) if x.dtype == _dtype], tangentOp.outputs[n:]))
+            elif isinstance(op, FunctionOp):
+                raise Exception('no tangent for', op.name)
+            elif len(op.args) == 0:
+                primals[op] = op
+            elif isinstance(op.args[0], Variable):
+                parent = op.args[0]
+                primals[op] = primals[parent][op.index]
+                if parent in tangents:
+                    tangents[op] = tangents[parent][op.index]
+            else:
+                parent = op.args[0]
+                primals[op] = primals[parent][op.outputIndex]
+                if op.outputIndex in tangents[parent]:
+                    tangents[op] = tangents[parent][op.outputIndex]
+        outputs = [None if x is None else primals[x] for x in self._outputs]
+        outputs += [tangentOf(x) for x in self._outputs if x is not None and x.dtype == _dtype]
+        name = self.name + '_tangent'
+        if len(tangentInputs) < len([x for x in self._inputs if isinstance(x, Variable) and x.dtype == _dtype]):
+            name += '_' + ''.join([str(int(x in tangents)) for x in self._inputs])
+        return Function(name, self._inputs + tuple(tangentInputs), tuple(outputs), io_map=self._io_map)
+
+    def getHessianVector(self, inputs=None):
+        """Function computing the gradients and their directional
+        derivatives along the tangents of inputs, all the scalar array
+        inputs by default. It takes the inputs, the cotangents of the
+        outputs and the tangents and returns the gradients followed by the
+        Hessian vector products, the tangent of the recomputed adjoint.
+        Further calls with the same inputs return the same Function"""
+        if inputs is None:
+            inputs = [x for x in self._inputs if isinstance(x, Variable) and x.dtype == _dtype]
+        active = tuple([x.name for x in inputs])
+        if active in self._hessianVectors:
+            return self._hessianVectors[active]
+        adjoint = self.getAdjoint()
+        # only its graph is used, it is not compiled
+        adjoint.module.funcs.remove(adjoint)
+        self._hessianVectors[active] = adjoint.getTangent(inputs)
+        return self._hessianVectors[active]
+
+    def getBatched(self, shared=()):
+        """Function that runs this one on a batch of inputs in a single
+        call, the batched inputs and the outputs get a leading batch axis.
+        Inputs in shared, like connectivity, are the same for the whole
+        batch. The adjoint batched with its primal inputs shared takes a
+        block of cotangents"""
+        shared = set([x.name for x in shared])
+        batch = tuple([index for index, inp in enumerate(self._inputs) if isinstance(inp, Variable) and inp.name not in shared])
+        assert len(batch) > 0
+        assert len(self._io_map) == 0
+        assert not any([self._inputs[index].static for index in batch])
+        assert not any([out.static for out in self._outputs if out is not None])
+        # items write no tape, the tape of an adjoint is read as is
+        return Function('{}_batch'.format(self.name), self._inputs, self._outputs, leaves=self._leaves, batch=batch)
+
+    def getTapeMemory(self, sizes=None):
+        """Bytes the tape of the function holds, written by its calls or
+        read by an adjoint, sizes maps the names of symbolic leading
+        dimensions to their values"""
+        tape = OrderedDict(self._tape)
+        tape.update(self._leaves)
+        return _tapeBytes(tape.values(), sizes)
+
+    def _tapeId(self, arg):
+        return int(hashlib.md5('tape:{}'.format(arg.name).encode('utf-8')).hexdigest()[:15], 16)
 
     def _getName(self, op):
         if isinstance(op, int):
@@ -357,39 +900,119 @@ class Function(object):
     def _reuseId(self, index):
         return '{}_{}'.format(self.name, index)
         
+    def _planMemory(self, schedule, exclude):
+        # intermediates with disjoint live ranges share slots of the same
+        # dtype and number of rows, a slot is as wide as the widest array
+        # it holds. static arrays persist across calls and are not planned
+        plan = {}
+        slots = []
+        free = {}
+        for kind, arg in schedule:
+            if kind == 'allocate' and not (arg.name in exclude or arg.static):
+                key = (arg.dtype, self._getName(arg.shape[0]))
+                width = int(np.prod(arg.shape[1:]))
+                candidates = free.get(key, [])
+                fits = [slot for slot in candidates if slot.width >= width]
+                if len(fits) > 0:
+                    slot = min(fits, key=lambda x: x.width)
+                elif len(candidates) > 0:
+                    slot = max(candidates, key=lambda x: x.width)
+                    slot.width = width
+                else:
+                    slot = Container()
+                    slot.name = 'Slot_{}'.format(len(slots))
+                    slot.dtype = arg.dtype
+                    slot.shape = arg.shape[0]
+                    slot.width = width
+                    slot.vars = []
+                    slots.append(slot)
+                if slot in candidates:
+                    candidates.remove(slot)
+                slot.vars.append(arg.name)
+                plan[arg.name] = slot
+            elif kind == 'destroy' and arg.name in plan:
+                slot = plan[arg.name]
+                free.setdefault((slot.dtype, self._getName(slot.shape)), []).append(slot)
+        return plan, slots
+
+    def getPeakMemory(self, sizes=None):
+        """Bytes planned for the intermediates of a call, sizes maps the
+        names of symbolic leading dimensions to their values"""
+        sizes = sizes or {}
+        total = 0
+        for slot in self._memorySlots:
+            total += _rows(slot.shape, sizes)*slot.width*_itemsize(slot.dtype)
+        return total
+
+    def _fuseKernels(self, sortedOps, varChildren, exclude):
+        # consecutive kernels are fused pairwise, chains fold into the
+        # last kernel. maps ops to what is emitted in their place, None
+        # for kernels fused into a later one
+        fused = {}
+        prevOp, prevEmit = None, None
+        for op in sortedOps:
+            if not isinstance(op, FunctionOp):
+                continue
+            if isinstance(prevEmit, TensorFunctionOp):
+                emit = prevEmit.fuse(op, self._children, varChildren, exclude)
+                if emit is not None:
+                    fused[prevOp] = None
+                    fused[op] = emit
+                    prevOp, prevEmit = op, emit
+                    continue
+            prevOp, prevEmit = op, op
+        return fused
+
     def _genCode(self, outputs):
-        codeFile = Function.codeFile
-        codeFile.write('\nstatic PyObject* Function_{}(PyObject *self, PyObject *args, PyObject *kwargs) {{\n'.format(self.name))
-        codeFile.write('\tmap<string, int> options = PyOptions_Parse(kwargs);\n')
+        codeFile = self.module.codeFile
+        codeFile.write('\nstatic PyObject* Function_{}(PyObject *self, FUNCTION_ARGS) {{\n'.format(self.name))
+        codeFile.write('\tassert(FUNCTION_NARGS == {});\n'.format(len(self._inputs) + 1))
+        codeFile.write('\tinteger options = (integer) PyInt_AsLong(FUNCTION_ARG({}));\n'.format(len(self._inputs)))
         if config.profile:
-            codeFile.write('\tlong long start, end;\n')
+            codeFile.write('\tProfileTimer Profile_function = profile_start();\n')
+            codeFile.write('\tProfileTimer Profile_start;\n')
         #for out in self._outputs:
         #    memString += '{}* {}, '.format(out.dtype, out.name)
         memoryInit = {}
         keepMemory = {True: 'true', False: 'false'}[not config.gc]
-        codeFile.write('\tassert(PyTuple_Size(args) == {});\n'.format(len(self._inputs)))
         for index, inp in enumerate(self._inputs):
             if isinstance(inp, IntegerScalar):
-                codeFile.write('\tinteger {} = (integer) PyInt_AsLong(PyTuple_GetItem(args, {}));\n'.format(inp.name, index))
+                codeFile.write('\tinteger {} = (integer) PyInt_AsLong(FUNCTION_ARG({}));\n'.format(inp.name, index))
 
         for index, inp in enumerate(self._inputs):
             if isinstance(inp, IntegerScalar):
                 continue
             memoryInit[inp.name] = 1
-            codeFile.write('\tPyObject* Py_{} = PyTuple_GetItem(args, {});\n'.format(inp.name, index))
+            codeFile.write('\tPyObject* Py_{} = FUNCTION_ARG({});\n'.format(inp.name, index))
+            # static and reusable inputs are written, they are not converted
+            convert = {True: 'true', False: 'false'}[not (inp.static or index in self._io_map)]
+            codeFile.write('\tArrayRef Ref_{0}(getInput(Py_{0}, arrayType<{1}>(), "{2}:{3}", {4}));\n'.format(inp.name, inp.dtype, self.name, index, convert))
+            codeFile.write('\tif (Ref_{}.array == NULL) return NULL;\n'.format(inp.name))
             shape = ','.join([str(x) for x in inp.shape[1:]])
+            if index in self._batch:
+                # rows of all the batch, the loop body sees a view of one
+                codeFile.write('\t{}<{}, {}> Batch_{};\n'.format(self.arrType, inp.dtype, shape, inp.name))
+                codeFile.write('\tgetArray(Ref_{0}.array, Batch_{0}, {1}, 0L);\n'.format(inp.name, keepMemory))
+                continue
             codeFile.write('\t{}<{}, {}> {};\n'.format(self.arrType, inp.dtype, shape, inp.name))
             if index in self._io_map:
                 reuseId = self._reuseId(index)
-                codeFile.write('\tif (options["replace_reusable"] || {}.get_mem()->reuse.count("{}") == 0) {{\n'.format(inp.name, reuseId))
-                codeFile.write('\t\tgetArray((PyArrayObject*) Py_{0}, {0}, {2}, {1}L);\n'.format(inp.name, inp.staticId(), keepMemory))
+                codeFile.write('\tif ({} || {}.get_mem()->reuse.count("{}") == 0) {{\n'.format(self._option('replace_reusable'), inp.name, reuseId))
+                codeFile.write('\t\tgetArray(Ref_{0}.array, {0}, {2}, {1}L);\n'.format(inp.name, inp.staticId(), keepMemory))
                 codeFile.write('\t} else {\n')
                 codeFile.write('\t\t{}.reuse_acquire("{}", {}, {});\n'.format(inp.name, reuseId, self._getName(inp.shape[0]), keepMemory))
                 codeFile.write('\t}\n') 
             else:
-                codeFile.write('\tgetArray((PyArrayObject*) Py_{0}, {0}, {2}, {1}L);\n'.format(inp.name, inp.staticId(), keepMemory))
+                codeFile.write('\tgetArray(Ref_{0}.array, {0}, {2}, {1}L);\n'.format(inp.name, inp.staticId(), keepMemory))
         codeFile.write('\n')
 
+        if self._batch:
+            first = self._inputs[self._batch[0]]
+            codeFile.write('\tinteger batch = Batch_{}.shape/{};\n'.format(first.name, self._getName(first.shape[0])))
+            for out in outputs:
+                shape = ','.join([str(x) for x in out.shape[1:]])
+                codeFile.write('\t{}<{}, {}> Batch_{}(batch*{}, false, {}, 0L);\n'.format(self.arrType, out.dtype, shape, out.name, self._getName(out.shape[0]), keepMemory))
+
         varChildren = {}
         for op, off in self._children.items():
             name = op.name
@@ -398,45 +1021,136 @@ class Function(object):
             varChildren[name] += off
         inputNames = list(memoryInit.keys())
         outputNames = [out.name for out in outputs]
+        # taped arrays live in buffers shared by the forward and adjoint
+        # functions, they are never planned or released
+        tapeNames = list(self._tape.keys()) + list(self._leaves.keys())
+
+        sortedOps = graphTopologicalSort(outputs, self._children.copy(), self._leaves)
+        fused = {}
+        if config.fuse:
+            fused = self._fuseKernels(sortedOps, varChildren, inputNames + outputNames + tapeNames)
 
-        sortedOps = graphTopologicalSort(outputs, self._children.copy())
-        prevOp = Container()
-        prevOp.args = []
+        # order of allocations, calls and releases, arrays are allocated
+        # on first use and released after their last
+        schedule = []
+        allocated = set(inputNames)
+        if self._batch:
+            allocated.update(outputNames)
+        prevOps = []
+        waiting = False
         for op in sortedOps:
 
-            for arg in prevOp.args:
-                varName = arg.name
-                assert varChildren[varName] > 0
-                varChildren[varName] -= 1
-                if isinstance(arg, Variable) and varName not in outputNames and varChildren[varName] == 0:
-                    if varName in inputNames and ((not config.gpu) or arg.static):
+            # arguments of fused kernels are released after the fused
+            # kernel runs
+            if not waiting:
+                for prevOp in prevOps:
+                    if isinstance(prevOp, Variable) and prevOp.name in self._leaves:
                         continue
-                    codeFile.write('\t{}.destroy();\n'.format(varName))
+                    for arg in prevOp.args:
+                        varName = arg.name
+                        assert varChildren[varName] > 0
+                        varChildren[varName] -= 1
+                        if isinstance(arg, Variable) and varName not in outputNames and varChildren[varName] == 0:
+                            if varName in inputNames and ((not config.gpu) or arg.static):
+                                continue
+                            # never allocated, the kernels did not use it
+                            if varName not in allocated or varName in tapeNames:
+                                continue
+                            schedule.append(('destroy', arg))
+                prevOps = []
+            prevOps.append(op)
+            waiting = op in fused and fused[op] is None
+            op = fused.get(op, op)
+            if op is None:
+                continue
             
-            for arg in op.args:
-                varName = arg.name
-                if isinstance(arg, Variable) and varName not in memoryInit:
-                    shape = ','.join([str(x) for x in arg.shape[1:]])
-                    arrType = '{}<{}, {}>'.format(self.arrType, arg.dtype, shape)
-                    #codeFile.write('\t{} {}({}, true);\n'.format(arrType, varName, self._getName(arg.shape[0]))) 
-                    codeFile.write('\t{} {}({}, true, {}, {}L);\n'.format(arrType, varName, self._getName(arg.shape[0]), keepMemory, arg.staticId())) 
-                    memoryInit[varName] = 1
+            # structurally zero gradients that no kernel reads or writes
+            # are never allocated
+            if isinstance(op, FunctionOp):
+                for arg in op.usedArgs():
+                    if isinstance(arg, Variable) and arg.name not in allocated:
+                        schedule.append(('allocate', arg))
+                        allocated.add(arg.name)
+            schedule.append(('call', op))
+        for out in outputs:
+            if out.name not in allocated:
+                schedule.append(('allocate', out))
+                allocated.add(out.name)
+
+        invariant = []
+        if self._batch:
+            schedule, invariant = self._hoistBatch(schedule, outputNames)
+        plan, self._memorySlots = self._planMemory(schedule, inputNames + outputNames + tapeNames + invariant)
+
+        def allocate(arg, slotFile):
+            shape = ','.join([str(x) for x in arg.shape[1:]])
+            arrType = '{}<{}, {}>'.format(self.arrType, arg.dtype, shape)
+            if arg.name in plan:
+                slot = plan[arg.name]
+                if slot.name not in memoryInit:
+                    slotFile.write('\t{}<{}, {}> {}({}, false, {}, 0L);\n'.format(self.arrType, slot.dtype, slot.width, slot.name, self._getName(slot.shape), keepMemory))
+                    memoryInit[slot.name] = 1
+                codeFile.write('\t{} {}({}, (const {}*) {}.data);\n'.format(arrType, arg.name, self._getName(arg.shape[0]), arg.dtype, slot.name))
+                codeFile.write('\t{}.zero();\n'.format(arg.name))
+            elif arg.name in tapeNames:
+                codeFile.write('\t{} {}({}, true, {}, {}L);\n'.format(arrType, arg.name, self._getName(arg.shape[0]), keepMemory, self._tapeId(arg)))
+                # the forward function refills the tape on every call
+                if arg.name in self._tape:
+                    codeFile.write('\t{}.zero();\n'.format(arg.name))
+            else:
+                #codeFile.write('\t{} {}({}, true);\n'.format(arrType, varName, self._getName(arg.shape[0]))) 
+                codeFile.write('\t{} {}({}, true, {}, {}L);\n'.format(arrType, arg.name, self._getName(arg.shape[0]), keepMemory, arg.staticId())) 
+                if arg.static:
+                    self.module._state[('static', arg.name)] = (arrType, arg.dtype, arg.staticId())
+            memoryInit[arg.name] = 1
+
+        self._kernels = []
+        batchFile = None
+        for kind, op in schedule:
+            if kind == 'batch':
+                # slots are declared before the loop, once for the batch,
+                # the body is indented into the loop once generated
+                batchFile, codeFile = codeFile, StringIO()
+                codeFile.write('for (integer b = 0; b < batch; b++) {\n')
+                for index in self._batch:
+                    inp = self._inputs[index]
+                    shape = ','.join([str(x) for x in inp.shape[1:]])
+                    rows = self._getName(inp.shape[0])
+                    codeFile.write('\t{0}<{1}, {2}> {3}({4}, (const {1}*) &Batch_{3}(b*{4}));\n'.format(self.arrType, inp.dtype, shape, inp.name, rows))
+                # kernels accumulate straight into the batch outputs,
+                # zeroed item by item while in cache
+                for out in outputs:
+                    shape = ','.join([str(x) for x in out.shape[1:]])
+                    rows = self._getName(out.shape[0])
+                    codeFile.write('\t{0}<{1}, {2}> {3}({4}, (const {1}*) &Batch_{3}(b*{4}));\n'.format(self.arrType, out.dtype, shape, out.name, rows))
+                    codeFile.write('\t{}.zero();\n'.format(out.name))
+                continue
+            elif kind == 'allocate':
+                allocate(op, codeFile if batchFile is None else batchFile)
+                continue
+            elif kind == 'destroy':
+                # planned arrays are views of their slot
+                if op.name not in plan:
+                    codeFile.write('\t{}.destroy();\n'.format(op.name))
+                continue
 
             # fix garbage collection
             #for key, ref in memoryPool.items():
             #    if config.gc:
             #        codeFile.write('\t{}.destroy();\n'.format(ref.name))
 
-            if isinstance(op, TensorFunctionOp):
+            if isinstance(op, TensorFunctionOp) and len(op.usedArgs()) == 0:
+                codeFile.write('\t/* {} stores nothing */\n'.format(op.name))
+            elif isinstance(op, TensorFunctionOp):
                 codeFile.write('\t/* {} */\n'.format(op.info))
+                self._kernels.append(op)
 
                 #for index, inp in enumerate(op.args[:-len(op.outputs)]):
                 #    if not isinstance(inp.shape[0], int) and op.func._inputsUsed[index]:
                 #        codeFile.write('\tassert({}.shape >= ({} + {}));\n'.format(inp.name, _getName(op.indices), _getName(inp.index)))
                 name = self._getName(op.indices)
                 if config.profile:
-                    #codeFile.write('\tMPI_Barrier(MPI_COMM_WORLD);\n')
-                    codeFile.write('\tstart = current_timestamp();\n')
+                    codeFile.write('\tProfile_start = profile_start();\n')
                 if config.gpu:
                     #codeFile.write('\tinteger nBlocks = {}/GPU_THREADS_PER_BLOCK + 1;\n'.format(name))
                     #codeFile.write('\tdim3 blocks(nBlocks / GPU_MAX_BLOCKS + 1, min(nBlocks, GPU_MAX_BLOCKS));\n')
@@ -446,28 +1160,23 @@ class Function(object):
                     if config.profile:
                         codeFile.write('\tgpuErrorCheck(cudaDeviceSynchronize());\n')
                     codeFile.write('\tgpuErrorCheck(cudaPeekAtLastError());\n')
+                elif op.func._scatter == 'color':
+                    codeFile.write('\t{\n')
+                    codeFile.write('\t\tconst Coloring& coloring = {};\n'.format(op.getColoring(name)))
+                    codeFile.write('\t\t{}({}, {});\n'.format(op.name, name, op.getCallString()))
+                    codeFile.write('\t}\n')
                 else:
                     codeFile.write('\t{}({}, {});\n'.format(op.name, name, op.getCallString()))
                 if config.profile:
-                    #codeFile.write('\tMPI_Barrier(MPI_COMM_WORLD);\n')
-                    codeFile.write('\tend = current_timestamp();\n')
-                    codeFile.write('\tif (meshp->rank == 0) cout << "{} Kernel time: " << end-start << "us" << endl;\n'.format(op.name))
-                    
-                    codeFile.write('\t{\n')
-                    codeFile.write('\t\tdouble global, local;\n')
-                    codeFile.write('\t\tdouble local_time;\n')
-                    codeFile.write('\t\tlocal_time = (double)(end-start);\n')
-
-                    rate = '\t\tcout << "{} {}: " << global << endl;\n'
-                    for msg, nops in zip(['Mload bandwidth', 'Mstore bandwidth', 'Mflops'], [op.func._loads, op.func._stores, op.func._flops]):
-                        codeFile.write('\t\tglobal = 0;\n'.format(name, nops))
-                        codeFile.write('\t\tlocal = {}*{}/local_time;\n'.format(name, nops))
-                        codeFile.write('\t\tMPI_Reduce(&local, &global, 1, MPI_DOUBLE, MPI_SUM, 0, MPI_COMM_WORLD);\n')
-                        codeFile.write('\t\tif (meshp->rank == 0) ' +  rate.format(op.name, msg))
-                    codeFile.write('\t}\n')
+                    func = op.func
+                    self._genProfileStop(codeFile, op.name, 'kernel', name, func._loads, func._stores, func._flops)
             elif isinstance(op, ExternalFunctionOp):
                 op.arrType = self.arrType
+                if config.profile:
+                    codeFile.write('\tProfile_start = profile_start();\n')
                 codeFile.write('\t{}({});\n'.format(op.name, op.getCallString()))
+                if config.profile:
+                    self._genProfileStop(codeFile, op.name, 'external', 0)
             elif isinstance(op, Variable):
                 pass
             else:
@@ -477,127 +1186,214 @@ class Function(object):
             #    for arg in op.outputs:
             #        if isinstance(arg, Variable):
             #            codeFile.write('\tif ({}.checkNAN()) throw 20;\n'.format(arg.name))
-            prevOp = op
             
+        if self._batch:
+            body = codeFile.getvalue()
+            codeFile = batchFile
+            for line in body.splitlines(True):
+                codeFile.write('\t' + line if line.strip() else line)
+            codeFile.write('\t}\n')
+
         codeFile.write('\n\tPyObject* outputs = PyTuple_CreateNone({});\n'.format(len(outputs)))
         for index, out in enumerate(outputs):
-            if isinstance(out, Variable) and out.static:
-                codeFile.write('\tif (options["return_static"]) {\n');
+            if self._batch:
+                codeFile.write('\tPyTuple_SetItem(outputs, {}, putArray(Batch_{}, false));\n'.format(index, out.name))
+            elif isinstance(out, Variable) and out.static:
+                codeFile.write('\tif ({}) {{\n'.format(self._option('return_static')))
                 codeFile.write('\t\tPyTuple_SetItem(outputs, {}, putArray({}, false));\n'.format(index, out.name))
                 codeFile.write('\t}\n');
-                codeFile.write('\tif (options["zero_static"]) {\n');
+                codeFile.write('\tif ({}) {{\n'.format(self._option('zero_static')))
                 codeFile.write('\t\t{}.zero();\n'.format(out.name))
                 codeFile.write('\t}\n');
             elif index in self._io_map.values():
                 key =  list(self._io_map.keys())[list(self._io_map.values()).index(index)]
                 codeFile.write('\t{}.reuse_release("{}");\n'.format(out.name, self._reuseId(key)))
-                codeFile.write('\tif (options["return_reusable"]) {\n');
+                shape = ','.join([str(x) for x in out.shape[1:]])
+                self.module._state[('reuse', self.module.index, self._reuseId(key))] = ('{}<{}, {}>'.format(self.arrType, out.dtype, shape), out.dtype, self._reuseId(key))
+                codeFile.write('\tif ({}) {{\n'.format(self._option('return_reusable')))
                 codeFile.write('\t\tPyTuple_SetItem(outputs, {}, putArray({}, false));\n'.format(index, out.name))
                 codeFile.write('\t}\n');
             else:
                 codeFile.write('\tPyTuple_SetItem(outputs, {}, putArray({}, false));\n'.format(index, out.name))
+        if config.profile:
+            self._genProfileStop(codeFile, self.name, 'function', 0, start='Profile_function')
         if len(outputs) == 1:
-            codeFile.write('\treturn PyTuple_GetItem(outputs, 0);')
+            # the item is borrowed from the tuple, take a reference before releasing it
+            codeFile.write('\tPyObject* output = PyTuple_GetItem(outputs, 0);\n')
+            codeFile.write('\tPy_INCREF(output);\n')
+            codeFile.write('\tPy_DECREF(outputs);\n')
+            codeFile.write('\treturn output;')
         else:
             codeFile.write('\treturn outputs;')
         codeFile.write('\n')
         codeFile.write('}\n\n')
 
+    def _hoistBatch(self, schedule, outputNames):
+        """Split the schedule of a batched function into the calls that
+        do not depend on the batch item, run once before the loop, and
+        the loop body. Returns the schedule with a batch entry where the
+        loop starts and the names of the arrays computed once"""
+        variant = set([self._inputs[index].name for index in self._batch] + outputNames)
+        calls = [op for kind, op in schedule if kind == 'call' and isinstance(op, FunctionOp)]
+        changed = True
+        while changed:
+            changed = False
+            for op in calls:
+                written = [arg.name for arg in op.args[len(op.args)-len(op.outputs):]]
+                if any([arg.name in variant for arg in op.args]) and not variant.issuperset(written):
+                    variant.update(written)
+                    changed = True
+        before, loop = [], []
+        for kind, op in schedule:
+            if kind == 'call':
+                if not isinstance(op, FunctionOp) or any([arg.name in variant for arg in op.args]):
+                    loop.append((kind, op))
+                else:
+                    before.append((kind, op))
+            elif op.name in variant:
+                loop.append((kind, op))
+            # arrays computed once live until the function returns
+            elif kind == 'allocate':
+                before.append((kind, op))
+        invariant = [op.name for kind, op in before if kind == 'allocate']
+        return before + [('batch', None)] + loop, invariant
+
+    def _genProfileStop(self, codeFile, name, kind, n, loads=0, stores=0, flops=0, start='Profile_start'):
+        # the entry is looked up once, on the first call
+        codeFile.write('\t{\n')
+        codeFile.write('\t\tstatic ProfileEntry& entry = profile_entry("{}", "{}", {}, {}, {});\n'.format(name, kind, loads, stores, flops))
+        codeFile.write('\t\tprofile_stop(entry, {}, {});\n'.format(start, n))
+        codeFile.write('\t}\n')
+
     def _diff(self, outputs, inputs, gradients=None):
         children = self._children.copy()
         #print children.values()
         # TODO: better handling of None, change integer grad to None
-        def _diffFunc(out):
+        def _gradArgs(out):
             #assert children[out] == 0
+            if isinstance(out, Variable) and out.name in self._leaves:
+                return iter([])
             grads = out.grad(gradients[out])
             assert len(grads) == len(out.args)
-            for grad, inp in zip(grads, out.args):
-                if inp not in gradients:
-                    gradients[inp] = tuple()
-                if not isinstance(inp, Variable):
-                    gradients[inp] += (grad,)
-                else:
-                    gradients[inp] = (FunctionOp.get_cache(grad.name),)
-                children[inp] -= 1
-                if children[inp] == 0:
-                    _diffFunc(inp)
+            return iter(list(zip(grads, out.args)))
         for out in outputs:
-            if children[out] == 0:
-                _diffFunc(out)
+            if children[out] != 0:
+                continue
+            stack = [_gradArgs(out)]
+            while len(stack) > 0:
+                for grad, inp in stack[-1]:
+                    if inp not in gradients:
+                        gradients[inp] = tuple()
+                    if not isinstance(inp, Variable):
+                        gradients[inp] += (grad,)
+                    else:
+                        gradients[inp] = (FunctionOp.get_cache(grad.name),)
+                    children[inp] -= 1
+                    if children[inp] == 0:
+                        stack.append(_gradArgs(inp))
+                        break
+                else:
+                    stack.pop()
         #print children.values()
         #exit(1)
         #print(self.name, [len(gradients.get(inp, (None,))) for inp in inputs])
         #return [gradients.get(inp, (None,))[-1] for inp in inputs]
         return [gradients.get(inp, (None,))[0] for inp in inputs]
 
+    @classmethod
+    def _getOptions(cls, options):
+        mask = 0
+        for index, name in enumerate(cls.optionNames):
+            if options[name]:
+                mask |= 1 << index
+        return mask
+
+    def _option(self, name):
+        return '(options & {})'.format(1 << Function.optionNames.index(name))
+
+    def _interpreted(self):
+        if not config.compile:
+            return True
+        # a tiered module switches on a call that reads no tape, forward
+        # and adjoint Functions sharing one run in the same tier
+        module = self.module
+        if module.tier != 'interpreter' or (len(self._leaves) == 0 and module.tierUp(func=self)):
+            return False
+        module._tapes.update(self._tape)
+        return True
+
     def __call__(self, *args, **kwargs):
-        func = getattr(Function._module, self.name)
+        if self._batch:
+            return self._callBatch(args, kwargs)
+        if self._interpreted():
+            from . import interpreter
+            options = self.defaultOptions.copy()
+            options.update(kwargs)
+            return interpreter.run(self, args, options)
+        if kwargs:
+            options = self.defaultOptions.copy()
+            options.update(kwargs)
+            return self._func(*(args + (Function._getOptions(options),)))
+        return self._func(*(args + (self._options,)))
+
+    def _callBatch(self, args, kwargs):
+        batch = len(args[self._batch[0]])
         options = self.defaultOptions.copy()
         options.update(kwargs)
-        #print options
-        return func(*args, **options)
+        if self._interpreted():
+            # the interpreter runs the items one by one
+            from . import interpreter
+            results = []
+            for b in range(0, batch):
+                item = [x[b] if index in self._batch else x for index, x in enumerate(args)]
+                result = interpreter.run(self, item, options)
+                results.append(result if isinstance(result, tuple) else (result,))
+            outputs = [np.stack(x) for x in zip(*results)]
+        else:
+            args = list(args)
+            for index in self._batch:
+                x = np.asarray(args[index])
+                # the batch axis is merged into the rows, a copy unless contiguous
+                if not x.flags.c_contiguous:
+                    key = '{}:{}'.format(self.name, index)
+                    self.module._conversions[key] = self.module._conversions.get(key, 0) + 1
+                    x = np.ascontiguousarray(x)
+                assert x.shape[0] == batch
+                args[index] = x.reshape((-1,) + x.shape[2:])
+            result = self._func(*(args + [Function._getOptions(options)]))
+            if not isinstance(result, tuple):
+                result = (result,)
+            outputs = [x.reshape((batch, -1) + x.shape[1:]) for x in result]
+        if len(outputs) == 1:
+            return outputs[0]
+        return tuple(outputs)
 
-    @classmethod
-    def createCodeDir(cls, case, replace=True):
-        cls.codeDir = case + 'gencode/'
-        if replace:
-            if os.path.exists(cls.codeDir):
-                shutil.rmtree(cls.codeDir)
-            os.makedirs(cls.codeDir)
+    # the current module is reset, compiled and profiled
 
     @classmethod
     def reset(cls):
-        cls._module = None
-        cls.codeDir = None
-        cls.codeFile = StringIO()
-        cls.kernelCodeFile = StringIO()
-        cls.kernelHeaderFile = StringIO()
-        cls.funcs = []
-        cls.codeFile.write('#include "code.hpp"\n')
-        cls.kernelCodeFile.write('#include "code.hpp"\n')
-        cls._init = True
-        cls._index += 1
+        Module.current = Module()
 
     @classmethod
-    def compile(cls, case='./', init=True, replace=True, compiler_args={}):
-        if cls.codeDir is None:
-            cls.createCodeDir(case, replace=replace)
-
-        cls.codeFile.write("PyMethodDef ExtraMethods[] = {\n")
-        for name in Function.funcs:
-            cls.codeFile.write('\t{{"{0}",(PyCFunction)Function_{0}, METH_VARARGS | METH_KEYWORDS, "boo"}},\n'.format(name))
-        cls.codeFile.write("\n\t\t{NULL, NULL, 0, NULL}        /* Sentinel */\n\t};\n")
+    def compile(cls, case='./', init=True, replace=True, compiler_args={}, tiered=False):
+        Module.get().compile(case, init=init, replace=replace, compiler_args=compiler_args, tiered=tiered)
 
-        moduleName = 'graph_{}'.format(cls._index)
-        #moduleName = 'graph{}'.format(cls._index)
+    @classmethod
+    def initialize(cls, *args, **kwargs):
+        Module.current.initialize(*args, **kwargs)
 
-        if replace:
-            for name, string in zip(config.get_gen_sources(), [cls.codeFile, cls.kernelCodeFile, cls.kernelHeaderFile]):
-                with open (os.path.join(cls.codeDir, name), 'w') as f:
-                    string.seek(0)
-                    shutil.copyfileobj(string, f)
-                    string.close()
+    @classmethod
+    def getProfile(cls):
+        return Module.current.getProfile()
 
-            compile_gencode(cls.codeDir, moduleName, **compiler_args)
+    @classmethod
+    def resetProfile(cls):
+        Module.current.resetProfile()
 
-        sys.path.append(cls.codeDir)
-        while True:
-            import importlib
-            Function._module = importlib.import_module(moduleName)
-            try:
-                #Function._module = __import__(moduleName)
-                import importlib
-                Function._module = importlib.import_module(moduleName)
-                break
-            #except ImportError:
-            except NotImplemented:
-                time.sleep(1)
-                continue
-        
-        if init:
-            cls.initialize()
-        cls._init = False
+    @classmethod
+    def getConversions(cls):
+        return Module.current.getConversions()
 
     @classmethod
-    def initialize(cls, *args, **kwargs):
-        cls._module.initialize(*args, **kwargs)
+    def resetConversions(cls):
+        Module.current.resetConversions()
@@ -0,0 +1,73 @@
+from __future__ import print_function
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# the benchmarks import each other, and adpy from the checkout if it is
+# not installed, when run from any directory
+_here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _here)
+sys.path.append(os.path.dirname(_here))
+
+from adpy.variable import Variable, Function, Zeros, IntegerVariable
+from adpy.tensor import Kernel, Tensor
+from scatter import mesh
+
+def build(n, m, width):
+    u = Variable((n, width))
+    w = Variable((m, 1))
+    owner = IntegerVariable((m, 1))
+    neighbour = IntegerVariable((m, 1))
+
+    def flux(u, w, owner, neighbour):
+        uf = (u.extract(owner) + u.extract(neighbour))*0.5*w
+        return Tensor.collate(uf, owner, -uf, neighbour)
+
+    def norm(r):
+        return r.dot(r).sum()
+
+    r = Kernel(flux)(m, (Zeros((n, width)),))(u, w, owner, neighbour)
+    s = Kernel(norm)(n, (Zeros((1, 1)),))(r)
+    f = Function('batch', (u, w, owner, neighbour), (s,))
+    g = f.getAdjoint()
+    # parameter sets batched, connectivity shared
+    fb = f.getBatched(shared=(owner, neighbour))
+    gb = g.getBatched(shared=(u, w, owner, neighbour))
+    Function.compile()
+    return f, g, fb, gb
+
+def timeit(func, repeat):
+    func()
+    start = time.time()
+    for i in range(0, repeat):
+        func()
+    return (time.time()-start)/repeat
+
+def main():
+    parser = argparse.ArgumentParser(description='k calls of a Function against one batched call, primal and multi-cotangent adjoint')
+    parser.add_argument('--cells', type=int, default=10, help='cells along each side of the mesh')
+    parser.add_argument('--width', type=int, default=3)
+    parser.add_argument('-k', type=int, nargs='+', default=[1, 8, 64])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    owner, neighbour = mesh(args.cells)
+    n, m = args.cells**3, owner.shape[0]
+    f, g, fb, gb = build(n, m, args.width)
+
+    print('{} cells, {} faces, width = {}'.format(n, m, args.width))
+    print('{:>6s} {:>10s} {:>10s} {:>12s} {:>12s}'.format('k', 'loop ms', 'batch ms', 'adj loop ms', 'adj batch ms'))
+    for k in args.k:
+        ur = np.random.rand(k, n, args.width)
+        wr = np.random.rand(k, m, 1)
+        sg = np.random.rand(k, 1, 1)
+        loop = timeit(lambda: [f(ur[b], wr[b], owner, neighbour) for b in range(0, k)], args.repeat)
+        batch = timeit(lambda: fb(ur, wr, owner, neighbour), args.repeat)
+        gloop = timeit(lambda: [g(ur[0], wr[0], owner, neighbour, sg[b]) for b in range(0, k)], args.repeat)
+        gbatch = timeit(lambda: gb(ur[0], wr[0], owner, neighbour, sg), args.repeat)
+        print('{:6d} {:10.3f} {:10.3f} {:12.3f} {:12.3f}'.format(k, loop*1e3, batch*1e3, gloop*1e3, gbatch*1e3))
+
+if __name__ == '__main__':
+    main()
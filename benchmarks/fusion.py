@@ -0,0 +1,66 @@
+from __future__ import print_function
+import time
+import argparse
+import numpy as np
+
+from adpy import config
+from adpy.variable import Variable, Function
+from adpy.tensor import Kernel
+
+def build(name, n, kernels, width):
+    a = Variable((n, width))
+    b = Variable((n, width))
+
+    def step(x, b):
+        return x*b + x.dot(b)*0.5
+
+    x = a
+    for i in range(0, kernels):
+        x = Kernel(step)()(x, b)
+    f = Function(name, (a, b), (x,))
+    g = f.getAdjoint()
+    Function.compile()
+    return f, g
+
+def traffic(func, n):
+    # bytes loaded and stored by the kernels of a Function per call
+    return sum([(op.func._loads + op.func._stores)*n for op in func._kernels])
+
+def timeit(func, args, repeat):
+    func(*args)
+    start = time.time()
+    for i in range(0, repeat):
+        func(*args)
+    return (time.time()-start)/repeat
+
+def main():
+    parser = argparse.ArgumentParser(description='memory traffic and call time of a chain of elementwise kernels with and without fusion')
+    parser.add_argument('-n', type=int, default=10**6)
+    parser.add_argument('--kernels', type=int, default=8)
+    parser.add_argument('--width', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    n, width = args.n, args.width
+    ar = np.random.rand(n, width)
+    br = np.random.rand(n, width)
+    gr = np.random.rand(n, width)
+    results = {}
+    for fuse in [False, True]:
+        config.fuse = fuse
+        name = 'fusion_{}'.format(int(fuse))
+        f, g = build(name, n, args.kernels, width)
+        results[fuse] = [len(f._kernels), traffic(f, n), timeit(f, (ar, br), args.repeat),
+                         len(g._kernels), traffic(g, n), timeit(g, (ar, br, gr), args.repeat)]
+
+    print('{} kernels, n = {}, width = {}'.format(args.kernels, n, width))
+    print('{:8s} {:>8s} {:>12s} {:>10s} {:>8s} {:>12s} {:>10s}'.format('fuse', 'kernels', 'MB', 'ms', 'adj', 'adj MB', 'adj ms'))
+    for fuse in [False, True]:
+        k, b, t, gk, gb, gt = results[fuse]
+        print('{:8s} {:8d} {:12.1f} {:10.2f} {:8d} {:12.1f} {:10.2f}'.format(str(fuse), k, b/1e6, t*1e3, gk, gb/1e6, gt*1e3))
+    saved = 1 - float(results[True][1])/results[False][1]
+    gsaved = 1 - float(results[True][4])/results[False][4]
+    print('traffic saved: {:.0f}% primal, {:.0f}% adjoint'.format(saved*100, gsaved*100))
+
+if __name__ == '__main__':
+    main()
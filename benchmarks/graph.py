@@ -0,0 +1,90 @@
+from __future__ import print_function
+import sys
+import time
+import argparse
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from adpy.scalar import Scalar, OpBase
+from adpy.variable import Variable, Function, graphGetChildren, graphTopologicalSort
+from adpy.tensor import Kernel, Tensor, TensorFunction
+
+def build(nodes):
+    a = Tensor((1,))
+    b = Tensor((1,))
+    x, y = a.scalars[0], b.scalars[0]
+    # every step adds a multiplication and an addition node
+    for i in range(0, nodes//2):
+        x = x*y + x
+    return [a, b], Tensor((1,), [x])
+
+def kernel(steps):
+    # small tensor algebra, the common case for kernels
+    def func(a, b):
+        x = a
+        for i in range(0, steps):
+            x = x.matmul(a) + x.transpose()*x.tensordot(b).dot(b)
+        return x
+
+    a = Variable((100, 3, 3))
+    b = Variable((100, 3))
+    return Kernel(func)()(a, b)
+
+def peakMemory():
+    if resource is None:
+        return float('nan')
+    # kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024.
+
+def main():
+    parser = argparse.ArgumentParser(description='graph construction and differentiation of deep scalar DAGs')
+    parser.add_argument('--nodes', type=int, default=10**6)
+    parser.add_argument('--steps', type=int, default=40, help='matrix products of the kernel workload')
+    args = parser.parse_args()
+
+    timings = []
+    def record(name, start):
+        timings.append((name, time.time()-start))
+
+    # tracing a kernel on (3,3) tensors generates its code and adjoint
+    Function.reset()
+    start = time.time()
+    op = kernel(args.steps).args[0]
+    record('Kernel', start)
+    start = time.time()
+    op.func._getAdjoint()
+    record('Kernel._getAdjoint', start)
+    Function.reset()
+
+    start = time.time()
+    inputs, output = build(args.nodes)
+    record('build', start)
+
+    outputs = output.scalars
+    start = time.time()
+    children, _ = graphGetChildren(outputs)
+    record('graphGetChildren', start)
+
+    start = time.time()
+    sortedOps = graphTopologicalSort(outputs, children.copy())
+    record('graphTopologicalSort', start)
+    assert len(sortedOps) >= args.nodes
+
+    Function.reset()
+    start = time.time()
+    func = TensorFunction('deep', inputs, [output], grad=False)
+    record('TensorFunction', start)
+
+    start = time.time()
+    grad = func._getAdjoint()
+    record('TensorFunction._getAdjoint', start)
+    Function.reset()
+
+    print('nodes: {}, recursion limit: {}, peak memory: {:.0f}MB'.format(len(sortedOps), sys.getrecursionlimit(), peakMemory()))
+    for name, elapsed in timings:
+        print('{:30s} {:8.3f}s'.format(name, elapsed))
+
+if __name__ == '__main__':
+    main()
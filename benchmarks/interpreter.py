@@ -0,0 +1,78 @@
+from __future__ import print_function
+import time
+import argparse
+import numpy as np
+
+from adpy import config
+from adpy.variable import Variable, Function, Zeros, IntegerVariable
+from adpy.tensor import Kernel, Tensor
+
+def build(name, n, m, width, tiered=False):
+    u = Variable((n, width))
+    w = Variable((m, 1))
+    owner = IntegerVariable((m, 1))
+
+    def flux(u, w, owner):
+        uf = u.extract(owner)*w
+        return Tensor.collate((uf.dot(uf) + 1).sqrt()*uf, owner)
+
+    def norm(r):
+        return r.dot(r).sum()
+
+    r = Kernel(flux)(m, (Zeros((n, width)),))(u, w, owner)
+    s = Kernel(norm)(n, (Zeros((1, 1)),))(r)
+    f = Function(name, (u, w, owner), (r, s))
+    g = f.getAdjoint()
+    start = time.time()
+    Function.compile(tiered=tiered)
+    return f, g, time.time()-start
+
+def timeit(func, args, repeat):
+    func(*args)
+    start = time.time()
+    for i in range(0, repeat):
+        func(*args)
+    return (time.time()-start)/repeat
+
+def main():
+    parser = argparse.ArgumentParser(description='build time and call time of the numpy interpreter and the compiled module, and the tier-up of a tiered compile')
+    parser.add_argument('-n', type=int, default=10**5)
+    parser.add_argument('--width', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    n, m = args.n, 3*args.n
+    ur = np.random.rand(n, args.width)
+    wr = np.random.rand(m, 1)
+    owner = np.random.randint(0, n, (m, 1)).astype(np.int32)
+    rg = np.random.rand(n, args.width)
+    sg = np.ones((1, 1))
+    inputs = (ur, wr, owner)
+
+    results = {}
+    for compiled in [False, True]:
+        config.compile = compiled
+        f, g, build_time = build('interpreter_{}'.format(int(compiled)), n, m, args.width)
+        results[compiled] = [build_time, timeit(f, inputs, args.repeat), timeit(g, inputs + (rg, sg), args.repeat), f(*inputs)]
+
+    error = max([np.abs(x - y).max() for x, y in zip(results[False][3], results[True][3])])
+    print('n = {}, width = {}, max error = {:.2e}'.format(n, args.width, error))
+    print('{:12s} {:>10s} {:>10s} {:>10s}'.format('backend', 'build s', 'ms', 'adj ms'))
+    for compiled in [False, True]:
+        build_time, t, gt, _ = results[compiled]
+        name = {False: 'interpreter', True: 'compiled'}[compiled]
+        print('{:12s} {:10.2f} {:10.2f} {:10.2f}'.format(name, build_time, t*1e3, gt*1e3))
+
+    # calls are interpreted until the module compiled in the background is loaded
+    start = time.time()
+    f, g, _ = build('interpreter_tiered', n, m, args.width, tiered=True)
+    f(*inputs)
+    first = time.time()-start
+    calls = 1
+    while f.module.tier == 'interpreter':
+        f(*inputs)
+        calls += 1
+    print('tiered: first result after {:.2f}s, compiled after {:.2f}s and {} calls'.format(first, time.time()-start, calls))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+from __future__ import print_function
+import time
+import argparse
+import numpy as np
+
+from adpy import config
+from adpy.variable import Variable, Function, Zeros, StaticIntegerVariable
+from adpy.tensor import Kernel, Tensor
+
+strategies = ['atomic', 'private', 'color']
+
+def mesh(cells):
+    # internal faces of a structured hexahedral mesh, owner cells have
+    # the lower index like in OpenFOAM
+    index = np.arange(0, cells**3).reshape((cells, cells, cells))
+    owner, neighbour = [], []
+    for axis in range(0, 3):
+        lower = [slice(None)]*3
+        upper = [slice(None)]*3
+        lower[axis] = slice(0, -1)
+        upper[axis] = slice(1, None)
+        owner.append(index[tuple(lower)].flatten())
+        neighbour.append(index[tuple(upper)].flatten())
+    owner, neighbour = np.concatenate(owner), np.concatenate(neighbour)
+    order = np.lexsort((neighbour, owner))
+    return owner[order].reshape(-1, 1).astype(np.int32), neighbour[order].reshape(-1, 1).astype(np.int32)
+
+def build(n, m, width):
+    u = Variable((n, width))
+    w = Variable((m, 1))
+    # static connectivity, colorings are computed on the first call only
+    owner = StaticIntegerVariable((m, 1))
+    neighbour = StaticIntegerVariable((m, 1))
+
+    def flux(u, w, owner, neighbour):
+        uf = (u.extract(owner) + u.extract(neighbour))*0.5*w
+        return Tensor.collate(uf, owner, -uf, neighbour)
+
+    funcs = {}
+    for scatter in strategies:
+        r = Kernel(flux, scatter=scatter)(m, (Zeros((n, width)),))(u, w, owner, neighbour)
+        f = Function('scatter_{}'.format(scatter), (u, w, owner, neighbour), (r,))
+        funcs[scatter] = f, f.getAdjoint()
+    Function.compile()
+    return funcs
+
+def timeit(func, args, repeat):
+    func(*args)
+    start = time.time()
+    for i in range(0, repeat):
+        func(*args)
+    return (time.time()-start)/repeat
+
+def main():
+    parser = argparse.ArgumentParser(description='call time of the scatter strategies of Collate under openmp on mesh connectivity')
+    parser.add_argument('--cells', type=int, default=60, help='cells along each side of the mesh')
+    parser.add_argument('--width', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    owner, neighbour = mesh(args.cells)
+    n, m = args.cells**3, owner.shape[0]
+    config.openmp = True
+    funcs = build(n, m, args.width)
+
+    ur = np.random.rand(n, args.width)
+    wr = np.random.rand(m, 1)
+    rg = np.random.rand(n, args.width)
+    inputs = (ur, wr, owner, neighbour)
+    reference = funcs['atomic'][0](*inputs)
+    print('{} cells, {} faces, width = {}'.format(n, m, args.width))
+    print('{:8s} {:>10s} {:>10s} {:>12s} {:>14s}'.format('scatter', 'ms', 'adj ms', 'max error', 'deterministic'))
+    for scatter in strategies:
+        f, g = funcs[scatter]
+        r = f(*inputs)
+        error = np.abs(r - reference).max()
+        deterministic = all([(f(*inputs) == r).all() for i in range(0, 3)])
+        t = timeit(f, inputs, args.repeat)
+        gt = timeit(g, inputs + (rg,), args.repeat)
+        print('{:8s} {:10.2f} {:10.2f} {:12.2e} {:>14s}'.format(scatter, t*1e3, gt*1e3, error, str(deterministic)))
+
+if __name__ == '__main__':
+    main()
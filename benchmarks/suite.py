@@ -0,0 +1,212 @@
+from __future__ import print_function
+import os
+import sys
+import time
+import json
+import platform
+import argparse
+import tempfile
+import shutil
+import numpy as np
+from timeit import default_timer
+
+# the benchmarks import each other, and adpy from the checkout if it is
+# not installed, when run from any directory
+_here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _here)
+sys.path.append(os.path.dirname(_here))
+
+from adpy import config
+from adpy.variable import Variable, Function, Zeros, IntegerVariable
+from adpy.tensor import Kernel, Tensor
+from scatter import mesh
+
+# every workload builds the Functions for n rows of the given width and
+# returns them with their arguments, the adjoint is None if not timed
+
+def elementwise(n, width):
+    a = Variable((n, width))
+    b = Variable((n, width))
+
+    def func(a, b):
+        return 2*a*b + a/(b + 1) - (a*a + 1).sqrt()
+
+    x = Kernel(func)()(a, b)
+    f = Function('suite_elementwise', (a, b), (x,))
+    ar, br = np.random.rand(n, width), np.random.rand(n, width)
+    return (f, (ar, br)), None
+
+def matmul(n, width):
+    a = Variable((n, 3, 3))
+    b = Variable((n, 3))
+
+    def func(a, b):
+        return a.tensordot(b), a.matmul(a)
+
+    x, y = Kernel(func)()(a, b)
+    f = Function('suite_matmul', (a, b), (x, y))
+    ar, br = np.random.rand(n, 3, 3), np.random.rand(n, 3)
+    return (f, (ar, br)), None
+
+def connectivity(n, width):
+    cells = max(int(round(n**(1./3))), 2)
+    owner, neighbour = mesh(cells)
+    n, m = cells**3, owner.shape[0]
+    u = Variable((n, width))
+    w = Variable((m, 1))
+    o = IntegerVariable((m, 1))
+    nb = IntegerVariable((m, 1))
+
+    def func(u, w, o, nb):
+        uf = (u.extract(o) + u.extract(nb))*0.5*w
+        return Tensor.collate(uf, o, -uf, nb)
+
+    r = Kernel(func)(m, (Zeros((n, width)),))(u, w, o, nb)
+    f = Function('suite_connectivity', (u, w, o, nb), (r,))
+    return (f, (np.random.rand(n, width), np.random.rand(m, 1), owner, neighbour)), None
+
+def reduction(n, width):
+    a = Variable((n, width))
+
+    def func(a):
+        return a.dot(a).sum(), a.dot(a).reduce_max()
+
+    x, y = Kernel(func)(n, (Zeros((1, 1)), Zeros((1, 1))))(a)
+    f = Function('suite_reduction', (a,), (x, y))
+    return (f, (np.random.rand(n, width),)), None
+
+def chain(n, width, kernels=4):
+    a = Variable((n, width))
+    b = Variable((n, width))
+
+    def step(x, b):
+        return x*b + x.dot(b)*0.5
+
+    x = a
+    for i in range(0, kernels):
+        x = Kernel(step)()(x, b)
+    s = Kernel(lambda x: x.dot(x).sum())(n, (Zeros((1, 1)),))(x)
+    f = Function('suite_chain', (a, b), (s,))
+    g = f.getAdjoint()
+    ar, br = np.random.rand(n, width), np.random.rand(n, width)
+    return (f, (ar, br)), (g, (ar, br, np.ones((1, 1))))
+
+def overhead(n, width):
+    # small boundary Functions, the call costs more than the kernel
+    a = Variable((n, width))
+    x = Kernel(lambda a: a*2)()(a)
+    f = Function('suite_overhead', (a,), (x,))
+    return (f, (np.random.rand(n, width),)), None
+
+# widths and sizes swept for each workload, matmul works on (3,3)
+# tensors only, sizes of None are given on the command line
+workloads = [('elementwise', elementwise, [1, 3], None),
+             ('matmul', matmul, [3], None),
+             ('connectivity', connectivity, [1, 3], None),
+             ('reduction', reduction, [1, 3], None),
+             ('chain', chain, [3], None),
+             ('overhead', overhead, [1], [1]),
+            ]
+
+def timeit(func, args, repeat):
+    func(*args)
+    times = []
+    for i in range(0, repeat):
+        start = default_timer()
+        func(*args)
+        times.append(default_timer()-start)
+    return min(times)
+
+def run(name, builder, n, width, repeat, case):
+    result = {'workload': name, 'n': n, 'width': width}
+    start = time.time()
+    (f, inputs), adjoint = builder(n, width)
+    result['build'] = time.time()-start
+    Function.compile(case=case)
+    result.update(f.module.buildTimes)
+    result['call'] = timeit(f, inputs, repeat)
+    # options given as keywords take the slower path
+    result['call_options'] = timeit(lambda *args: f(*args, return_static=True), inputs, repeat)
+    if adjoint is not None:
+        g, adjointInputs = adjoint
+        result['adjoint'] = timeit(g, adjointInputs, repeat)
+    return result
+
+def environment():
+    return {'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'openmp': config.openmp,
+            'vectorize': config.vectorize,
+            'fuse': config.fuse,
+            'optimize': config.optimize,
+           }
+
+def compare(results, baseline, threshold, minTime):
+    """Print the ratios of the timings to the baseline, return the
+    timings that are slower by more than threshold"""
+    base = dict([((x['workload'], x['n'], x['width']), x) for x in baseline['results']])
+    metrics = ['build', 'codegen', 'compile', 'load', 'call', 'call_options', 'adjoint']
+    regressions = []
+    print('{:14s} {:>8s} {:>6s} {:>8s} {:>12s} {:>12s} {:>8s}'.format('workload', 'n', 'width', 'metric', 'baseline', 'current', 'ratio'))
+    for result in results:
+        key = (result['workload'], result['n'], result['width'])
+        if key not in base:
+            continue
+        for metric in metrics:
+            if metric not in result or metric not in base[key]:
+                continue
+            old, new = base[key][metric], result[metric]
+            # too short to compare reliably
+            if max(old, new) < minTime:
+                continue
+            ratio = new/max(old, 1e-12)
+            flag = ''
+            if ratio > 1 + threshold:
+                regressions.append(key + (metric,))
+                flag = ' *'
+            print('{:14s} {:8d} {:6d} {:>8s} {:12.6f} {:12.6f} {:8.2f}{}'.format(key[0], key[1], key[2], metric, old, new, ratio, flag))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='graph construction, code generation, compilation, loading and call times of representative workloads')
+    parser.add_argument('--workloads', nargs='+', default=[x[0] for x in workloads], choices=[x[0] for x in workloads])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10**4, 10**5])
+    parser.add_argument('--widths', nargs='+', type=int, default=None, help='overrides the widths of each workload')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--cache', action='store_true', help='reuse compiled modules, compile times are cold otherwise')
+    parser.add_argument('-o', '--output', help='write the results as json')
+    parser.add_argument('--compare', help='json results of a baseline run')
+    parser.add_argument('--threshold', type=float, default=0.2, help='relative slowdown reported as a regression')
+    parser.add_argument('--min-time', type=float, default=1e-5, help='timings in seconds below which no comparison is made')
+    args = parser.parse_args()
+
+    config.cache = args.cache
+    case = tempfile.mkdtemp(prefix='adpy_suite_') + '/'
+    results = []
+    try:
+        for name, builder, widths, sizes in workloads:
+            if name not in args.workloads:
+                continue
+            for width in (args.widths or widths):
+                for n in (sizes or args.sizes):
+                    result = run(name, builder, n, width, args.repeat, case)
+                    results.append(result)
+                    print('{workload:14s} n = {n:8d} width = {width}: build {build:.3f}s, codegen {codegen:.3f}s, compile {compile:.2f}s, load {load:.3f}s, call {0:.1f}us'.format(result['call']*1e6, **result))
+    finally:
+        shutil.rmtree(case, ignore_errors=True)
+
+    output = {'environment': environment(), 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=4, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_time)
+        if len(regressions) > 0:
+            print('{} regressions over {:.0f}%'.format(len(regressions), args.threshold*100))
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
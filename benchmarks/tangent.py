@@ -0,0 +1,81 @@
+from __future__ import print_function
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# the benchmarks import each other, and adpy from the checkout if it is
+# not installed, when run from any directory
+_here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _here)
+sys.path.append(os.path.dirname(_here))
+
+from adpy.variable import Variable, Function, Zeros, IntegerVariable
+from adpy.tensor import Kernel, Tensor
+from scatter import mesh
+
+def build(n, m, width):
+    u = Variable((n, width))
+    w = Variable((m, 1))
+    owner = IntegerVariable((m, 1))
+    neighbour = IntegerVariable((m, 1))
+
+    def flux(u, w, owner, neighbour):
+        uf = (u.extract(owner) + u.extract(neighbour))*0.5*w
+        return Tensor.collate(uf, owner, -uf, neighbour)
+
+    def norm(r):
+        return r.dot(r).sum()
+
+    r = Kernel(flux)(m, (Zeros((n, width)),))(u, w, owner, neighbour)
+    s = Kernel(norm)(n, (Zeros((1, 1)),))(r)
+    f = Function('tangent', (u, w, owner, neighbour), (s,))
+    g = f.getAdjoint()
+    # a few parameters, the face weights
+    t = f.getTangent((w,))
+    h = f.getHessianVector((u,))
+    Function.compile()
+    return f, g, t, h
+
+def timeit(func, repeat):
+    func()
+    start = time.time()
+    for i in range(0, repeat):
+        func()
+    return (time.time()-start)/repeat
+
+def main():
+    parser = argparse.ArgumentParser(description='directional derivative with the tangent against the adjoint, Hessian vector product against finite differences of adjoints')
+    parser.add_argument('--cells', type=int, default=30, help='cells along each side of the mesh')
+    parser.add_argument('--width', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    owner, neighbour = mesh(args.cells)
+    n, m = args.cells**3, owner.shape[0]
+    f, g, t, h = build(n, m, args.width)
+    ur = np.random.rand(n, args.width)
+    wr = np.random.rand(m, 1)
+    wv = np.random.rand(m, 1)
+    uv = np.random.rand(n, args.width)
+    sg = np.ones((1, 1))
+
+    sd = t(ur, wr, owner, neighbour, wv)[1]
+    wg = g(ur, wr, owner, neighbour, np.ones((1, 1)))[1]
+    print('{} cells, {} faces, width = {}, relative difference = {:.2e}'.format(n, m, args.width, abs(sd[0,0] - (wg*wv).sum())/abs(sd[0,0])))
+    primal = timeit(lambda: f(ur, wr, owner, neighbour), args.repeat)
+    tangent = timeit(lambda: t(ur, wr, owner, neighbour, wv), args.repeat)
+    adjoint = timeit(lambda: g(ur, wr, owner, neighbour, sg), args.repeat)
+    eps = 1e-6
+    fd = lambda: (g(ur + eps*uv, wr, owner, neighbour, sg)[0] - g(ur, wr, owner, neighbour, sg)[0])/eps
+    hvp = timeit(lambda: h(ur, wr, owner, neighbour, sg, uv), args.repeat)
+    hvpfd = timeit(fd, args.repeat)
+    # gradients of all the inputs, then the products for u and w
+    hv = h(ur, wr, owner, neighbour, sg, uv)[4]
+    print('Hessian vector product relative difference to finite differences = {:.2e}'.format(np.abs(hv - fd()).max()/np.abs(hv).max()))
+    print('{:>10s} {:>10s} {:>10s} {:>10s} {:>10s}'.format('primal ms', 'tangent ms', 'adjoint ms', 'hvp ms', 'fd hvp ms'))
+    print('{:10.3f} {:10.3f} {:10.3f} {:10.3f} {:10.3f}'.format(primal*1e3, tangent*1e3, adjoint*1e3, hvp*1e3, hvpfd*1e3))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+#include "code.hpp"
+
+static PyObject* Function_test_input_conversion(PyObject *self, FUNCTION_ARGS) {
+	assert(FUNCTION_NARGS == 4);
+	integer options = (integer) PyInt_AsLong(FUNCTION_ARG(3));
+	PyObject* Py_Variable_659 = FUNCTION_ARG(0);
+	ArrayRef Ref_Variable_659(getInput(Py_Variable_659, arrayType<scalar>(), "test_input_conversion:0"));
+	if (Ref_Variable_659.array == NULL) return NULL;
+	arrType<scalar, 3> Variable_659;
+	getArray(Ref_Variable_659.array, Variable_659, true, 0L);
+	PyObject* Py_Variable_660 = FUNCTION_ARG(1);
+	ArrayRef Ref_Variable_660(getInput(Py_Variable_660, arrayType<scalar>(), "test_input_conversion:1"));
+	if (Ref_Variable_660.array == NULL) return NULL;
+	arrType<scalar, 1> Variable_660;
+	getArray(Ref_Variable_660.array, Variable_660, true, 0L);
+	PyObject* Py_Variable_661 = FUNCTION_ARG(2);
+	ArrayRef Ref_Variable_661(getInput(Py_Variable_661, arrayType<integer>(), "test_input_conversion:2"));
+	if (Ref_Variable_661.array == NULL) return NULL;
+	arrType<integer, 1> Variable_661;
+	getArray(Ref_Variable_661.array, Variable_661, true, 0L);
+
+	arrType<scalar, 3> Variable_662(20, true, true, 0L);
+	/* ['tests.py:848:test_input_conversion', 'python.py:167:pytest_pyfunc_call', '_callers.py:121:_multicall', '_manager.py:120:_hookexec', '_hooks.py:512:__call__', 'python.py:1707:runtest', 'runner.py:184:pytest_runtest_call', '_callers.py:121:_multicall', '_manager.py:120:_hookexec', '_hooks.py:512:__call__', 'runner.py:250:<lambda>', 'runner.py:361:from_call', 'runner.py:249:call_and_report', 'runner.py:139:runtestprotocol', 'runner.py:118:pytest_runtest_protocol', '_callers.py:121:_multicall', '_manager.py:120:_hookexec', '_hooks.py:512:__call__', 'main.py:408:pytest_runtestloop', '_callers.py:121:_multicall', '_manager.py:120:_hookexec', '_hooks.py:512:__call__', 'main.py:384:_main', 'main.py:330:wrap_session', 'main.py:377:pytest_cmdline_main', '_callers.py:121:_multicall', '_manager.py:120:_hookexec', '_hooks.py:512:__call__', '__init__.py:229:_main', '__init__.py:253:_console_main', '__main__.py:9:<module>', '<frozen runpy>:88:_run_code', '<frozen runpy>:198:_run_module_as_main'] */
+	Function_3c73e81675fdbcbd(20, &Variable_659(0), &Variable_660(0), &Variable_661(0), &Variable_662(0));
+
+	PyObject* outputs = PyTuple_CreateNone(1);
+	PyTuple_SetItem(outputs, 0, putArray(Variable_662, false));
+	PyObject* output = PyTuple_GetItem(outputs, 0);
+	Py_INCREF(output);
+	Py_DECREF(outputs);
+	return output;
+}
+
+PyMethodDef ExtraMethods[] = {
+	{"test_input_conversion",(PyCFunction)(void(*)(void))Function_test_input_conversion, FUNCTION_FLAGS, "boo"},
+
+		{NULL, NULL, 0, NULL}        /* Sentinel */
+	};
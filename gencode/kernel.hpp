@@ -0,0 +1,4 @@
+
+void Function_3c73e81675fdbcbd(int n, const scalar* __restrict__ Tensor_518, const scalar* __restrict__ Tensor_519, const integer* __restrict__ Tensor_520, scalar* __restrict__ Tensor_522);
+
+void Function_3c73e81675fdbcbd_grad(int n, const scalar* __restrict__ Tensor_518, const scalar* __restrict__ Tensor_519, const integer* __restrict__ Tensor_520, const scalar* __restrict__ Tensor_523, scalar* __restrict__ Tensor_524, scalar* __restrict__ Tensor_525);
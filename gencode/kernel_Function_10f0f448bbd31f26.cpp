@@ -0,0 +1,23 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_10f0f448bbd31f26(int n, const scalar* __restrict__ Tensor_133, const scalar* __restrict__ Tensor_134, scalar* __restrict__ Tensor_139) {
+	// 11 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_133[i*1 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		integer Intermediate_2 = 1;
+		scalar Intermediate_3 = Intermediate_2 + Intermediate_1;
+		scalar Intermediate_4 = sqrt(Intermediate_3);
+		scalar Intermediate_5 = Tensor_134[i*3 + 2];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_4;
+		Tensor_139[i*3 + 2] += Intermediate_6;
+		scalar Intermediate_7 = Tensor_134[i*3 + 1];
+		scalar Intermediate_8 = Intermediate_4 * Intermediate_7;
+		Tensor_139[i*3 + 1] += Intermediate_8;
+		scalar Intermediate_9 = Tensor_134[i*3 + 0];
+		scalar Intermediate_10 = Intermediate_4 * Intermediate_9;
+		Tensor_139[i*3 + 0] += Intermediate_10;
+	}
+}
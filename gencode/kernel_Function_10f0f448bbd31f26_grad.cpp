@@ -0,0 +1,37 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_10f0f448bbd31f26_grad(int n, const scalar* __restrict__ Tensor_133, const scalar* __restrict__ Tensor_134, const scalar* __restrict__ Tensor_140, scalar* __restrict__ Tensor_141, scalar* __restrict__ Tensor_142) {
+	// 24 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_140[i*3 + 2];
+		scalar Intermediate_1 = Tensor_133[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_1;
+		integer Intermediate_3 = 1;
+		scalar Intermediate_4 = Intermediate_3 + Intermediate_2;
+		scalar Intermediate_5 = sqrt(Intermediate_4);
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_0;
+		Tensor_142[i*3 + 2] += Intermediate_6;
+		scalar Intermediate_7 = Tensor_140[i*3 + 1];
+		scalar Intermediate_8 = Intermediate_5 * Intermediate_7;
+		Tensor_142[i*3 + 1] += Intermediate_8;
+		scalar Intermediate_9 = Tensor_140[i*3 + 0];
+		scalar Intermediate_10 = Intermediate_5 * Intermediate_9;
+		Tensor_142[i*3 + 0] += Intermediate_10;
+		integer Intermediate_11 = 2;
+		scalar Intermediate_12 = Intermediate_5 * Intermediate_11;
+		scalar Intermediate_13 = Tensor_134[i*3 + 0];
+		scalar Intermediate_14 = Intermediate_9 * Intermediate_13;
+		scalar Intermediate_15 = Tensor_134[i*3 + 1];
+		scalar Intermediate_16 = Intermediate_7 * Intermediate_15;
+		scalar Intermediate_17 = Intermediate_16 + Intermediate_14;
+		scalar Intermediate_18 = Tensor_134[i*3 + 2];
+		scalar Intermediate_19 = Intermediate_0 * Intermediate_18;
+		scalar Intermediate_20 = Intermediate_19 + Intermediate_17;
+		scalar Intermediate_21 = Intermediate_20 / Intermediate_12;
+		scalar Intermediate_22 = Intermediate_1 * Intermediate_21;
+		scalar Intermediate_23 = Intermediate_22 + Intermediate_22;
+		Tensor_141[i*1 + 0] += Intermediate_23;
+	}
+}
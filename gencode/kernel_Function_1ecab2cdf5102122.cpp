@@ -0,0 +1,27 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_1ecab2cdf5102122(int n, const scalar* __restrict__ Tensor_75, const scalar* __restrict__ Tensor_76, scalar* __restrict__ Tensor_92, scalar* __restrict__ Tensor_95) {
+	// 10 ops, 9 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_76[i*1 + 0];
+		scalar Intermediate_1 = Tensor_75[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 / Intermediate_0;
+		Tensor_95[i*1 + 0] += Intermediate_2;
+		scalar Intermediate_3 = Intermediate_0 * Intermediate_1;
+		integer Intermediate_4 = 2;
+		scalar Intermediate_5 = pow(Intermediate_3, Intermediate_4);
+		scalar Intermediate_6 = abs(Intermediate_3);
+		int Intermediate_7 = Intermediate_5 < Intermediate_6;
+		
+                scalar Intermediate_8;
+                if (Intermediate_7) 
+                    Intermediate_8 = Intermediate_6;
+                else 
+                    Intermediate_8 = Intermediate_5;
+                
+		scalar Intermediate_9 = Intermediate_8 - Intermediate_3;
+		Tensor_92[i*1 + 0] += Intermediate_9;
+	}
+}
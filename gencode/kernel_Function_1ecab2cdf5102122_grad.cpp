@@ -0,0 +1,61 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_1ecab2cdf5102122_grad(int n, const scalar* __restrict__ Tensor_75, const scalar* __restrict__ Tensor_76, const scalar* __restrict__ Tensor_96, const scalar* __restrict__ Tensor_97, scalar* __restrict__ Tensor_98, scalar* __restrict__ Tensor_99) {
+	// 32 ops, 20 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_76[i*1 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		scalar Intermediate_2 = Tensor_97[i*1 + 0];
+		scalar Intermediate_3 = Tensor_75[i*1 + 0];
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_2;
+		scalar Intermediate_5 = Intermediate_4 / Intermediate_1;
+		scalar Intermediate_6 = 0.0;
+		scalar Intermediate_7 = Tensor_96[i*1 + 0];
+		scalar Intermediate_8 = Intermediate_0 * Intermediate_3;
+		scalar Intermediate_9 = abs(Intermediate_8);
+		integer Intermediate_10 = 2;
+		scalar Intermediate_11 = pow(Intermediate_8, Intermediate_10);
+		int Intermediate_12 = Intermediate_11 < Intermediate_9;
+		
+                scalar Intermediate_13;
+                if (Intermediate_12) 
+                    Intermediate_13 = Intermediate_7;
+                else 
+                    Intermediate_13 = Intermediate_6;
+                
+		scalar Intermediate_14 = -(Intermediate_13);
+		integer Intermediate_15 = 0;
+		int Intermediate_16 = Intermediate_8 < Intermediate_15;
+		
+                scalar Intermediate_17;
+                if (Intermediate_16) 
+                    Intermediate_17 = Intermediate_14;
+                else 
+                    Intermediate_17 = Intermediate_13;
+                
+		scalar Intermediate_18 = Intermediate_3 * Intermediate_17;
+		
+                scalar Intermediate_19;
+                if (Intermediate_12) 
+                    Intermediate_19 = Intermediate_6;
+                else 
+                    Intermediate_19 = Intermediate_7;
+                
+		scalar Intermediate_20 = Intermediate_10 * Intermediate_19;
+		scalar Intermediate_21 = Intermediate_8 * Intermediate_20;
+		scalar Intermediate_22 = Intermediate_21 - Intermediate_7;
+		scalar Intermediate_23 = Intermediate_3 * Intermediate_22;
+		scalar Intermediate_24 = Intermediate_23 + Intermediate_18;
+		scalar Intermediate_25 = Intermediate_24 - Intermediate_5;
+		Tensor_99[i*1 + 0] += Intermediate_25;
+		scalar Intermediate_26 = Intermediate_2 / Intermediate_0;
+		scalar Intermediate_27 = Intermediate_0 * Intermediate_17;
+		scalar Intermediate_28 = -(Intermediate_27);
+		scalar Intermediate_29 = Intermediate_28 - Intermediate_26;
+		scalar Intermediate_30 = Intermediate_0 * Intermediate_22;
+		scalar Intermediate_31 = Intermediate_30 - Intermediate_29;
+		Tensor_98[i*1 + 0] += Intermediate_31;
+	}
+}
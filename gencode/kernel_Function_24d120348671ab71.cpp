@@ -0,0 +1,21 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_24d120348671ab71(int n, const scalar* __restrict__ Tensor_507, scalar* __restrict__ Tensor_509) {
+	// 9 ops, 0 removed by simplification
+	integer i;
+	scalar Reduce_8 = 0;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_507[i*3 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		scalar Intermediate_2 = Tensor_507[i*3 + 1];
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_2;
+		scalar Intermediate_4 = Intermediate_3 + Intermediate_1;
+		scalar Intermediate_5 = Tensor_507[i*3 + 2];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_5;
+		scalar Intermediate_7 = Intermediate_6 + Intermediate_4;
+		Reduce_8 += Intermediate_7;
+		
+	}
+	Tensor_509[0] += Reduce_8;
+}
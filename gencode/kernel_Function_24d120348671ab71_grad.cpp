@@ -0,0 +1,24 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_24d120348671ab71_grad(int n, const scalar* __restrict__ Tensor_507, const scalar* __restrict__ Tensor_510, scalar* __restrict__ Tensor_511) {
+	// 11 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		
+		scalar Intermediate_1 = Tensor_510[0];
+		
+		scalar Intermediate_2 = Tensor_507[i*3 + 2];
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_1;
+		scalar Intermediate_4 = Intermediate_3 + Intermediate_3;
+		Tensor_511[i*3 + 2] += Intermediate_4;
+		scalar Intermediate_5 = Tensor_507[i*3 + 1];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		scalar Intermediate_7 = Intermediate_6 + Intermediate_6;
+		Tensor_511[i*3 + 1] += Intermediate_7;
+		scalar Intermediate_8 = Tensor_507[i*3 + 0];
+		scalar Intermediate_9 = Intermediate_1 * Intermediate_8;
+		scalar Intermediate_10 = Intermediate_9 + Intermediate_9;
+		Tensor_511[i*3 + 0] += Intermediate_10;
+	}
+}
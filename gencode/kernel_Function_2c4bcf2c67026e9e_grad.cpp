@@ -0,0 +1,13 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_2c4bcf2c67026e9e_grad(int n, const scalar* __restrict__ Tensor_326, scalar* __restrict__ Tensor_327) {
+	// 3 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_326[i*1 + 0];
+		integer Intermediate_1 = 2;
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		Tensor_327[i*1 + 0] += Intermediate_2;
+	}
+}
@@ -0,0 +1,18 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_32710eed55386d8c(int n, const scalar* __restrict__ Tensor_49, const scalar* __restrict__ Tensor_50, const scalar* __restrict__ Tensor_51, const integer* __restrict__ Tensor_52, scalar* __restrict__ Tensor_54, scalar* __restrict__ Tensor_55) {
+	// 7 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_52[i*1 + 0];
+		scalar Intermediate_1 = Tensor_51[i*1 + 0];
+		Tensor_55[Intermediate_0*1 + 0] += Intermediate_1;
+		
+		scalar Intermediate_3 = Tensor_49[i*1 + 0];
+		scalar Intermediate_4 = Tensor_50[i*1 + 0];
+		scalar Intermediate_5 = Intermediate_4 * Intermediate_3;
+		scalar Intermediate_6 = Intermediate_1 + Intermediate_5;
+		Tensor_54[i*1 + 0] += Intermediate_6;
+	}
+}
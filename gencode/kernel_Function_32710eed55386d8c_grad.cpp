@@ -0,0 +1,21 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_32710eed55386d8c_grad(int n, const scalar* __restrict__ Tensor_49, const scalar* __restrict__ Tensor_50, const integer* __restrict__ Tensor_52, const scalar* __restrict__ Tensor_56, const scalar* __restrict__ Tensor_57, scalar* __restrict__ Tensor_58, scalar* __restrict__ Tensor_59, scalar* __restrict__ Tensor_60) {
+	// 9 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_56[i*1 + 0];
+		integer Intermediate_1 = Tensor_52[i*1 + 0];
+		
+		scalar Intermediate_3 = Tensor_57[Intermediate_1*1 + 0];
+		scalar Intermediate_4 = Intermediate_3 + Intermediate_0;
+		Tensor_60[i*1 + 0] += Intermediate_4;
+		scalar Intermediate_5 = Tensor_49[i*1 + 0];
+		scalar Intermediate_6 = Intermediate_0 * Intermediate_5;
+		Tensor_59[i*1 + 0] += Intermediate_6;
+		scalar Intermediate_7 = Tensor_50[i*1 + 0];
+		scalar Intermediate_8 = Intermediate_0 * Intermediate_7;
+		Tensor_58[i*1 + 0] += Intermediate_8;
+	}
+}
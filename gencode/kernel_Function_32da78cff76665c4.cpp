@@ -0,0 +1,28 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_32da78cff76665c4(int n, const scalar* __restrict__ Tensor_171, scalar* __restrict__ Tensor_176) {
+	// 16 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_171[i*3 + 2];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		scalar Intermediate_2 = sqrt(Intermediate_1);
+		scalar Intermediate_3 = Intermediate_0 * Intermediate_2;
+		integer Intermediate_4 = 1;
+		scalar Intermediate_5 = Intermediate_4 + Intermediate_3;
+		Tensor_176[i*3 + 2] += Intermediate_5;
+		scalar Intermediate_6 = Tensor_171[i*3 + 1];
+		scalar Intermediate_7 = Intermediate_6 * Intermediate_6;
+		scalar Intermediate_8 = sqrt(Intermediate_7);
+		scalar Intermediate_9 = Intermediate_6 * Intermediate_8;
+		scalar Intermediate_10 = Intermediate_4 + Intermediate_9;
+		Tensor_176[i*3 + 1] += Intermediate_10;
+		scalar Intermediate_11 = Tensor_171[i*3 + 0];
+		scalar Intermediate_12 = Intermediate_11 * Intermediate_11;
+		scalar Intermediate_13 = sqrt(Intermediate_12);
+		scalar Intermediate_14 = Intermediate_11 * Intermediate_13;
+		scalar Intermediate_15 = Intermediate_4 + Intermediate_14;
+		Tensor_176[i*3 + 0] += Intermediate_15;
+	}
+}
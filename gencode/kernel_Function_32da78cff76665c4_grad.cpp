@@ -0,0 +1,46 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_32da78cff76665c4_grad(int n, const scalar* __restrict__ Tensor_171, const scalar* __restrict__ Tensor_177, scalar* __restrict__ Tensor_178) {
+	// 34 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = 2;
+		scalar Intermediate_1 = Tensor_171[i*3 + 2];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_1;
+		scalar Intermediate_3 = sqrt(Intermediate_2);
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_0;
+		scalar Intermediate_5 = Tensor_177[i*3 + 2];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		scalar Intermediate_7 = Intermediate_6 / Intermediate_4;
+		scalar Intermediate_8 = Intermediate_1 * Intermediate_7;
+		scalar Intermediate_9 = Intermediate_8 + Intermediate_8;
+		scalar Intermediate_10 = Intermediate_3 * Intermediate_5;
+		scalar Intermediate_11 = Intermediate_10 + Intermediate_9;
+		Tensor_178[i*3 + 2] += Intermediate_11;
+		scalar Intermediate_12 = Tensor_171[i*3 + 1];
+		scalar Intermediate_13 = Intermediate_12 * Intermediate_12;
+		scalar Intermediate_14 = sqrt(Intermediate_13);
+		scalar Intermediate_15 = Intermediate_0 * Intermediate_14;
+		scalar Intermediate_16 = Tensor_177[i*3 + 1];
+		scalar Intermediate_17 = Intermediate_12 * Intermediate_16;
+		scalar Intermediate_18 = Intermediate_17 / Intermediate_15;
+		scalar Intermediate_19 = Intermediate_12 * Intermediate_18;
+		scalar Intermediate_20 = Intermediate_19 + Intermediate_19;
+		scalar Intermediate_21 = Intermediate_14 * Intermediate_16;
+		scalar Intermediate_22 = Intermediate_21 + Intermediate_20;
+		Tensor_178[i*3 + 1] += Intermediate_22;
+		scalar Intermediate_23 = Tensor_171[i*3 + 0];
+		scalar Intermediate_24 = Intermediate_23 * Intermediate_23;
+		scalar Intermediate_25 = sqrt(Intermediate_24);
+		scalar Intermediate_26 = Intermediate_0 * Intermediate_25;
+		scalar Intermediate_27 = Tensor_177[i*3 + 0];
+		scalar Intermediate_28 = Intermediate_23 * Intermediate_27;
+		scalar Intermediate_29 = Intermediate_28 / Intermediate_26;
+		scalar Intermediate_30 = Intermediate_23 * Intermediate_29;
+		scalar Intermediate_31 = Intermediate_30 + Intermediate_30;
+		scalar Intermediate_32 = Intermediate_25 * Intermediate_27;
+		scalar Intermediate_33 = Intermediate_32 + Intermediate_31;
+		Tensor_178[i*3 + 0] += Intermediate_33;
+	}
+}
@@ -0,0 +1,37 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_3bf132eef5865a07(int n, const scalar* __restrict__ Tensor_234, const scalar* __restrict__ Tensor_235, const integer* __restrict__ Tensor_236, const integer* __restrict__ Tensor_237, scalar* __restrict__ Tensor_241, integer Tensor_241_rows) {
+	// 14 ops, 0 removed by simplification
+	integer i;
+	integer nThreads = omp_get_max_threads();
+	vector<scalar> Buffer_Tensor_241(nThreads*(bigInteger) Tensor_241_rows*2);
+	#pragma omp parallel for private(i) schedule(static)
+	for (i = 0; i < n; i++) {
+		scalar* Private_Tensor_241 = &Buffer_Tensor_241[(bigInteger) omp_get_thread_num()*(bigInteger) Tensor_241_rows*2];
+		integer Intermediate_0 = Tensor_237[i*1 + 0];
+		scalar Intermediate_1 = Tensor_234[i*2 + 1];
+		scalar Intermediate_2 = -(Intermediate_1);
+		integer Intermediate_3 = Tensor_236[i*1 + 0];
+		
+		scalar Intermediate_5 = Tensor_235[Intermediate_3*2 + 1];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		Private_Tensor_241[Intermediate_3*2 + 1] += Intermediate_6;
+		Private_Tensor_241[Intermediate_0*2 + 1] += Intermediate_2;
+		
+		scalar Intermediate_8 = Tensor_234[i*2 + 0];
+		scalar Intermediate_9 = -(Intermediate_8);
+		
+		scalar Intermediate_11 = Tensor_235[Intermediate_3*2 + 0];
+		scalar Intermediate_12 = Intermediate_8 * Intermediate_11;
+		Private_Tensor_241[Intermediate_3*2 + 0] += Intermediate_12;
+		Private_Tensor_241[Intermediate_0*2 + 0] += Intermediate_9;
+		
+	}
+	#pragma omp parallel for
+	for (bigInteger k = 0; k < (bigInteger) Tensor_241_rows*2; k++) {
+		for (integer t = 0; t < nThreads; t++) {
+			Tensor_241[k] += Buffer_Tensor_241[t*(bigInteger) Tensor_241_rows*2 + k];
+		}
+	}
+}
@@ -0,0 +1,45 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_3bf132eef5865a07_grad(int n, const scalar* __restrict__ Tensor_234, const scalar* __restrict__ Tensor_235, const integer* __restrict__ Tensor_236, const integer* __restrict__ Tensor_237, const scalar* __restrict__ Tensor_242, scalar* __restrict__ Tensor_243, scalar* __restrict__ Tensor_244, integer Tensor_244_rows) {
+	// 22 ops, 2 removed by simplification
+	integer i;
+	integer nThreads = omp_get_max_threads();
+	vector<scalar> Buffer_Tensor_244(nThreads*(bigInteger) Tensor_244_rows*2);
+	#pragma omp parallel for private(i) schedule(static)
+	for (i = 0; i < n; i++) {
+		scalar* Private_Tensor_244 = &Buffer_Tensor_244[(bigInteger) omp_get_thread_num()*(bigInteger) Tensor_244_rows*2];
+		integer Intermediate_0 = Tensor_236[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_242[Intermediate_0*2 + 1];
+		scalar Intermediate_3 = Tensor_234[i*2 + 1];
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_2;
+		Private_Tensor_244[Intermediate_0*2 + 1] += Intermediate_4;
+		
+		
+		scalar Intermediate_7 = Tensor_242[Intermediate_0*2 + 0];
+		scalar Intermediate_8 = Tensor_234[i*2 + 0];
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_7;
+		Private_Tensor_244[Intermediate_0*2 + 0] += Intermediate_9;
+		
+		integer Intermediate_11 = Tensor_237[i*1 + 0];
+		scalar Intermediate_12 = Tensor_242[Intermediate_11*2 + 1];
+		
+		scalar Intermediate_14 = Tensor_235[Intermediate_0*2 + 1];
+		scalar Intermediate_15 = Intermediate_2 * Intermediate_14;
+		scalar Intermediate_16 = Intermediate_15 - Intermediate_12;
+		Tensor_243[i*2 + 1] += Intermediate_16;
+		scalar Intermediate_17 = Tensor_242[Intermediate_11*2 + 0];
+		
+		scalar Intermediate_19 = Tensor_235[Intermediate_0*2 + 0];
+		scalar Intermediate_20 = Intermediate_7 * Intermediate_19;
+		scalar Intermediate_21 = Intermediate_20 - Intermediate_17;
+		Tensor_243[i*2 + 0] += Intermediate_21;
+	}
+	#pragma omp parallel for
+	for (bigInteger k = 0; k < (bigInteger) Tensor_244_rows*2; k++) {
+		for (integer t = 0; t < nThreads; t++) {
+			Tensor_244[k] += Buffer_Tensor_244[t*(bigInteger) Tensor_244_rows*2 + k];
+		}
+	}
+}
@@ -0,0 +1,23 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_3c73e81675fdbcbd(int n, const scalar* __restrict__ Tensor_518, const scalar* __restrict__ Tensor_519, const integer* __restrict__ Tensor_520, scalar* __restrict__ Tensor_522) {
+	// 11 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_520[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_518[Intermediate_0*3 + 2];
+		scalar Intermediate_3 = Tensor_519[i*1 + 0];
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_2;
+		Tensor_522[i*3 + 2] += Intermediate_4;
+		
+		scalar Intermediate_6 = Tensor_518[Intermediate_0*3 + 1];
+		scalar Intermediate_7 = Intermediate_3 * Intermediate_6;
+		Tensor_522[i*3 + 1] += Intermediate_7;
+		
+		scalar Intermediate_9 = Tensor_518[Intermediate_0*3 + 0];
+		scalar Intermediate_10 = Intermediate_3 * Intermediate_9;
+		Tensor_522[i*3 + 0] += Intermediate_10;
+	}
+}
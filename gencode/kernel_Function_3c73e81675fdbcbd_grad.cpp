@@ -0,0 +1,35 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_3c73e81675fdbcbd_grad(int n, const scalar* __restrict__ Tensor_518, const scalar* __restrict__ Tensor_519, const integer* __restrict__ Tensor_520, const scalar* __restrict__ Tensor_523, scalar* __restrict__ Tensor_524, scalar* __restrict__ Tensor_525) {
+	// 22 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_523[i*3 + 0];
+		integer Intermediate_1 = Tensor_520[i*1 + 0];
+		
+		scalar Intermediate_3 = Tensor_518[Intermediate_1*3 + 0];
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_0;
+		scalar Intermediate_5 = Tensor_523[i*3 + 1];
+		
+		scalar Intermediate_7 = Tensor_518[Intermediate_1*3 + 1];
+		scalar Intermediate_8 = Intermediate_7 * Intermediate_5;
+		scalar Intermediate_9 = Intermediate_8 + Intermediate_4;
+		scalar Intermediate_10 = Tensor_523[i*3 + 2];
+		
+		scalar Intermediate_12 = Tensor_518[Intermediate_1*3 + 2];
+		scalar Intermediate_13 = Intermediate_12 * Intermediate_10;
+		scalar Intermediate_14 = Intermediate_13 + Intermediate_9;
+		Tensor_525[i*1 + 0] += Intermediate_14;
+		scalar Intermediate_15 = Tensor_519[i*1 + 0];
+		scalar Intermediate_16 = Intermediate_10 * Intermediate_15;
+		Tensor_524[Intermediate_1*3 + 2] += Intermediate_16;
+		
+		scalar Intermediate_18 = Intermediate_5 * Intermediate_15;
+		Tensor_524[Intermediate_1*3 + 1] += Intermediate_18;
+		
+		scalar Intermediate_20 = Intermediate_0 * Intermediate_15;
+		Tensor_524[Intermediate_1*3 + 0] += Intermediate_20;
+		
+	}
+}
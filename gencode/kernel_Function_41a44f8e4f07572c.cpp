@@ -0,0 +1,52 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_41a44f8e4f07572c(int n, const scalar* __restrict__ Tensor_37, const scalar* __restrict__ Tensor_38, const scalar* __restrict__ Tensor_39, scalar* __restrict__ Tensor_40, scalar* __restrict__ Tensor_41, scalar* __restrict__ Tensor_42) {
+	// 36 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_39[i*9 + 6];
+		scalar Intermediate_1 = Tensor_38[i*3 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		scalar Intermediate_3 = Tensor_39[i*9 + 7];
+		scalar Intermediate_4 = Tensor_38[i*3 + 1];
+		scalar Intermediate_5 = Intermediate_4 * Intermediate_3;
+		scalar Intermediate_6 = Intermediate_5 + Intermediate_2;
+		scalar Intermediate_7 = Tensor_39[i*9 + 8];
+		scalar Intermediate_8 = Tensor_38[i*3 + 2];
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_7;
+		scalar Intermediate_10 = Intermediate_9 + Intermediate_6;
+		Tensor_42[i*3 + 2] += Intermediate_10;
+		scalar Intermediate_11 = Tensor_39[i*9 + 3];
+		scalar Intermediate_12 = Intermediate_1 * Intermediate_11;
+		scalar Intermediate_13 = Tensor_39[i*9 + 4];
+		scalar Intermediate_14 = Intermediate_4 * Intermediate_13;
+		scalar Intermediate_15 = Intermediate_14 + Intermediate_12;
+		scalar Intermediate_16 = Tensor_39[i*9 + 5];
+		scalar Intermediate_17 = Intermediate_8 * Intermediate_16;
+		scalar Intermediate_18 = Intermediate_17 + Intermediate_15;
+		Tensor_42[i*3 + 1] += Intermediate_18;
+		scalar Intermediate_19 = Tensor_39[i*9 + 0];
+		scalar Intermediate_20 = Intermediate_1 * Intermediate_19;
+		scalar Intermediate_21 = Tensor_39[i*9 + 1];
+		scalar Intermediate_22 = Intermediate_4 * Intermediate_21;
+		scalar Intermediate_23 = Intermediate_22 + Intermediate_20;
+		scalar Intermediate_24 = Tensor_39[i*9 + 2];
+		scalar Intermediate_25 = Intermediate_8 * Intermediate_24;
+		scalar Intermediate_26 = Intermediate_25 + Intermediate_23;
+		Tensor_42[i*3 + 0] += Intermediate_26;
+		scalar Intermediate_27 = Intermediate_1 * Intermediate_1;
+		scalar Intermediate_28 = Intermediate_4 * Intermediate_4;
+		scalar Intermediate_29 = Intermediate_28 + Intermediate_27;
+		scalar Intermediate_30 = Intermediate_8 * Intermediate_8;
+		scalar Intermediate_31 = Intermediate_30 + Intermediate_29;
+		Tensor_41[i*1 + 0] += Intermediate_31;
+		scalar Intermediate_32 = Tensor_37[i*1 + 0];
+		scalar Intermediate_33 = Intermediate_8 * Intermediate_32;
+		Tensor_40[i*3 + 2] += Intermediate_33;
+		scalar Intermediate_34 = Intermediate_4 * Intermediate_32;
+		Tensor_40[i*3 + 1] += Intermediate_34;
+		scalar Intermediate_35 = Intermediate_1 * Intermediate_32;
+		Tensor_40[i*3 + 0] += Intermediate_35;
+	}
+}
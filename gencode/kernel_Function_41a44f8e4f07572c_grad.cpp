@@ -0,0 +1,86 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_41a44f8e4f07572c_grad(int n, const scalar* __restrict__ Tensor_37, const scalar* __restrict__ Tensor_38, const scalar* __restrict__ Tensor_39, const scalar* __restrict__ Tensor_43, const scalar* __restrict__ Tensor_44, const scalar* __restrict__ Tensor_45, scalar* __restrict__ Tensor_46, scalar* __restrict__ Tensor_47, scalar* __restrict__ Tensor_48) {
+	// 64 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_45[i*3 + 2];
+		scalar Intermediate_1 = Tensor_38[i*3 + 2];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		Tensor_48[i*9 + 8] += Intermediate_2;
+		scalar Intermediate_3 = Tensor_38[i*3 + 1];
+		scalar Intermediate_4 = Intermediate_0 * Intermediate_3;
+		Tensor_48[i*9 + 7] += Intermediate_4;
+		scalar Intermediate_5 = Tensor_38[i*3 + 0];
+		scalar Intermediate_6 = Intermediate_0 * Intermediate_5;
+		Tensor_48[i*9 + 6] += Intermediate_6;
+		scalar Intermediate_7 = Tensor_45[i*3 + 1];
+		scalar Intermediate_8 = Intermediate_1 * Intermediate_7;
+		Tensor_48[i*9 + 5] += Intermediate_8;
+		scalar Intermediate_9 = Intermediate_3 * Intermediate_7;
+		Tensor_48[i*9 + 4] += Intermediate_9;
+		scalar Intermediate_10 = Intermediate_5 * Intermediate_7;
+		Tensor_48[i*9 + 3] += Intermediate_10;
+		scalar Intermediate_11 = Tensor_45[i*3 + 0];
+		scalar Intermediate_12 = Intermediate_1 * Intermediate_11;
+		Tensor_48[i*9 + 2] += Intermediate_12;
+		scalar Intermediate_13 = Intermediate_3 * Intermediate_11;
+		Tensor_48[i*9 + 1] += Intermediate_13;
+		scalar Intermediate_14 = Intermediate_5 * Intermediate_11;
+		Tensor_48[i*9 + 0] += Intermediate_14;
+		scalar Intermediate_15 = Tensor_43[i*3 + 2];
+		scalar Intermediate_16 = Tensor_37[i*1 + 0];
+		scalar Intermediate_17 = Intermediate_16 * Intermediate_15;
+		scalar Intermediate_18 = Tensor_44[i*1 + 0];
+		scalar Intermediate_19 = Intermediate_1 * Intermediate_18;
+		scalar Intermediate_20 = Intermediate_19 + Intermediate_17;
+		scalar Intermediate_21 = Intermediate_19 + Intermediate_20;
+		scalar Intermediate_22 = Tensor_39[i*9 + 2];
+		scalar Intermediate_23 = Intermediate_11 * Intermediate_22;
+		scalar Intermediate_24 = Intermediate_23 + Intermediate_21;
+		scalar Intermediate_25 = Tensor_39[i*9 + 5];
+		scalar Intermediate_26 = Intermediate_7 * Intermediate_25;
+		scalar Intermediate_27 = Intermediate_26 + Intermediate_24;
+		scalar Intermediate_28 = Tensor_39[i*9 + 8];
+		scalar Intermediate_29 = Intermediate_0 * Intermediate_28;
+		scalar Intermediate_30 = Intermediate_29 + Intermediate_27;
+		Tensor_47[i*3 + 2] += Intermediate_30;
+		scalar Intermediate_31 = Tensor_43[i*3 + 1];
+		scalar Intermediate_32 = Intermediate_16 * Intermediate_31;
+		scalar Intermediate_33 = Intermediate_3 * Intermediate_18;
+		scalar Intermediate_34 = Intermediate_33 + Intermediate_32;
+		scalar Intermediate_35 = Intermediate_33 + Intermediate_34;
+		scalar Intermediate_36 = Tensor_39[i*9 + 1];
+		scalar Intermediate_37 = Intermediate_11 * Intermediate_36;
+		scalar Intermediate_38 = Intermediate_37 + Intermediate_35;
+		scalar Intermediate_39 = Tensor_39[i*9 + 4];
+		scalar Intermediate_40 = Intermediate_7 * Intermediate_39;
+		scalar Intermediate_41 = Intermediate_40 + Intermediate_38;
+		scalar Intermediate_42 = Tensor_39[i*9 + 7];
+		scalar Intermediate_43 = Intermediate_0 * Intermediate_42;
+		scalar Intermediate_44 = Intermediate_43 + Intermediate_41;
+		Tensor_47[i*3 + 1] += Intermediate_44;
+		scalar Intermediate_45 = Tensor_43[i*3 + 0];
+		scalar Intermediate_46 = Intermediate_16 * Intermediate_45;
+		scalar Intermediate_47 = Intermediate_5 * Intermediate_18;
+		scalar Intermediate_48 = Intermediate_47 + Intermediate_46;
+		scalar Intermediate_49 = Intermediate_47 + Intermediate_48;
+		scalar Intermediate_50 = Tensor_39[i*9 + 0];
+		scalar Intermediate_51 = Intermediate_11 * Intermediate_50;
+		scalar Intermediate_52 = Intermediate_51 + Intermediate_49;
+		scalar Intermediate_53 = Tensor_39[i*9 + 3];
+		scalar Intermediate_54 = Intermediate_7 * Intermediate_53;
+		scalar Intermediate_55 = Intermediate_54 + Intermediate_52;
+		scalar Intermediate_56 = Tensor_39[i*9 + 6];
+		scalar Intermediate_57 = Intermediate_0 * Intermediate_56;
+		scalar Intermediate_58 = Intermediate_57 + Intermediate_55;
+		Tensor_47[i*3 + 0] += Intermediate_58;
+		scalar Intermediate_59 = Intermediate_5 * Intermediate_45;
+		scalar Intermediate_60 = Intermediate_3 * Intermediate_31;
+		scalar Intermediate_61 = Intermediate_60 + Intermediate_59;
+		scalar Intermediate_62 = Intermediate_1 * Intermediate_15;
+		scalar Intermediate_63 = Intermediate_62 + Intermediate_61;
+		Tensor_46[i*1 + 0] += Intermediate_63;
+	}
+}
@@ -0,0 +1,26 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_4e1d8c8359f7b19e(int n, const scalar* __restrict__ Tensor_260, const scalar* __restrict__ Tensor_261, scalar* __restrict__ Tensor_263, scalar* __restrict__ Tensor_265, scalar* __restrict__ Tensor_267) {
+	// 7 ops, 0 removed by simplification
+	integer i;
+	scalar Reduce_3 = numeric_limits<scalar>::max();
+	scalar Reduce_4 = numeric_limits<scalar>::lowest();
+	scalar Reduce_6 = 0;
+	#pragma omp parallel for private(i) reduction(min:Reduce_3) reduction(max:Reduce_4) reduction(+:Reduce_6)
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_261[i*1 + 0];
+		scalar Intermediate_1 = Tensor_260[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 - Intermediate_0;
+		Reduce_3 = min(Intermediate_2, Reduce_3);
+		
+		Reduce_4 = max(Intermediate_2, Reduce_4);
+		
+		scalar Intermediate_5 = Intermediate_0 + Intermediate_1;
+		Reduce_6 += Intermediate_5;
+		
+	}
+	Tensor_267[0] = min(Reduce_3, Tensor_267[0]);
+	Tensor_265[0] = max(Reduce_4, Tensor_265[0]);
+	Tensor_263[0] += Reduce_6;
+}
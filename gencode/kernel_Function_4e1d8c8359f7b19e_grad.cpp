@@ -0,0 +1,15 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_4e1d8c8359f7b19e_grad(int n, const scalar* __restrict__ Tensor_268, scalar* __restrict__ Tensor_271, scalar* __restrict__ Tensor_272) {
+	// 2 ops, 0 removed by simplification
+	integer i;
+	#pragma omp parallel for private(i)
+	for (i = 0; i < n; i++) {
+		
+		scalar Intermediate_1 = Tensor_268[0];
+		
+		Tensor_271[i*1 + 0] += Intermediate_1;
+		Tensor_272[i*1 + 0] += Intermediate_1;
+	}
+}
@@ -0,0 +1,14 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_516e6eafebe13514(int n, const scalar* __restrict__ Tensor_485, scalar* __restrict__ Tensor_488) {
+	// 4 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_485[i*1 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		integer Intermediate_2 = 1;
+		scalar Intermediate_3 = Intermediate_2 + Intermediate_1;
+		Tensor_488[i*1 + 0] += Intermediate_3;
+	}
+}
@@ -0,0 +1,14 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_516e6eafebe13514_grad(int n, const scalar* __restrict__ Tensor_485, const scalar* __restrict__ Tensor_489, scalar* __restrict__ Tensor_490) {
+	// 4 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_489[i*1 + 0];
+		scalar Intermediate_1 = Tensor_485[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		scalar Intermediate_3 = Intermediate_2 + Intermediate_2;
+		Tensor_490[i*1 + 0] += Intermediate_3;
+	}
+}
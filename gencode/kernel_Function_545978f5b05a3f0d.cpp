@@ -0,0 +1,31 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_545978f5b05a3f0d(int n, const scalar* __restrict__ Tensor_328, const integer* __restrict__ Tensor_329, scalar* __restrict__ Tensor_332, scalar* __restrict__ Tensor_334) {
+	// 16 ops, 0 removed by simplification
+	integer i;
+	scalar Reduce_12 = 0;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_329[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_328[Intermediate_0*3 + 0];
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_2;
+		
+		scalar Intermediate_5 = Tensor_328[Intermediate_0*3 + 1];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_5;
+		scalar Intermediate_7 = Intermediate_6 + Intermediate_3;
+		
+		scalar Intermediate_9 = Tensor_328[Intermediate_0*3 + 2];
+		scalar Intermediate_10 = Intermediate_9 * Intermediate_9;
+		scalar Intermediate_11 = Intermediate_10 + Intermediate_7;
+		Reduce_12 += Intermediate_11;
+		
+		Tensor_332[Intermediate_0*3 + 2] += Intermediate_10;
+		
+		Tensor_332[Intermediate_0*3 + 1] += Intermediate_6;
+		
+		Tensor_332[Intermediate_0*3 + 0] += Intermediate_3;
+		
+	}
+	Tensor_334[0] += Reduce_12;
+}
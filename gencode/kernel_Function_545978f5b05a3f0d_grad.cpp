@@ -0,0 +1,40 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_545978f5b05a3f0d_grad(int n, const scalar* __restrict__ Tensor_328, const integer* __restrict__ Tensor_329, const scalar* __restrict__ Tensor_335, const scalar* __restrict__ Tensor_336, scalar* __restrict__ Tensor_337) {
+	// 27 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_329[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_335[Intermediate_0*3 + 2];
+		
+		scalar Intermediate_4 = Tensor_336[0];
+		
+		scalar Intermediate_5 = Intermediate_4 + Intermediate_2;
+		
+		scalar Intermediate_7 = Tensor_328[Intermediate_0*3 + 2];
+		scalar Intermediate_8 = Intermediate_7 * Intermediate_5;
+		scalar Intermediate_9 = Intermediate_8 + Intermediate_8;
+		Tensor_337[Intermediate_0*3 + 2] += Intermediate_9;
+		
+		
+		scalar Intermediate_12 = Tensor_335[Intermediate_0*3 + 1];
+		scalar Intermediate_13 = Intermediate_4 + Intermediate_12;
+		
+		scalar Intermediate_15 = Tensor_328[Intermediate_0*3 + 1];
+		scalar Intermediate_16 = Intermediate_15 * Intermediate_13;
+		scalar Intermediate_17 = Intermediate_16 + Intermediate_16;
+		Tensor_337[Intermediate_0*3 + 1] += Intermediate_17;
+		
+		
+		scalar Intermediate_20 = Tensor_335[Intermediate_0*3 + 0];
+		scalar Intermediate_21 = Intermediate_4 + Intermediate_20;
+		
+		scalar Intermediate_23 = Tensor_328[Intermediate_0*3 + 0];
+		scalar Intermediate_24 = Intermediate_23 * Intermediate_21;
+		scalar Intermediate_25 = Intermediate_24 + Intermediate_24;
+		Tensor_337[Intermediate_0*3 + 0] += Intermediate_25;
+		
+	}
+}
@@ -0,0 +1,38 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_604895ba6780b85b(int n, const scalar* __restrict__ Tensor_273, const scalar* __restrict__ Tensor_274, scalar* __restrict__ Tensor_276, scalar* __restrict__ Tensor_278, scalar* __restrict__ Tensor_280) {
+	// 7 ops, 0 removed by simplification
+	integer i;
+	integer nBlocks = (n + REDUCE_BLOCK - 1)/REDUCE_BLOCK;
+	vector<scalar> Partial_Reduce_3(nBlocks);
+	vector<scalar> Partial_Reduce_4(nBlocks);
+	vector<scalar> Partial_Reduce_6(nBlocks);
+	#pragma omp parallel for private(i) schedule(static)
+	for (integer block = 0; block < nBlocks; block++) {
+		scalar Reduce_3 = numeric_limits<scalar>::max();
+		scalar Reduce_4 = numeric_limits<scalar>::lowest();
+		scalar Reduce_6 = 0;
+		for (i = block*REDUCE_BLOCK; i < min(n, (block + 1)*REDUCE_BLOCK); i++) {
+			scalar Intermediate_0 = Tensor_274[i*1 + 0];
+			scalar Intermediate_1 = Tensor_273[i*1 + 0];
+			scalar Intermediate_2 = Intermediate_1 - Intermediate_0;
+			Reduce_3 = min(Intermediate_2, Reduce_3);
+		
+			Reduce_4 = max(Intermediate_2, Reduce_4);
+		
+			scalar Intermediate_5 = Intermediate_0 + Intermediate_1;
+			Reduce_6 += Intermediate_5;
+		
+		}
+		Partial_Reduce_3[block] = Reduce_3;
+		Partial_Reduce_4[block] = Reduce_4;
+		Partial_Reduce_6[block] = Reduce_6;
+	}
+	scalar Reduce_3 = reduce_pairwise<scalar>(Partial_Reduce_3, numeric_limits<scalar>::max(), [](scalar a, scalar b) { return min(a, b); });
+	scalar Reduce_4 = reduce_pairwise<scalar>(Partial_Reduce_4, numeric_limits<scalar>::lowest(), [](scalar a, scalar b) { return max(a, b); });
+	scalar Reduce_6 = reduce_pairwise<scalar>(Partial_Reduce_6, 0, [](scalar a, scalar b) { return a + b; });
+	Tensor_280[0] = min(Reduce_3, Tensor_280[0]);
+	Tensor_278[0] = max(Reduce_4, Tensor_278[0]);
+	Tensor_276[0] += Reduce_6;
+}
@@ -0,0 +1,15 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_604895ba6780b85b_grad(int n, const scalar* __restrict__ Tensor_281, scalar* __restrict__ Tensor_284, scalar* __restrict__ Tensor_285) {
+	// 2 ops, 0 removed by simplification
+	integer i;
+	#pragma omp parallel for private(i)
+	for (i = 0; i < n; i++) {
+		
+		scalar Intermediate_1 = Tensor_281[0];
+		
+		Tensor_284[i*1 + 0] += Intermediate_1;
+		Tensor_285[i*1 + 0] += Intermediate_1;
+	}
+}
@@ -0,0 +1,17 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_646499e934130e00(int n, const scalar* __restrict__ Tensor_395, const scalar* __restrict__ Tensor_396, const integer* __restrict__ Tensor_397, scalar* __restrict__ Tensor_401) {
+	// 7 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_397[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_395[Intermediate_0*1 + 0];
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_2;
+		scalar Intermediate_4 = Tensor_396[i*1 + 0];
+		scalar Intermediate_5 = Intermediate_4 * Intermediate_3;
+		Tensor_401[Intermediate_0*1 + 0] += Intermediate_5;
+		
+	}
+}
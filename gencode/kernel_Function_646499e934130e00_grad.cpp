@@ -0,0 +1,23 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_646499e934130e00_grad(int n, const scalar* __restrict__ Tensor_395, const scalar* __restrict__ Tensor_396, const integer* __restrict__ Tensor_397, const scalar* __restrict__ Tensor_402, scalar* __restrict__ Tensor_403, scalar* __restrict__ Tensor_404) {
+	// 12 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_397[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_402[Intermediate_0*1 + 0];
+		
+		scalar Intermediate_4 = Tensor_395[Intermediate_0*1 + 0];
+		scalar Intermediate_5 = Intermediate_4 * Intermediate_4;
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_2;
+		Tensor_404[i*1 + 0] += Intermediate_6;
+		scalar Intermediate_7 = Tensor_396[i*1 + 0];
+		scalar Intermediate_8 = Intermediate_2 * Intermediate_7;
+		scalar Intermediate_9 = Intermediate_4 * Intermediate_8;
+		scalar Intermediate_10 = Intermediate_9 + Intermediate_9;
+		Tensor_403[Intermediate_0*1 + 0] += Intermediate_10;
+		
+	}
+}
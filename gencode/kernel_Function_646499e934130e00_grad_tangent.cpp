@@ -0,0 +1,43 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_646499e934130e00_grad_tangent(int n, const scalar* __restrict__ Tensor_395, const scalar* __restrict__ Tensor_396, const integer* __restrict__ Tensor_397, const scalar* __restrict__ Tensor_402, const scalar* __restrict__ Tensor_434, const scalar* __restrict__ Tensor_435, const scalar* __restrict__ Tensor_436, scalar* __restrict__ Tensor_403, scalar* __restrict__ Tensor_404, scalar* __restrict__ Tensor_437, scalar* __restrict__ Tensor_438) {
+	// 30 ops, 1 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_397[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_436[Intermediate_0*1 + 0];
+		
+		scalar Intermediate_4 = Tensor_395[Intermediate_0*1 + 0];
+		scalar Intermediate_5 = Intermediate_4 * Intermediate_4;
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_2;
+		
+		scalar Intermediate_8 = Tensor_402[Intermediate_0*1 + 0];
+		
+		scalar Intermediate_10 = Tensor_434[Intermediate_0*1 + 0];
+		scalar Intermediate_11 = Intermediate_10 * Intermediate_4;
+		scalar Intermediate_12 = Intermediate_11 + Intermediate_11;
+		scalar Intermediate_13 = Intermediate_12 * Intermediate_8;
+		scalar Intermediate_14 = Intermediate_13 + Intermediate_6;
+		Tensor_438[i*1 + 0] += Intermediate_14;
+		scalar Intermediate_15 = Tensor_396[i*1 + 0];
+		scalar Intermediate_16 = Intermediate_2 * Intermediate_15;
+		scalar Intermediate_17 = Tensor_435[i*1 + 0];
+		scalar Intermediate_18 = Intermediate_8 * Intermediate_17;
+		scalar Intermediate_19 = Intermediate_18 + Intermediate_16;
+		scalar Intermediate_20 = Intermediate_4 * Intermediate_19;
+		scalar Intermediate_21 = Intermediate_8 * Intermediate_15;
+		scalar Intermediate_22 = Intermediate_10 * Intermediate_21;
+		scalar Intermediate_23 = Intermediate_22 + Intermediate_20;
+		scalar Intermediate_24 = Intermediate_23 + Intermediate_23;
+		Tensor_437[Intermediate_0*1 + 0] += Intermediate_24;
+		
+		scalar Intermediate_26 = Intermediate_8 * Intermediate_5;
+		Tensor_404[i*1 + 0] += Intermediate_26;
+		scalar Intermediate_27 = Intermediate_4 * Intermediate_21;
+		scalar Intermediate_28 = Intermediate_27 + Intermediate_27;
+		Tensor_403[Intermediate_0*1 + 0] += Intermediate_28;
+		
+	}
+}
@@ -0,0 +1,27 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_646499e934130e00_tangent(int n, const scalar* __restrict__ Tensor_395, const scalar* __restrict__ Tensor_396, const integer* __restrict__ Tensor_397, const scalar* __restrict__ Tensor_425, const scalar* __restrict__ Tensor_426, scalar* __restrict__ Tensor_401, scalar* __restrict__ Tensor_427) {
+	// 16 ops, 1 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_397[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_425[Intermediate_0*1 + 0];
+		
+		scalar Intermediate_4 = Tensor_395[Intermediate_0*1 + 0];
+		scalar Intermediate_5 = Intermediate_4 * Intermediate_2;
+		scalar Intermediate_6 = Intermediate_5 + Intermediate_5;
+		scalar Intermediate_7 = Tensor_396[i*1 + 0];
+		scalar Intermediate_8 = Intermediate_7 * Intermediate_6;
+		scalar Intermediate_9 = Intermediate_4 * Intermediate_4;
+		scalar Intermediate_10 = Tensor_426[i*1 + 0];
+		scalar Intermediate_11 = Intermediate_10 * Intermediate_9;
+		scalar Intermediate_12 = Intermediate_11 + Intermediate_8;
+		Tensor_427[Intermediate_0*1 + 0] += Intermediate_12;
+		
+		scalar Intermediate_14 = Intermediate_9 * Intermediate_7;
+		Tensor_401[Intermediate_0*1 + 0] += Intermediate_14;
+		
+	}
+}
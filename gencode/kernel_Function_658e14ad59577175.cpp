@@ -0,0 +1,19 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_658e14ad59577175(int n, const scalar* __restrict__ Tensor_512, scalar* __restrict__ Tensor_514) {
+	// 7 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_512[i*3 + 2];
+		integer Intermediate_1 = 2;
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		Tensor_514[i*3 + 2] += Intermediate_2;
+		scalar Intermediate_3 = Tensor_512[i*3 + 1];
+		scalar Intermediate_4 = Intermediate_1 * Intermediate_3;
+		Tensor_514[i*3 + 1] += Intermediate_4;
+		scalar Intermediate_5 = Tensor_512[i*3 + 0];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		Tensor_514[i*3 + 0] += Intermediate_6;
+	}
+}
@@ -0,0 +1,21 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_6b5efee149c717af(int n, const scalar* __restrict__ Tensor_17, const scalar* __restrict__ Tensor_18, scalar* __restrict__ Tensor_20, scalar* __restrict__ Tensor_22) {
+	// 6 ops, 0 removed by simplification
+	integer i;
+	scalar Reduce_3 = numeric_limits<scalar>::lowest();
+	scalar Reduce_5 = 0;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_17[i*1 + 0];
+		scalar Intermediate_1 = Tensor_18[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 + Intermediate_0;
+		Reduce_3 = max(Intermediate_2, Reduce_3);
+		
+		scalar Intermediate_4 = Intermediate_1 * Intermediate_0;
+		Reduce_5 += Intermediate_4;
+		
+	}
+	Tensor_22[0] = max(Reduce_3, Tensor_22[0]);
+	Tensor_20[0] += Reduce_5;
+}
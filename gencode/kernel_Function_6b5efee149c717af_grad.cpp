@@ -0,0 +1,18 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_6b5efee149c717af_grad(int n, const scalar* __restrict__ Tensor_17, const scalar* __restrict__ Tensor_18, const scalar* __restrict__ Tensor_23, scalar* __restrict__ Tensor_25, scalar* __restrict__ Tensor_26) {
+	// 6 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		
+		scalar Intermediate_1 = Tensor_23[0];
+		
+		scalar Intermediate_2 = Tensor_17[i*1 + 0];
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_1;
+		Tensor_26[i*1 + 0] += Intermediate_3;
+		scalar Intermediate_4 = Tensor_18[i*1 + 0];
+		scalar Intermediate_5 = Intermediate_1 * Intermediate_4;
+		Tensor_25[i*1 + 0] += Intermediate_5;
+	}
+}
@@ -0,0 +1,22 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_6bccdd666c846922(int n, const scalar* __restrict__ Tensor_0, const scalar* __restrict__ Tensor_1, const scalar* __restrict__ Tensor_2, const scalar* __restrict__ Tensor_3, scalar* __restrict__ Tensor_9, scalar* __restrict__ Tensor_10) {
+	// 11 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_3[i*1 + 0];
+		scalar Intermediate_1 = Tensor_2[i*1 + 0];
+		scalar Intermediate_2 = Tensor_0[i*1 + 0];
+		integer Intermediate_3 = 2;
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_2;
+		scalar Intermediate_5 = Tensor_1[i*1 + 0];
+		integer Intermediate_6 = 3;
+		scalar Intermediate_7 = Intermediate_6 * Intermediate_5;
+		scalar Intermediate_8 = Intermediate_7 + Intermediate_4;
+		scalar Intermediate_9 = Intermediate_8 - Intermediate_1;
+		Tensor_9[i*1 + 0] += Intermediate_9;
+		scalar Intermediate_10 = Intermediate_9 / Intermediate_0;
+		Tensor_10[i*1 + 0] += Intermediate_10;
+	}
+}
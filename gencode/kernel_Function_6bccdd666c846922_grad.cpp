@@ -0,0 +1,34 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_6bccdd666c846922_grad(int n, const scalar* __restrict__ Tensor_0, const scalar* __restrict__ Tensor_1, const scalar* __restrict__ Tensor_2, const scalar* __restrict__ Tensor_3, const scalar* __restrict__ Tensor_11, const scalar* __restrict__ Tensor_12, scalar* __restrict__ Tensor_13, scalar* __restrict__ Tensor_14, scalar* __restrict__ Tensor_15, scalar* __restrict__ Tensor_16) {
+	// 21 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_3[i*1 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		scalar Intermediate_2 = Tensor_12[i*1 + 0];
+		scalar Intermediate_3 = Tensor_2[i*1 + 0];
+		scalar Intermediate_4 = Tensor_0[i*1 + 0];
+		integer Intermediate_5 = 2;
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_4;
+		scalar Intermediate_7 = Tensor_1[i*1 + 0];
+		integer Intermediate_8 = 3;
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_7;
+		scalar Intermediate_10 = Intermediate_9 + Intermediate_6;
+		scalar Intermediate_11 = Intermediate_10 - Intermediate_3;
+		scalar Intermediate_12 = Intermediate_11 * Intermediate_2;
+		scalar Intermediate_13 = Intermediate_12 / Intermediate_1;
+		scalar Intermediate_14 = -(Intermediate_13);
+		Tensor_16[i*1 + 0] += Intermediate_14;
+		scalar Intermediate_15 = Tensor_11[i*1 + 0];
+		scalar Intermediate_16 = Intermediate_2 / Intermediate_0;
+		scalar Intermediate_17 = Intermediate_16 + Intermediate_15;
+		scalar Intermediate_18 = -(Intermediate_17);
+		Tensor_15[i*1 + 0] += Intermediate_18;
+		scalar Intermediate_19 = Intermediate_8 * Intermediate_17;
+		Tensor_14[i*1 + 0] += Intermediate_19;
+		scalar Intermediate_20 = Intermediate_5 * Intermediate_17;
+		Tensor_13[i*1 + 0] += Intermediate_20;
+	}
+}
@@ -0,0 +1,32 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_71e7469369e8a76f(int n, const scalar* __restrict__ Tensor_247, const scalar* __restrict__ Tensor_248, const integer* __restrict__ Tensor_249, const integer* __restrict__ Tensor_250, scalar* __restrict__ Tensor_254, const integer* __restrict__ Order, const integer* __restrict__ Colors, integer nColors) {
+	// 14 ops, 0 removed by simplification
+	integer i;
+	integer j;
+	for (integer c = 0; c < nColors; c++) {
+	#pragma omp parallel for private(i, j)
+	for (j = Colors[c]; j < Colors[c+1]; j++) {
+		i = Order[j];
+		integer Intermediate_0 = Tensor_250[i*1 + 0];
+		scalar Intermediate_1 = Tensor_247[i*2 + 1];
+		scalar Intermediate_2 = -(Intermediate_1);
+		integer Intermediate_3 = Tensor_249[i*1 + 0];
+		
+		scalar Intermediate_5 = Tensor_248[Intermediate_3*2 + 1];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		Tensor_254[Intermediate_3*2 + 1] += Intermediate_6;
+		Tensor_254[Intermediate_0*2 + 1] += Intermediate_2;
+		
+		scalar Intermediate_8 = Tensor_247[i*2 + 0];
+		scalar Intermediate_9 = -(Intermediate_8);
+		
+		scalar Intermediate_11 = Tensor_248[Intermediate_3*2 + 0];
+		scalar Intermediate_12 = Intermediate_8 * Intermediate_11;
+		Tensor_254[Intermediate_3*2 + 0] += Intermediate_12;
+		Tensor_254[Intermediate_0*2 + 0] += Intermediate_9;
+		
+	}
+	}
+}
@@ -0,0 +1,40 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_71e7469369e8a76f_grad(int n, const scalar* __restrict__ Tensor_247, const scalar* __restrict__ Tensor_248, const integer* __restrict__ Tensor_249, const integer* __restrict__ Tensor_250, const scalar* __restrict__ Tensor_255, scalar* __restrict__ Tensor_256, scalar* __restrict__ Tensor_257, const integer* __restrict__ Order, const integer* __restrict__ Colors, integer nColors) {
+	// 22 ops, 2 removed by simplification
+	integer i;
+	integer j;
+	for (integer c = 0; c < nColors; c++) {
+	#pragma omp parallel for private(i, j)
+	for (j = Colors[c]; j < Colors[c+1]; j++) {
+		i = Order[j];
+		integer Intermediate_0 = Tensor_249[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_255[Intermediate_0*2 + 1];
+		scalar Intermediate_3 = Tensor_247[i*2 + 1];
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_2;
+		Tensor_257[Intermediate_0*2 + 1] += Intermediate_4;
+		
+		
+		scalar Intermediate_7 = Tensor_255[Intermediate_0*2 + 0];
+		scalar Intermediate_8 = Tensor_247[i*2 + 0];
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_7;
+		Tensor_257[Intermediate_0*2 + 0] += Intermediate_9;
+		
+		integer Intermediate_11 = Tensor_250[i*1 + 0];
+		scalar Intermediate_12 = Tensor_255[Intermediate_11*2 + 1];
+		
+		scalar Intermediate_14 = Tensor_248[Intermediate_0*2 + 1];
+		scalar Intermediate_15 = Intermediate_2 * Intermediate_14;
+		scalar Intermediate_16 = Intermediate_15 - Intermediate_12;
+		Tensor_256[i*2 + 1] += Intermediate_16;
+		scalar Intermediate_17 = Tensor_255[Intermediate_11*2 + 0];
+		
+		scalar Intermediate_19 = Tensor_248[Intermediate_0*2 + 0];
+		scalar Intermediate_20 = Intermediate_7 * Intermediate_19;
+		scalar Intermediate_21 = Intermediate_20 - Intermediate_17;
+		Tensor_256[i*2 + 0] += Intermediate_21;
+	}
+	}
+}
@@ -0,0 +1,12 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_74e9e24c259c9e2a(int n, const scalar* __restrict__ Tensor_100, scalar* __restrict__ Tensor_106) {
+	// 2 ops, 7 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_100[i*1 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		Tensor_106[i*1 + 0] += Intermediate_1;
+	}
+}
@@ -0,0 +1,14 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_74e9e24c259c9e2a_grad(int n, const scalar* __restrict__ Tensor_100, const scalar* __restrict__ Tensor_110, scalar* __restrict__ Tensor_112) {
+	// 4 ops, 7 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_100[i*1 + 0];
+		scalar Intermediate_1 = Tensor_110[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		scalar Intermediate_3 = Intermediate_2 + Intermediate_2;
+		Tensor_112[i*1 + 0] += Intermediate_3;
+	}
+}
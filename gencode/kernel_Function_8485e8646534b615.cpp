@@ -0,0 +1,12 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_8485e8646534b615(int n, const scalar* __restrict__ Tensor_445, scalar* __restrict__ Tensor_448) {
+	// 2 ops, 2 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_445[i*1 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		Tensor_448[i*1 + 0] += Intermediate_1;
+	}
+}
@@ -0,0 +1,14 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_8485e8646534b615_grad(int n, const scalar* __restrict__ Tensor_445, const scalar* __restrict__ Tensor_449, scalar* __restrict__ Tensor_450) {
+	// 4 ops, 2 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_449[i*1 + 0];
+		scalar Intermediate_1 = Tensor_445[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		scalar Intermediate_3 = Intermediate_2 + Intermediate_2;
+		Tensor_450[i*1 + 0] += Intermediate_3;
+	}
+}
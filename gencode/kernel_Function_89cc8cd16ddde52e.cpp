@@ -0,0 +1,18 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_89cc8cd16ddde52e(int n, const scalar* __restrict__ Tensor_439, scalar* __restrict__ Tensor_442) {
+	// 6 ops, 4 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_439[i*3 + 2];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		Tensor_442[i*3 + 2] += Intermediate_1;
+		scalar Intermediate_2 = Tensor_439[i*3 + 1];
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_2;
+		Tensor_442[i*3 + 1] += Intermediate_3;
+		scalar Intermediate_4 = Tensor_439[i*3 + 0];
+		scalar Intermediate_5 = Intermediate_4 * Intermediate_4;
+		Tensor_442[i*3 + 0] += Intermediate_5;
+	}
+}
@@ -0,0 +1,24 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_89cc8cd16ddde52e_grad(int n, const scalar* __restrict__ Tensor_439, const scalar* __restrict__ Tensor_443, scalar* __restrict__ Tensor_444) {
+	// 12 ops, 4 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_443[i*3 + 2];
+		scalar Intermediate_1 = Tensor_439[i*3 + 2];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		scalar Intermediate_3 = Intermediate_2 + Intermediate_2;
+		Tensor_444[i*3 + 2] += Intermediate_3;
+		scalar Intermediate_4 = Tensor_443[i*3 + 1];
+		scalar Intermediate_5 = Tensor_439[i*3 + 1];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_4;
+		scalar Intermediate_7 = Intermediate_6 + Intermediate_6;
+		Tensor_444[i*3 + 1] += Intermediate_7;
+		scalar Intermediate_8 = Tensor_443[i*3 + 0];
+		scalar Intermediate_9 = Tensor_439[i*3 + 0];
+		scalar Intermediate_10 = Intermediate_9 * Intermediate_8;
+		scalar Intermediate_11 = Intermediate_10 + Intermediate_10;
+		Tensor_444[i*3 + 0] += Intermediate_11;
+	}
+}
@@ -0,0 +1,15 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_8d38dd52c38eca16(int n, const scalar* __restrict__ Tensor_374, const scalar* __restrict__ Tensor_375, scalar* __restrict__ Tensor_377) {
+	// 4 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_374[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_375[0];
+		
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_0;
+		Tensor_377[i*1 + 0] += Intermediate_3;
+	}
+}
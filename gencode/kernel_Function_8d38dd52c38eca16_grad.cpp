@@ -0,0 +1,21 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_8d38dd52c38eca16_grad(int n, const scalar* __restrict__ Tensor_374, const scalar* __restrict__ Tensor_375, const scalar* __restrict__ Tensor_378, scalar* __restrict__ Tensor_379, scalar* __restrict__ Tensor_380) {
+	// 7 ops, 0 removed by simplification
+	integer i;
+	scalar Reduce_3 = 0;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_378[i*1 + 0];
+		scalar Intermediate_1 = Tensor_374[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		Reduce_3 += Intermediate_2;
+		
+		
+		scalar Intermediate_5 = Tensor_375[0];
+		
+		scalar Intermediate_6 = Intermediate_0 * Intermediate_5;
+		Tensor_379[i*1 + 0] += Intermediate_6;
+	}
+	Tensor_380[0] += Reduce_3;
+}
@@ -0,0 +1,23 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_8d38dd52c38eca16_tangent(int n, const scalar* __restrict__ Tensor_374, const scalar* __restrict__ Tensor_375, const scalar* __restrict__ Tensor_389, const scalar* __restrict__ Tensor_390, scalar* __restrict__ Tensor_377, scalar* __restrict__ Tensor_391) {
+	// 10 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_389[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_375[0];
+		
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_0;
+		scalar Intermediate_4 = Tensor_374[i*1 + 0];
+		
+		scalar Intermediate_6 = Tensor_390[0];
+		
+		scalar Intermediate_7 = Intermediate_6 * Intermediate_4;
+		scalar Intermediate_8 = Intermediate_7 + Intermediate_3;
+		Tensor_391[i*1 + 0] += Intermediate_8;
+		scalar Intermediate_9 = Intermediate_4 * Intermediate_2;
+		Tensor_377[i*1 + 0] += Intermediate_9;
+	}
+}
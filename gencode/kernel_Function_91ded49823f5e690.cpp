@@ -0,0 +1,21 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_91ded49823f5e690(int n, const scalar* __restrict__ Tensor_62, const integer* __restrict__ Tensor_63, const scalar* __restrict__ Tensor_64, scalar* __restrict__ Tensor_70) {
+	// 9 ops, 0 removed by simplification
+	integer i;
+	scalar Reduce_8 = 0;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_62[i*1 + 0];
+		integer Intermediate_1 = 2;
+		scalar Intermediate_2 = Intermediate_1 + Intermediate_0;
+		integer Intermediate_3 = Tensor_63[i*1 + 0];
+		
+		scalar Intermediate_5 = Tensor_64[Intermediate_3*1 + 0];
+		scalar Intermediate_6 = Intermediate_5 / Intermediate_2;
+		scalar Intermediate_7 = sqrt(Intermediate_6);
+		Reduce_8 += Intermediate_7;
+		
+	}
+	Tensor_70[0] += Reduce_8;
+}
@@ -0,0 +1,31 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_91ded49823f5e690_grad(int n, const scalar* __restrict__ Tensor_62, const integer* __restrict__ Tensor_63, const scalar* __restrict__ Tensor_64, const scalar* __restrict__ Tensor_71, scalar* __restrict__ Tensor_72, scalar* __restrict__ Tensor_74) {
+	// 19 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_63[i*1 + 0];
+		scalar Intermediate_1 = Tensor_62[i*1 + 0];
+		integer Intermediate_2 = 2;
+		scalar Intermediate_3 = Intermediate_2 + Intermediate_1;
+		
+		scalar Intermediate_5 = Tensor_64[Intermediate_0*1 + 0];
+		scalar Intermediate_6 = Intermediate_5 / Intermediate_3;
+		scalar Intermediate_7 = sqrt(Intermediate_6);
+		integer Intermediate_8 = 2;
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_7;
+		
+		scalar Intermediate_11 = Tensor_71[0];
+		
+		scalar Intermediate_12 = Intermediate_11 / Intermediate_9;
+		scalar Intermediate_13 = Intermediate_12 / Intermediate_3;
+		Tensor_74[Intermediate_0*1 + 0] += Intermediate_13;
+		
+		scalar Intermediate_15 = Intermediate_3 * Intermediate_3;
+		scalar Intermediate_16 = Intermediate_5 * Intermediate_12;
+		scalar Intermediate_17 = Intermediate_16 / Intermediate_15;
+		scalar Intermediate_18 = -(Intermediate_17);
+		Tensor_72[i*1 + 0] += Intermediate_18;
+	}
+}
@@ -0,0 +1,26 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_a1b285ddd8238e9f(int n, const scalar* __restrict__ Tensor_406, const scalar* __restrict__ Tensor_407, const scalar* __restrict__ Tensor_408, scalar* __restrict__ Tensor_420) {
+	// 14 ops, 0 removed by simplification
+	integer i;
+	scalar Reduce_13 = 0;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_406[i*1 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		integer Intermediate_2 = 1;
+		scalar Intermediate_3 = Intermediate_2 + Intermediate_1;
+		scalar Intermediate_4 = sqrt(Intermediate_3);
+		scalar Intermediate_5 = Tensor_408[i*1 + 0];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_4;
+		scalar Intermediate_7 = Intermediate_2 + Intermediate_5;
+		scalar Intermediate_8 = Tensor_407[i*1 + 0];
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_8;
+		scalar Intermediate_10 = Intermediate_8 * Intermediate_9;
+		scalar Intermediate_11 = Intermediate_10 / Intermediate_7;
+		scalar Intermediate_12 = Intermediate_11 + Intermediate_6;
+		Reduce_13 += Intermediate_12;
+		
+	}
+	Tensor_420[0] += Reduce_13;
+}
@@ -0,0 +1,42 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_a1b285ddd8238e9f_grad(int n, const scalar* __restrict__ Tensor_406, const scalar* __restrict__ Tensor_407, const scalar* __restrict__ Tensor_408, const scalar* __restrict__ Tensor_421, scalar* __restrict__ Tensor_422, scalar* __restrict__ Tensor_423, scalar* __restrict__ Tensor_424) {
+	// 29 ops, 1 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_408[i*1 + 0];
+		integer Intermediate_1 = 1;
+		scalar Intermediate_2 = Intermediate_1 + Intermediate_0;
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_2;
+		
+		scalar Intermediate_5 = Tensor_421[0];
+		
+		scalar Intermediate_6 = Tensor_407[i*1 + 0];
+		scalar Intermediate_7 = Intermediate_6 * Intermediate_6;
+		scalar Intermediate_8 = Intermediate_6 * Intermediate_7;
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_5;
+		scalar Intermediate_10 = Intermediate_9 / Intermediate_3;
+		scalar Intermediate_11 = Tensor_406[i*1 + 0];
+		scalar Intermediate_12 = Intermediate_11 * Intermediate_11;
+		scalar Intermediate_13 = Intermediate_1 + Intermediate_12;
+		scalar Intermediate_14 = sqrt(Intermediate_13);
+		scalar Intermediate_15 = Intermediate_5 * Intermediate_14;
+		scalar Intermediate_16 = Intermediate_15 - Intermediate_10;
+		Tensor_424[i*1 + 0] += Intermediate_16;
+		scalar Intermediate_17 = Intermediate_5 / Intermediate_2;
+		scalar Intermediate_18 = Intermediate_6 * Intermediate_17;
+		scalar Intermediate_19 = Intermediate_6 * Intermediate_18;
+		scalar Intermediate_20 = Intermediate_19 + Intermediate_19;
+		scalar Intermediate_21 = Intermediate_7 * Intermediate_17;
+		scalar Intermediate_22 = Intermediate_21 + Intermediate_20;
+		Tensor_423[i*1 + 0] += Intermediate_22;
+		integer Intermediate_23 = 2;
+		scalar Intermediate_24 = Intermediate_14 * Intermediate_23;
+		scalar Intermediate_25 = Intermediate_0 * Intermediate_5;
+		scalar Intermediate_26 = Intermediate_25 / Intermediate_24;
+		scalar Intermediate_27 = Intermediate_11 * Intermediate_26;
+		scalar Intermediate_28 = Intermediate_27 + Intermediate_27;
+		Tensor_422[i*1 + 0] += Intermediate_28;
+	}
+}
@@ -0,0 +1,88 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_a1b285ddd8238e9f_grad_tangent_1110(int n, const scalar* __restrict__ Tensor_406, const scalar* __restrict__ Tensor_407, const scalar* __restrict__ Tensor_408, const scalar* __restrict__ Tensor_421, const scalar* __restrict__ Tensor_428, const scalar* __restrict__ Tensor_429, const scalar* __restrict__ Tensor_430, scalar* __restrict__ Tensor_422, scalar* __restrict__ Tensor_423, scalar* __restrict__ Tensor_424, scalar* __restrict__ Tensor_431, scalar* __restrict__ Tensor_432, scalar* __restrict__ Tensor_433) {
+	// 72 ops, 8 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_406[i*1 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		integer Intermediate_2 = 1;
+		scalar Intermediate_3 = Intermediate_2 + Intermediate_1;
+		scalar Intermediate_4 = sqrt(Intermediate_3);
+		integer Intermediate_5 = 2;
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_4;
+		scalar Intermediate_7 = Tensor_428[i*1 + 0];
+		scalar Intermediate_8 = Intermediate_0 * Intermediate_7;
+		scalar Intermediate_9 = Intermediate_8 + Intermediate_8;
+		scalar Intermediate_10 = Intermediate_9 / Intermediate_6;
+		
+		scalar Intermediate_12 = Tensor_421[0];
+		
+		scalar Intermediate_13 = Intermediate_12 * Intermediate_10;
+		scalar Intermediate_14 = Tensor_408[i*1 + 0];
+		scalar Intermediate_15 = Intermediate_2 + Intermediate_14;
+		scalar Intermediate_16 = Intermediate_15 * Intermediate_15;
+		scalar Intermediate_17 = Tensor_429[i*1 + 0];
+		scalar Intermediate_18 = Tensor_407[i*1 + 0];
+		scalar Intermediate_19 = Intermediate_18 * Intermediate_17;
+		scalar Intermediate_20 = Intermediate_19 + Intermediate_19;
+		scalar Intermediate_21 = Intermediate_18 * Intermediate_20;
+		scalar Intermediate_22 = Intermediate_18 * Intermediate_18;
+		scalar Intermediate_23 = Intermediate_22 * Intermediate_17;
+		scalar Intermediate_24 = Intermediate_23 + Intermediate_21;
+		scalar Intermediate_25 = Intermediate_12 * Intermediate_24;
+		scalar Intermediate_26 = Intermediate_18 * Intermediate_22;
+		scalar Intermediate_27 = Intermediate_26 * Intermediate_12;
+		scalar Intermediate_28 = Intermediate_27 / Intermediate_16;
+		scalar Intermediate_29 = Tensor_430[i*1 + 0];
+		scalar Intermediate_30 = Intermediate_15 * Intermediate_29;
+		scalar Intermediate_31 = Intermediate_30 + Intermediate_30;
+		scalar Intermediate_32 = Intermediate_31 * Intermediate_28;
+		scalar Intermediate_33 = Intermediate_32 - Intermediate_25;
+		scalar Intermediate_34 = Intermediate_33 / Intermediate_16;
+		scalar Intermediate_35 = Intermediate_34 + Intermediate_13;
+		Tensor_433[i*1 + 0] += Intermediate_35;
+		scalar Intermediate_36 = Intermediate_12 / Intermediate_15;
+		scalar Intermediate_37 = Intermediate_29 * Intermediate_36;
+		scalar Intermediate_38 = Intermediate_37 / Intermediate_15;
+		scalar Intermediate_39 = Intermediate_18 * Intermediate_38;
+		scalar Intermediate_40 = Intermediate_17 * Intermediate_36;
+		scalar Intermediate_41 = Intermediate_40 - Intermediate_39;
+		scalar Intermediate_42 = Intermediate_18 * Intermediate_41;
+		scalar Intermediate_43 = Intermediate_18 * Intermediate_36;
+		scalar Intermediate_44 = Intermediate_17 * Intermediate_43;
+		scalar Intermediate_45 = Intermediate_44 + Intermediate_42;
+		scalar Intermediate_46 = Intermediate_45 + Intermediate_45;
+		scalar Intermediate_47 = Intermediate_22 * Intermediate_38;
+		scalar Intermediate_48 = Intermediate_20 * Intermediate_36;
+		scalar Intermediate_49 = Intermediate_48 - Intermediate_47;
+		scalar Intermediate_50 = Intermediate_49 + Intermediate_46;
+		Tensor_432[i*1 + 0] += Intermediate_50;
+		integer Intermediate_51 = 2;
+		scalar Intermediate_52 = Intermediate_4 * Intermediate_51;
+		scalar Intermediate_53 = Intermediate_10 * Intermediate_51;
+		scalar Intermediate_54 = Intermediate_14 * Intermediate_12;
+		scalar Intermediate_55 = Intermediate_54 / Intermediate_52;
+		scalar Intermediate_56 = Intermediate_55 * Intermediate_53;
+		scalar Intermediate_57 = Intermediate_29 * Intermediate_12;
+		scalar Intermediate_58 = Intermediate_57 - Intermediate_56;
+		scalar Intermediate_59 = Intermediate_58 / Intermediate_52;
+		scalar Intermediate_60 = Intermediate_0 * Intermediate_59;
+		scalar Intermediate_61 = Intermediate_7 * Intermediate_55;
+		scalar Intermediate_62 = Intermediate_61 + Intermediate_60;
+		scalar Intermediate_63 = Intermediate_62 + Intermediate_62;
+		Tensor_431[i*1 + 0] += Intermediate_63;
+		scalar Intermediate_64 = Intermediate_12 * Intermediate_4;
+		scalar Intermediate_65 = Intermediate_64 - Intermediate_28;
+		Tensor_424[i*1 + 0] += Intermediate_65;
+		scalar Intermediate_66 = Intermediate_18 * Intermediate_43;
+		scalar Intermediate_67 = Intermediate_66 + Intermediate_66;
+		scalar Intermediate_68 = Intermediate_22 * Intermediate_36;
+		scalar Intermediate_69 = Intermediate_68 + Intermediate_67;
+		Tensor_423[i*1 + 0] += Intermediate_69;
+		scalar Intermediate_70 = Intermediate_0 * Intermediate_55;
+		scalar Intermediate_71 = Intermediate_70 + Intermediate_70;
+		Tensor_422[i*1 + 0] += Intermediate_71;
+	}
+}
@@ -0,0 +1,26 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_a2f377922778cc1c(int n, const scalar* __restrict__ Tensor_301, const scalar* __restrict__ Tensor_302, const integer* __restrict__ Tensor_303, scalar* __restrict__ Tensor_306) {
+	// 14 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_303[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_301[Intermediate_0*3 + 2];
+		scalar Intermediate_3 = Tensor_302[i*1 + 0];
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_2;
+		Tensor_306[Intermediate_0*3 + 2] += Intermediate_4;
+		
+		
+		scalar Intermediate_7 = Tensor_301[Intermediate_0*3 + 1];
+		scalar Intermediate_8 = Intermediate_3 * Intermediate_7;
+		Tensor_306[Intermediate_0*3 + 1] += Intermediate_8;
+		
+		
+		scalar Intermediate_11 = Tensor_301[Intermediate_0*3 + 0];
+		scalar Intermediate_12 = Intermediate_3 * Intermediate_11;
+		Tensor_306[Intermediate_0*3 + 0] += Intermediate_12;
+		
+	}
+}
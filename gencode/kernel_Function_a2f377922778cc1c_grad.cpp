@@ -0,0 +1,38 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_a2f377922778cc1c_grad(int n, const scalar* __restrict__ Tensor_301, const scalar* __restrict__ Tensor_302, const integer* __restrict__ Tensor_303, const scalar* __restrict__ Tensor_307, scalar* __restrict__ Tensor_308, scalar* __restrict__ Tensor_309) {
+	// 25 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_303[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_307[Intermediate_0*3 + 0];
+		
+		scalar Intermediate_4 = Tensor_301[Intermediate_0*3 + 0];
+		scalar Intermediate_5 = Intermediate_4 * Intermediate_2;
+		
+		scalar Intermediate_7 = Tensor_307[Intermediate_0*3 + 1];
+		
+		scalar Intermediate_9 = Tensor_301[Intermediate_0*3 + 1];
+		scalar Intermediate_10 = Intermediate_9 * Intermediate_7;
+		scalar Intermediate_11 = Intermediate_10 + Intermediate_5;
+		
+		scalar Intermediate_13 = Tensor_307[Intermediate_0*3 + 2];
+		
+		scalar Intermediate_15 = Tensor_301[Intermediate_0*3 + 2];
+		scalar Intermediate_16 = Intermediate_15 * Intermediate_13;
+		scalar Intermediate_17 = Intermediate_16 + Intermediate_11;
+		Tensor_309[i*1 + 0] += Intermediate_17;
+		scalar Intermediate_18 = Tensor_302[i*1 + 0];
+		scalar Intermediate_19 = Intermediate_13 * Intermediate_18;
+		Tensor_308[Intermediate_0*3 + 2] += Intermediate_19;
+		
+		scalar Intermediate_21 = Intermediate_7 * Intermediate_18;
+		Tensor_308[Intermediate_0*3 + 1] += Intermediate_21;
+		
+		scalar Intermediate_23 = Intermediate_2 * Intermediate_18;
+		Tensor_308[Intermediate_0*3 + 0] += Intermediate_23;
+		
+	}
+}
@@ -0,0 +1,29 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_a3f0ed5e08e82787(int n, const scalar* __restrict__ Tensor_359, const integer* __restrict__ Tensor_360, const scalar* __restrict__ Tensor_361, scalar* __restrict__ Tensor_369) {
+	// 11 ops, 0 removed by simplification
+	integer i;
+	scalar Reduce_10 = 0;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = 2;
+		scalar Intermediate_1 = Tensor_359[i*1 + 0];
+		scalar Intermediate_2 = pow(Intermediate_1, Intermediate_0);
+		integer Intermediate_3 = Tensor_360[i*1 + 0];
+		
+		scalar Intermediate_5 = Tensor_361[Intermediate_3*1 + 0];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		int Intermediate_7 = Intermediate_2 < Intermediate_6;
+		
+                scalar Intermediate_8;
+                if (Intermediate_7) 
+                    Intermediate_8 = Intermediate_6;
+                else 
+                    Intermediate_8 = Intermediate_2;
+                
+		scalar Intermediate_9 = sqrt(Intermediate_8);
+		Reduce_10 += Intermediate_9;
+		
+	}
+	Tensor_369[0] += Reduce_10;
+}
@@ -0,0 +1,54 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_a3f0ed5e08e82787_grad(int n, const scalar* __restrict__ Tensor_359, const integer* __restrict__ Tensor_360, const scalar* __restrict__ Tensor_361, const scalar* __restrict__ Tensor_370, scalar* __restrict__ Tensor_371, scalar* __restrict__ Tensor_373) {
+	// 24 ops, 4 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_360[i*1 + 0];
+		scalar Intermediate_1 = 0.0;
+		integer Intermediate_2 = 2;
+		scalar Intermediate_3 = Tensor_359[i*1 + 0];
+		scalar Intermediate_4 = pow(Intermediate_3, Intermediate_2);
+		
+		scalar Intermediate_6 = Tensor_361[Intermediate_0*1 + 0];
+		scalar Intermediate_7 = Intermediate_3 * Intermediate_6;
+		int Intermediate_8 = Intermediate_4 < Intermediate_7;
+		
+                scalar Intermediate_9;
+                if (Intermediate_8) 
+                    Intermediate_9 = Intermediate_7;
+                else 
+                    Intermediate_9 = Intermediate_4;
+                
+		scalar Intermediate_10 = sqrt(Intermediate_9);
+		integer Intermediate_11 = 2;
+		scalar Intermediate_12 = Intermediate_11 * Intermediate_10;
+		
+		scalar Intermediate_14 = Tensor_370[0];
+		
+		scalar Intermediate_15 = Intermediate_14 / Intermediate_12;
+		
+                scalar Intermediate_16;
+                if (Intermediate_8) 
+                    Intermediate_16 = Intermediate_15;
+                else 
+                    Intermediate_16 = Intermediate_1;
+                
+		scalar Intermediate_17 = Intermediate_3 * Intermediate_16;
+		Tensor_373[Intermediate_0*1 + 0] += Intermediate_17;
+		
+		scalar Intermediate_19 = Intermediate_6 * Intermediate_16;
+		
+                scalar Intermediate_20;
+                if (Intermediate_8) 
+                    Intermediate_20 = Intermediate_1;
+                else 
+                    Intermediate_20 = Intermediate_15;
+                
+		scalar Intermediate_21 = Intermediate_2 * Intermediate_20;
+		scalar Intermediate_22 = Intermediate_3 * Intermediate_21;
+		scalar Intermediate_23 = Intermediate_22 + Intermediate_19;
+		Tensor_371[i*1 + 0] += Intermediate_23;
+	}
+}
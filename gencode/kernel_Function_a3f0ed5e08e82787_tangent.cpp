@@ -0,0 +1,51 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_a3f0ed5e08e82787_tangent(int n, const scalar* __restrict__ Tensor_359, const integer* __restrict__ Tensor_360, const scalar* __restrict__ Tensor_361, const scalar* __restrict__ Tensor_386, const scalar* __restrict__ Tensor_387, scalar* __restrict__ Tensor_369, scalar* __restrict__ Tensor_388) {
+	// 24 ops, 3 removed by simplification
+	integer i;
+	scalar Reduce_22 = 0;
+	scalar Reduce_23 = 0;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = 2;
+		scalar Intermediate_1 = Tensor_359[i*1 + 0];
+		scalar Intermediate_2 = pow(Intermediate_1, Intermediate_0);
+		integer Intermediate_3 = Tensor_360[i*1 + 0];
+		
+		scalar Intermediate_5 = Tensor_361[Intermediate_3*1 + 0];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		int Intermediate_7 = Intermediate_2 < Intermediate_6;
+		
+                scalar Intermediate_8;
+                if (Intermediate_7) 
+                    Intermediate_8 = Intermediate_6;
+                else 
+                    Intermediate_8 = Intermediate_2;
+                
+		scalar Intermediate_9 = sqrt(Intermediate_8);
+		integer Intermediate_10 = 2;
+		scalar Intermediate_11 = Intermediate_10 * Intermediate_9;
+		scalar Intermediate_12 = Tensor_386[i*1 + 0];
+		scalar Intermediate_13 = Intermediate_0 * Intermediate_12;
+		scalar Intermediate_14 = Intermediate_1 * Intermediate_13;
+		
+		scalar Intermediate_16 = Tensor_387[Intermediate_3*1 + 0];
+		scalar Intermediate_17 = Intermediate_1 * Intermediate_16;
+		scalar Intermediate_18 = Intermediate_5 * Intermediate_12;
+		scalar Intermediate_19 = Intermediate_18 + Intermediate_17;
+		
+                scalar Intermediate_20;
+                if (Intermediate_7) 
+                    Intermediate_20 = Intermediate_19;
+                else 
+                    Intermediate_20 = Intermediate_14;
+                
+		scalar Intermediate_21 = Intermediate_20 / Intermediate_11;
+		Reduce_22 += Intermediate_21;
+		
+		Reduce_23 += Intermediate_9;
+		
+	}
+	Tensor_388[0] += Reduce_22;
+	Tensor_369[0] += Reduce_23;
+}
@@ -0,0 +1,22 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_abde4862a126a336(int n, const scalar* __restrict__ Tensor_457, scalar* __restrict__ Tensor_460) {
+	// 10 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_457[i*3 + 2];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		integer Intermediate_2 = 2;
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_1;
+		Tensor_460[i*3 + 2] += Intermediate_3;
+		scalar Intermediate_4 = Tensor_457[i*3 + 1];
+		scalar Intermediate_5 = Intermediate_4 * Intermediate_4;
+		scalar Intermediate_6 = Intermediate_2 * Intermediate_5;
+		Tensor_460[i*3 + 1] += Intermediate_6;
+		scalar Intermediate_7 = Tensor_457[i*3 + 0];
+		scalar Intermediate_8 = Intermediate_7 * Intermediate_7;
+		scalar Intermediate_9 = Intermediate_2 * Intermediate_8;
+		Tensor_460[i*3 + 0] += Intermediate_9;
+	}
+}
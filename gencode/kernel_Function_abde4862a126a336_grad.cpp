@@ -0,0 +1,28 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_abde4862a126a336_grad(int n, const scalar* __restrict__ Tensor_457, const scalar* __restrict__ Tensor_461, scalar* __restrict__ Tensor_462) {
+	// 16 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_461[i*3 + 2];
+		integer Intermediate_1 = 2;
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		scalar Intermediate_3 = Tensor_457[i*3 + 2];
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_2;
+		scalar Intermediate_5 = Intermediate_4 + Intermediate_4;
+		Tensor_462[i*3 + 2] += Intermediate_5;
+		scalar Intermediate_6 = Tensor_461[i*3 + 1];
+		scalar Intermediate_7 = Intermediate_1 * Intermediate_6;
+		scalar Intermediate_8 = Tensor_457[i*3 + 1];
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_7;
+		scalar Intermediate_10 = Intermediate_9 + Intermediate_9;
+		Tensor_462[i*3 + 1] += Intermediate_10;
+		scalar Intermediate_11 = Tensor_461[i*3 + 0];
+		scalar Intermediate_12 = Intermediate_1 * Intermediate_11;
+		scalar Intermediate_13 = Tensor_457[i*3 + 0];
+		scalar Intermediate_14 = Intermediate_13 * Intermediate_12;
+		scalar Intermediate_15 = Intermediate_14 + Intermediate_14;
+		Tensor_462[i*3 + 0] += Intermediate_15;
+	}
+}
@@ -0,0 +1,22 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_af9ee1bb263345d6(int n, const scalar* __restrict__ Tensor_123, const scalar* __restrict__ Tensor_124, const scalar* __restrict__ Tensor_125, scalar* __restrict__ Tensor_128) {
+	// 12 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_123[i*3 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		scalar Intermediate_2 = Tensor_123[i*3 + 1];
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_2;
+		scalar Intermediate_4 = Intermediate_3 + Intermediate_1;
+		scalar Intermediate_5 = Tensor_123[i*3 + 2];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_5;
+		scalar Intermediate_7 = Intermediate_6 + Intermediate_4;
+		scalar Intermediate_8 = Tensor_124[i*1 + 0];
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_7;
+		scalar Intermediate_10 = Tensor_125[i*1 + 0];
+		scalar Intermediate_11 = Intermediate_10 + Intermediate_9;
+		Tensor_128[i*1 + 0] += Intermediate_11;
+	}
+}
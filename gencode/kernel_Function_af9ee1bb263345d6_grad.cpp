@@ -0,0 +1,32 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_af9ee1bb263345d6_grad(int n, const scalar* __restrict__ Tensor_123, const scalar* __restrict__ Tensor_124, const scalar* __restrict__ Tensor_129, scalar* __restrict__ Tensor_130, scalar* __restrict__ Tensor_131, scalar* __restrict__ Tensor_132) {
+	// 18 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_129[i*1 + 0];
+		Tensor_132[i*1 + 0] += Intermediate_0;
+		scalar Intermediate_1 = Tensor_123[i*3 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_1;
+		scalar Intermediate_3 = Tensor_123[i*3 + 1];
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_3;
+		scalar Intermediate_5 = Intermediate_4 + Intermediate_2;
+		scalar Intermediate_6 = Tensor_123[i*3 + 2];
+		scalar Intermediate_7 = Intermediate_6 * Intermediate_6;
+		scalar Intermediate_8 = Intermediate_7 + Intermediate_5;
+		scalar Intermediate_9 = Intermediate_0 * Intermediate_8;
+		Tensor_131[i*1 + 0] += Intermediate_9;
+		scalar Intermediate_10 = Tensor_124[i*1 + 0];
+		scalar Intermediate_11 = Intermediate_0 * Intermediate_10;
+		scalar Intermediate_12 = Intermediate_6 * Intermediate_11;
+		scalar Intermediate_13 = Intermediate_12 + Intermediate_12;
+		Tensor_130[i*3 + 2] += Intermediate_13;
+		scalar Intermediate_14 = Intermediate_3 * Intermediate_11;
+		scalar Intermediate_15 = Intermediate_14 + Intermediate_14;
+		Tensor_130[i*3 + 1] += Intermediate_15;
+		scalar Intermediate_16 = Intermediate_1 * Intermediate_11;
+		scalar Intermediate_17 = Intermediate_16 + Intermediate_16;
+		Tensor_130[i*3 + 0] += Intermediate_17;
+	}
+}
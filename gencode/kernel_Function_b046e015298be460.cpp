@@ -0,0 +1,23 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_b046e015298be460(int n, const scalar* __restrict__ Tensor_463, scalar* __restrict__ Tensor_467) {
+	// 11 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_463[i*3 + 2];
+		scalar Intermediate_1 = 2.0;
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		scalar Intermediate_3 = 3.0;
+		scalar Intermediate_4 = Intermediate_3 + Intermediate_2;
+		Tensor_467[i*3 + 2] += Intermediate_4;
+		scalar Intermediate_5 = Tensor_463[i*3 + 1];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		scalar Intermediate_7 = Intermediate_3 + Intermediate_6;
+		Tensor_467[i*3 + 1] += Intermediate_7;
+		scalar Intermediate_8 = Tensor_463[i*3 + 0];
+		scalar Intermediate_9 = Intermediate_1 * Intermediate_8;
+		scalar Intermediate_10 = Intermediate_3 + Intermediate_9;
+		Tensor_467[i*3 + 0] += Intermediate_10;
+	}
+}
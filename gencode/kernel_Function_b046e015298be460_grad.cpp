@@ -0,0 +1,19 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_b046e015298be460_grad(int n, const scalar* __restrict__ Tensor_468, scalar* __restrict__ Tensor_469) {
+	// 7 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_468[i*3 + 2];
+		scalar Intermediate_1 = 2.0;
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		Tensor_469[i*3 + 2] += Intermediate_2;
+		scalar Intermediate_3 = Tensor_468[i*3 + 1];
+		scalar Intermediate_4 = Intermediate_1 * Intermediate_3;
+		Tensor_469[i*3 + 1] += Intermediate_4;
+		scalar Intermediate_5 = Tensor_468[i*3 + 0];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		Tensor_469[i*3 + 0] += Intermediate_6;
+	}
+}
@@ -0,0 +1,25 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_b562aec8cea12567(int n, const scalar* __restrict__ Tensor_115, const scalar* __restrict__ Tensor_116, scalar* __restrict__ Tensor_117, scalar* __restrict__ Tensor_118) {
+	// 12 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_116[i*3 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		scalar Intermediate_2 = Tensor_116[i*3 + 1];
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_2;
+		scalar Intermediate_4 = Intermediate_3 + Intermediate_1;
+		scalar Intermediate_5 = Tensor_116[i*3 + 2];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_5;
+		scalar Intermediate_7 = Intermediate_6 + Intermediate_4;
+		Tensor_118[i*1 + 0] += Intermediate_7;
+		scalar Intermediate_8 = Tensor_115[i*1 + 0];
+		scalar Intermediate_9 = Intermediate_5 * Intermediate_8;
+		Tensor_117[i*3 + 2] += Intermediate_9;
+		scalar Intermediate_10 = Intermediate_2 * Intermediate_8;
+		Tensor_117[i*3 + 1] += Intermediate_10;
+		scalar Intermediate_11 = Intermediate_0 * Intermediate_8;
+		Tensor_117[i*3 + 0] += Intermediate_11;
+	}
+}
@@ -0,0 +1,38 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_b562aec8cea12567_grad(int n, const scalar* __restrict__ Tensor_115, const scalar* __restrict__ Tensor_116, const scalar* __restrict__ Tensor_119, const scalar* __restrict__ Tensor_120, scalar* __restrict__ Tensor_121, scalar* __restrict__ Tensor_122) {
+	// 25 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_119[i*3 + 2];
+		scalar Intermediate_1 = Tensor_115[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		scalar Intermediate_3 = Tensor_120[i*1 + 0];
+		scalar Intermediate_4 = Tensor_116[i*3 + 2];
+		scalar Intermediate_5 = Intermediate_4 * Intermediate_3;
+		scalar Intermediate_6 = Intermediate_5 + Intermediate_2;
+		scalar Intermediate_7 = Intermediate_5 + Intermediate_6;
+		Tensor_122[i*3 + 2] += Intermediate_7;
+		scalar Intermediate_8 = Tensor_119[i*3 + 1];
+		scalar Intermediate_9 = Intermediate_1 * Intermediate_8;
+		scalar Intermediate_10 = Tensor_116[i*3 + 1];
+		scalar Intermediate_11 = Intermediate_3 * Intermediate_10;
+		scalar Intermediate_12 = Intermediate_11 + Intermediate_9;
+		scalar Intermediate_13 = Intermediate_11 + Intermediate_12;
+		Tensor_122[i*3 + 1] += Intermediate_13;
+		scalar Intermediate_14 = Tensor_119[i*3 + 0];
+		scalar Intermediate_15 = Intermediate_1 * Intermediate_14;
+		scalar Intermediate_16 = Tensor_116[i*3 + 0];
+		scalar Intermediate_17 = Intermediate_3 * Intermediate_16;
+		scalar Intermediate_18 = Intermediate_17 + Intermediate_15;
+		scalar Intermediate_19 = Intermediate_17 + Intermediate_18;
+		Tensor_122[i*3 + 0] += Intermediate_19;
+		scalar Intermediate_20 = Intermediate_16 * Intermediate_14;
+		scalar Intermediate_21 = Intermediate_10 * Intermediate_8;
+		scalar Intermediate_22 = Intermediate_21 + Intermediate_20;
+		scalar Intermediate_23 = Intermediate_4 * Intermediate_0;
+		scalar Intermediate_24 = Intermediate_23 + Intermediate_22;
+		Tensor_121[i*1 + 0] += Intermediate_24;
+	}
+}
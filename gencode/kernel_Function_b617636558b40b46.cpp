@@ -0,0 +1,32 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_b617636558b40b46(int n, const scalar* __restrict__ Tensor_221, const scalar* __restrict__ Tensor_222, const integer* __restrict__ Tensor_223, const integer* __restrict__ Tensor_224, scalar* __restrict__ Tensor_228) {
+	// 14 ops, 0 removed by simplification
+	integer i;
+	#pragma omp parallel for private(i)
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_224[i*1 + 0];
+		scalar Intermediate_1 = Tensor_221[i*2 + 1];
+		scalar Intermediate_2 = -(Intermediate_1);
+		integer Intermediate_3 = Tensor_223[i*1 + 0];
+		
+		scalar Intermediate_5 = Tensor_222[Intermediate_3*2 + 1];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		#pragma omp atomic
+		Tensor_228[Intermediate_3*2 + 1] += Intermediate_6;
+		#pragma omp atomic
+		Tensor_228[Intermediate_0*2 + 1] += Intermediate_2;
+		
+		scalar Intermediate_8 = Tensor_221[i*2 + 0];
+		scalar Intermediate_9 = -(Intermediate_8);
+		
+		scalar Intermediate_11 = Tensor_222[Intermediate_3*2 + 0];
+		scalar Intermediate_12 = Intermediate_8 * Intermediate_11;
+		#pragma omp atomic
+		Tensor_228[Intermediate_3*2 + 0] += Intermediate_12;
+		#pragma omp atomic
+		Tensor_228[Intermediate_0*2 + 0] += Intermediate_9;
+		
+	}
+}
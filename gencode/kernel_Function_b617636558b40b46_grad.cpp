@@ -0,0 +1,38 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_b617636558b40b46_grad(int n, const scalar* __restrict__ Tensor_221, const scalar* __restrict__ Tensor_222, const integer* __restrict__ Tensor_223, const integer* __restrict__ Tensor_224, const scalar* __restrict__ Tensor_229, scalar* __restrict__ Tensor_230, scalar* __restrict__ Tensor_231) {
+	// 22 ops, 2 removed by simplification
+	integer i;
+	#pragma omp parallel for private(i)
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_223[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_229[Intermediate_0*2 + 1];
+		scalar Intermediate_3 = Tensor_221[i*2 + 1];
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_2;
+		#pragma omp atomic
+		Tensor_231[Intermediate_0*2 + 1] += Intermediate_4;
+		
+		
+		scalar Intermediate_7 = Tensor_229[Intermediate_0*2 + 0];
+		scalar Intermediate_8 = Tensor_221[i*2 + 0];
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_7;
+		#pragma omp atomic
+		Tensor_231[Intermediate_0*2 + 0] += Intermediate_9;
+		
+		integer Intermediate_11 = Tensor_224[i*1 + 0];
+		scalar Intermediate_12 = Tensor_229[Intermediate_11*2 + 1];
+		
+		scalar Intermediate_14 = Tensor_222[Intermediate_0*2 + 1];
+		scalar Intermediate_15 = Intermediate_2 * Intermediate_14;
+		scalar Intermediate_16 = Intermediate_15 - Intermediate_12;
+		Tensor_230[i*2 + 1] += Intermediate_16;
+		scalar Intermediate_17 = Tensor_229[Intermediate_11*2 + 0];
+		
+		scalar Intermediate_19 = Tensor_222[Intermediate_0*2 + 0];
+		scalar Intermediate_20 = Intermediate_7 * Intermediate_19;
+		scalar Intermediate_21 = Intermediate_20 - Intermediate_17;
+		Tensor_230[i*2 + 0] += Intermediate_21;
+	}
+}
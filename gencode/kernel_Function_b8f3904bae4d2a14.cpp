@@ -0,0 +1,22 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_b8f3904bae4d2a14(int n, const scalar* __restrict__ Tensor_214, const integer* __restrict__ Tensor_215, scalar* __restrict__ Tensor_217) {
+	// 10 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_215[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_214[Intermediate_0*3 + 2];
+		Tensor_217[Intermediate_0*3 + 2] += Intermediate_2;
+		
+		
+		scalar Intermediate_5 = Tensor_214[Intermediate_0*3 + 1];
+		Tensor_217[Intermediate_0*3 + 1] += Intermediate_5;
+		
+		
+		scalar Intermediate_8 = Tensor_214[Intermediate_0*3 + 0];
+		Tensor_217[Intermediate_0*3 + 0] += Intermediate_8;
+		
+	}
+}
@@ -0,0 +1,47 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_bbde5b6c05924269(int n, const scalar* __restrict__ Tensor_286, scalar* __restrict__ Tensor_295, scalar* __restrict__ Tensor_297) {
+	// 26 ops, 0 removed by simplification
+	integer i;
+	scalar Reduce_21 = 0;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_286[i*3 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		scalar Intermediate_2 = Tensor_286[i*3 + 1];
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_2;
+		scalar Intermediate_4 = Intermediate_3 + Intermediate_1;
+		scalar Intermediate_5 = Tensor_286[i*3 + 2];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_5;
+		scalar Intermediate_7 = Intermediate_6 + Intermediate_4;
+		scalar Intermediate_8 = 0.5;
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_7;
+		scalar Intermediate_10 = sqrt(Intermediate_7);
+		int Intermediate_11 = Intermediate_9 < Intermediate_10;
+		
+                scalar Intermediate_12;
+                if (Intermediate_11) 
+                    Intermediate_12 = Intermediate_10;
+                else 
+                    Intermediate_12 = Intermediate_9;
+                
+		scalar Intermediate_13 = Intermediate_0 * Intermediate_12;
+		scalar Intermediate_14 = Intermediate_13 * Intermediate_13;
+		scalar Intermediate_15 = Intermediate_2 * Intermediate_12;
+		scalar Intermediate_16 = Intermediate_15 * Intermediate_15;
+		scalar Intermediate_17 = Intermediate_16 + Intermediate_14;
+		scalar Intermediate_18 = Intermediate_5 * Intermediate_12;
+		scalar Intermediate_19 = Intermediate_18 * Intermediate_18;
+		scalar Intermediate_20 = Intermediate_19 + Intermediate_17;
+		Reduce_21 += Intermediate_20;
+		
+		integer Intermediate_22 = 1;
+		scalar Intermediate_23 = Intermediate_18 + Intermediate_22;
+		Tensor_295[i*3 + 2] += Intermediate_23;
+		scalar Intermediate_24 = Intermediate_15 + Intermediate_22;
+		Tensor_295[i*3 + 1] += Intermediate_24;
+		scalar Intermediate_25 = Intermediate_13 + Intermediate_22;
+		Tensor_295[i*3 + 0] += Intermediate_25;
+	}
+	Tensor_297[0] += Reduce_21;
+}
@@ -0,0 +1,86 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_bbde5b6c05924269_grad(int n, const scalar* __restrict__ Tensor_286, const scalar* __restrict__ Tensor_298, const scalar* __restrict__ Tensor_299, scalar* __restrict__ Tensor_300) {
+	// 55 ops, 1 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = 2;
+		scalar Intermediate_1 = Tensor_286[i*3 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_1;
+		scalar Intermediate_3 = Tensor_286[i*3 + 1];
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_3;
+		scalar Intermediate_5 = Intermediate_4 + Intermediate_2;
+		scalar Intermediate_6 = Tensor_286[i*3 + 2];
+		scalar Intermediate_7 = Intermediate_6 * Intermediate_6;
+		scalar Intermediate_8 = Intermediate_7 + Intermediate_5;
+		scalar Intermediate_9 = sqrt(Intermediate_8);
+		scalar Intermediate_10 = Intermediate_9 * Intermediate_0;
+		scalar Intermediate_11 = 0.0;
+		scalar Intermediate_12 = Tensor_298[i*3 + 0];
+		scalar Intermediate_13 = 0.5;
+		scalar Intermediate_14 = Intermediate_13 * Intermediate_8;
+		int Intermediate_15 = Intermediate_14 < Intermediate_9;
+		
+                scalar Intermediate_16;
+                if (Intermediate_15) 
+                    Intermediate_16 = Intermediate_9;
+                else 
+                    Intermediate_16 = Intermediate_14;
+                
+		scalar Intermediate_17 = Intermediate_1 * Intermediate_16;
+		
+		scalar Intermediate_19 = Tensor_299[0];
+		
+		scalar Intermediate_20 = Intermediate_19 * Intermediate_17;
+		scalar Intermediate_21 = Intermediate_20 + Intermediate_12;
+		scalar Intermediate_22 = Intermediate_20 + Intermediate_21;
+		scalar Intermediate_23 = Intermediate_1 * Intermediate_22;
+		scalar Intermediate_24 = Tensor_298[i*3 + 1];
+		scalar Intermediate_25 = Intermediate_3 * Intermediate_16;
+		scalar Intermediate_26 = Intermediate_19 * Intermediate_25;
+		scalar Intermediate_27 = Intermediate_26 + Intermediate_24;
+		scalar Intermediate_28 = Intermediate_26 + Intermediate_27;
+		scalar Intermediate_29 = Intermediate_3 * Intermediate_28;
+		scalar Intermediate_30 = Intermediate_29 + Intermediate_23;
+		scalar Intermediate_31 = Tensor_298[i*3 + 2];
+		scalar Intermediate_32 = Intermediate_6 * Intermediate_16;
+		scalar Intermediate_33 = Intermediate_32 * Intermediate_19;
+		scalar Intermediate_34 = Intermediate_33 + Intermediate_31;
+		scalar Intermediate_35 = Intermediate_33 + Intermediate_34;
+		scalar Intermediate_36 = Intermediate_6 * Intermediate_35;
+		scalar Intermediate_37 = Intermediate_36 + Intermediate_30;
+		
+                scalar Intermediate_38;
+                if (Intermediate_15) 
+                    Intermediate_38 = Intermediate_37;
+                else 
+                    Intermediate_38 = Intermediate_11;
+                
+		scalar Intermediate_39 = Intermediate_38 / Intermediate_10;
+		
+                scalar Intermediate_40;
+                if (Intermediate_15) 
+                    Intermediate_40 = Intermediate_11;
+                else 
+                    Intermediate_40 = Intermediate_37;
+                
+		scalar Intermediate_41 = Intermediate_13 * Intermediate_40;
+		scalar Intermediate_42 = Intermediate_41 + Intermediate_39;
+		scalar Intermediate_43 = Intermediate_6 * Intermediate_42;
+		scalar Intermediate_44 = Intermediate_43 + Intermediate_43;
+		scalar Intermediate_45 = Intermediate_16 * Intermediate_35;
+		scalar Intermediate_46 = Intermediate_45 + Intermediate_44;
+		Tensor_300[i*3 + 2] += Intermediate_46;
+		scalar Intermediate_47 = Intermediate_16 * Intermediate_28;
+		scalar Intermediate_48 = Intermediate_3 * Intermediate_42;
+		scalar Intermediate_49 = Intermediate_48 + Intermediate_47;
+		scalar Intermediate_50 = Intermediate_48 + Intermediate_49;
+		Tensor_300[i*3 + 1] += Intermediate_50;
+		scalar Intermediate_51 = Intermediate_16 * Intermediate_22;
+		scalar Intermediate_52 = Intermediate_1 * Intermediate_42;
+		scalar Intermediate_53 = Intermediate_52 + Intermediate_51;
+		scalar Intermediate_54 = Intermediate_52 + Intermediate_53;
+		Tensor_300[i*3 + 0] += Intermediate_54;
+	}
+}
@@ -0,0 +1,19 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_c45b7c5298029eb0(int n, const scalar* __restrict__ Tensor_183, const scalar* __restrict__ Tensor_184, scalar* __restrict__ Tensor_185) {
+	// 7 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_183[i*1 + 0];
+		scalar Intermediate_1 = Tensor_184[i*3 + 2];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		Tensor_185[i*3 + 2] += Intermediate_2;
+		scalar Intermediate_3 = Tensor_184[i*3 + 1];
+		scalar Intermediate_4 = Intermediate_0 * Intermediate_3;
+		Tensor_185[i*3 + 1] += Intermediate_4;
+		scalar Intermediate_5 = Tensor_184[i*3 + 0];
+		scalar Intermediate_6 = Intermediate_0 * Intermediate_5;
+		Tensor_185[i*3 + 0] += Intermediate_6;
+	}
+}
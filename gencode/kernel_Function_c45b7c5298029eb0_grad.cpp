@@ -0,0 +1,28 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_c45b7c5298029eb0_grad(int n, const scalar* __restrict__ Tensor_183, const scalar* __restrict__ Tensor_184, const scalar* __restrict__ Tensor_186, scalar* __restrict__ Tensor_187, scalar* __restrict__ Tensor_188) {
+	// 15 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_186[i*3 + 2];
+		scalar Intermediate_1 = Tensor_183[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		Tensor_188[i*3 + 2] += Intermediate_2;
+		scalar Intermediate_3 = Tensor_186[i*3 + 1];
+		scalar Intermediate_4 = Intermediate_1 * Intermediate_3;
+		Tensor_188[i*3 + 1] += Intermediate_4;
+		scalar Intermediate_5 = Tensor_186[i*3 + 0];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		Tensor_188[i*3 + 0] += Intermediate_6;
+		scalar Intermediate_7 = Tensor_184[i*3 + 0];
+		scalar Intermediate_8 = Intermediate_5 * Intermediate_7;
+		scalar Intermediate_9 = Tensor_184[i*3 + 1];
+		scalar Intermediate_10 = Intermediate_3 * Intermediate_9;
+		scalar Intermediate_11 = Intermediate_10 + Intermediate_8;
+		scalar Intermediate_12 = Tensor_184[i*3 + 2];
+		scalar Intermediate_13 = Intermediate_0 * Intermediate_12;
+		scalar Intermediate_14 = Intermediate_13 + Intermediate_11;
+		Tensor_187[i*1 + 0] += Intermediate_14;
+	}
+}
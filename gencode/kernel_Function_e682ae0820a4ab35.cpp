@@ -0,0 +1,46 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_e682ae0820a4ab35(int n, const scalar* __restrict__ Tensor_199, const scalar* __restrict__ Tensor_200, scalar* __restrict__ Tensor_203, scalar* __restrict__ Tensor_205, scalar* __restrict__ Tensor_208) {
+	// 27 ops, 0 removed by simplification
+	integer i;
+	scalar Reduce_14 = numeric_limits<scalar>::max();
+	scalar Reduce_20 = 0;
+	#pragma omp simd reduction(min:Reduce_14) reduction(+:Reduce_20)
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_200[i*3 + 0];
+		scalar Intermediate_1 = Tensor_199[i*3 + 0];
+		scalar Intermediate_2 = Intermediate_1 - Intermediate_0;
+		scalar Intermediate_3 = Intermediate_0 * Intermediate_2;
+		scalar Intermediate_4 = Tensor_200[i*3 + 1];
+		scalar Intermediate_5 = Tensor_199[i*3 + 1];
+		scalar Intermediate_6 = Intermediate_5 - Intermediate_4;
+		scalar Intermediate_7 = Intermediate_4 * Intermediate_6;
+		scalar Intermediate_8 = Intermediate_7 + Intermediate_3;
+		scalar Intermediate_9 = Tensor_200[i*3 + 2];
+		scalar Intermediate_10 = Tensor_199[i*3 + 2];
+		scalar Intermediate_11 = Intermediate_10 - Intermediate_9;
+		scalar Intermediate_12 = Intermediate_9 * Intermediate_11;
+		scalar Intermediate_13 = Intermediate_12 + Intermediate_8;
+		Reduce_14 = min(Intermediate_13, Reduce_14);
+		
+		scalar Intermediate_15 = Intermediate_0 * Intermediate_1;
+		scalar Intermediate_16 = Intermediate_4 * Intermediate_5;
+		scalar Intermediate_17 = Intermediate_16 + Intermediate_15;
+		scalar Intermediate_18 = Intermediate_9 * Intermediate_10;
+		scalar Intermediate_19 = Intermediate_18 + Intermediate_17;
+		Reduce_20 += Intermediate_19;
+		
+		scalar Intermediate_21 = sqrt(Intermediate_18);
+		scalar Intermediate_22 = Intermediate_10 + Intermediate_21;
+		Tensor_203[i*3 + 2] += Intermediate_22;
+		scalar Intermediate_23 = sqrt(Intermediate_16);
+		scalar Intermediate_24 = Intermediate_5 + Intermediate_23;
+		Tensor_203[i*3 + 1] += Intermediate_24;
+		scalar Intermediate_25 = sqrt(Intermediate_15);
+		scalar Intermediate_26 = Intermediate_1 + Intermediate_25;
+		Tensor_203[i*3 + 0] += Intermediate_26;
+	}
+	Tensor_208[0] = min(Reduce_14, Tensor_208[0]);
+	Tensor_205[0] += Reduce_20;
+}
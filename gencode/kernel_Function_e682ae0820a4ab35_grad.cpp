@@ -0,0 +1,53 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_e682ae0820a4ab35_grad(int n, const scalar* __restrict__ Tensor_199, const scalar* __restrict__ Tensor_200, const scalar* __restrict__ Tensor_209, const scalar* __restrict__ Tensor_210, scalar* __restrict__ Tensor_212, scalar* __restrict__ Tensor_213) {
+	// 36 ops, 0 removed by simplification
+	integer i;
+	#pragma omp simd
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_200[i*3 + 2];
+		scalar Intermediate_1 = Tensor_199[i*3 + 2];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		scalar Intermediate_3 = sqrt(Intermediate_2);
+		integer Intermediate_4 = 2;
+		scalar Intermediate_5 = Intermediate_4 * Intermediate_3;
+		scalar Intermediate_6 = Tensor_209[i*3 + 2];
+		scalar Intermediate_7 = Intermediate_6 / Intermediate_5;
+		
+		scalar Intermediate_9 = Tensor_210[0];
+		
+		scalar Intermediate_10 = Intermediate_9 + Intermediate_7;
+		scalar Intermediate_11 = Intermediate_1 * Intermediate_10;
+		Tensor_213[i*3 + 2] += Intermediate_11;
+		scalar Intermediate_12 = Tensor_200[i*3 + 1];
+		scalar Intermediate_13 = Tensor_199[i*3 + 1];
+		scalar Intermediate_14 = Intermediate_13 * Intermediate_12;
+		scalar Intermediate_15 = sqrt(Intermediate_14);
+		scalar Intermediate_16 = Intermediate_4 * Intermediate_15;
+		scalar Intermediate_17 = Tensor_209[i*3 + 1];
+		scalar Intermediate_18 = Intermediate_17 / Intermediate_16;
+		scalar Intermediate_19 = Intermediate_9 + Intermediate_18;
+		scalar Intermediate_20 = Intermediate_13 * Intermediate_19;
+		Tensor_213[i*3 + 1] += Intermediate_20;
+		scalar Intermediate_21 = Tensor_200[i*3 + 0];
+		scalar Intermediate_22 = Tensor_199[i*3 + 0];
+		scalar Intermediate_23 = Intermediate_22 * Intermediate_21;
+		scalar Intermediate_24 = sqrt(Intermediate_23);
+		scalar Intermediate_25 = Intermediate_4 * Intermediate_24;
+		scalar Intermediate_26 = Tensor_209[i*3 + 0];
+		scalar Intermediate_27 = Intermediate_26 / Intermediate_25;
+		scalar Intermediate_28 = Intermediate_9 + Intermediate_27;
+		scalar Intermediate_29 = Intermediate_22 * Intermediate_28;
+		Tensor_213[i*3 + 0] += Intermediate_29;
+		scalar Intermediate_30 = Intermediate_0 * Intermediate_10;
+		scalar Intermediate_31 = Intermediate_6 + Intermediate_30;
+		Tensor_212[i*3 + 2] += Intermediate_31;
+		scalar Intermediate_32 = Intermediate_12 * Intermediate_19;
+		scalar Intermediate_33 = Intermediate_17 + Intermediate_32;
+		Tensor_212[i*3 + 1] += Intermediate_33;
+		scalar Intermediate_34 = Intermediate_21 * Intermediate_28;
+		scalar Intermediate_35 = Intermediate_26 + Intermediate_34;
+		Tensor_212[i*3 + 0] += Intermediate_35;
+	}
+}
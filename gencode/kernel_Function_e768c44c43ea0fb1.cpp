@@ -0,0 +1,18 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_e768c44c43ea0fb1(int n, const scalar* __restrict__ Tensor_179, scalar* __restrict__ Tensor_180) {
+	// 8 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_179[i*3 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		scalar Intermediate_2 = Tensor_179[i*3 + 1];
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_2;
+		scalar Intermediate_4 = Intermediate_3 + Intermediate_1;
+		scalar Intermediate_5 = Tensor_179[i*3 + 2];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_5;
+		scalar Intermediate_7 = Intermediate_6 + Intermediate_4;
+		Tensor_180[i*1 + 0] += Intermediate_7;
+	}
+}
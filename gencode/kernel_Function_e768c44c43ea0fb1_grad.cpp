@@ -0,0 +1,22 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_e768c44c43ea0fb1_grad(int n, const scalar* __restrict__ Tensor_179, const scalar* __restrict__ Tensor_181, scalar* __restrict__ Tensor_182) {
+	// 10 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_181[i*1 + 0];
+		scalar Intermediate_1 = Tensor_179[i*3 + 2];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		scalar Intermediate_3 = Intermediate_2 + Intermediate_2;
+		Tensor_182[i*3 + 2] += Intermediate_3;
+		scalar Intermediate_4 = Tensor_179[i*3 + 1];
+		scalar Intermediate_5 = Intermediate_0 * Intermediate_4;
+		scalar Intermediate_6 = Intermediate_5 + Intermediate_5;
+		Tensor_182[i*3 + 1] += Intermediate_6;
+		scalar Intermediate_7 = Tensor_179[i*3 + 0];
+		scalar Intermediate_8 = Intermediate_0 * Intermediate_7;
+		scalar Intermediate_9 = Intermediate_8 + Intermediate_8;
+		Tensor_182[i*3 + 0] += Intermediate_9;
+	}
+}
@@ -0,0 +1,15 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_e9e8a90a5a803665_grad(int n, const scalar* __restrict__ Tensor_169, scalar* __restrict__ Tensor_170) {
+	// 3 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_169[i*3 + 2];
+		Tensor_170[i*3 + 2] += Intermediate_0;
+		scalar Intermediate_1 = Tensor_169[i*3 + 1];
+		Tensor_170[i*3 + 1] += Intermediate_1;
+		scalar Intermediate_2 = Tensor_169[i*3 + 0];
+		Tensor_170[i*3 + 0] += Intermediate_2;
+	}
+}
@@ -0,0 +1,16 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_ed05f70533b1e195(int n, const scalar* __restrict__ Tensor_27, const integer* __restrict__ Tensor_28, const scalar* __restrict__ Tensor_29, scalar* __restrict__ Tensor_30, scalar* __restrict__ Tensor_31) {
+	// 5 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_28[i*1 + 0];
+		scalar Intermediate_1 = Tensor_29[i*1 + 0];
+		Tensor_31[Intermediate_0*1 + 0] += Intermediate_1;
+		
+		
+		scalar Intermediate_4 = Tensor_27[Intermediate_0*1 + 0];
+		Tensor_30[i*1 + 0] += Intermediate_4;
+	}
+}
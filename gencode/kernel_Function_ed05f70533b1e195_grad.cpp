@@ -0,0 +1,16 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_ed05f70533b1e195_grad(int n, const integer* __restrict__ Tensor_28, const scalar* __restrict__ Tensor_32, const scalar* __restrict__ Tensor_33, scalar* __restrict__ Tensor_34, scalar* __restrict__ Tensor_36) {
+	// 5 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_28[i*1 + 0];
+		
+		scalar Intermediate_2 = Tensor_33[Intermediate_0*1 + 0];
+		Tensor_36[i*1 + 0] += Intermediate_2;
+		scalar Intermediate_3 = Tensor_32[i*1 + 0];
+		Tensor_34[Intermediate_0*1 + 0] += Intermediate_3;
+		
+	}
+}
@@ -0,0 +1,25 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_f1bbec5b6b37b8fe(int n, const scalar* __restrict__ Tensor_339, const scalar* __restrict__ Tensor_340, const scalar* __restrict__ Tensor_341, const integer* __restrict__ Tensor_342, scalar* __restrict__ Tensor_350, scalar* __restrict__ Tensor_352) {
+	// 14 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_342[i*1 + 0];
+		scalar Intermediate_1 = Tensor_341[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_1;
+		Tensor_352[Intermediate_0*1 + 0] += Intermediate_2;
+		
+		integer Intermediate_4 = 1;
+		scalar Intermediate_5 = Intermediate_1 + Intermediate_4;
+		scalar Intermediate_6 = Tensor_339[i*1 + 0];
+		scalar Intermediate_7 = Tensor_340[i*1 + 0];
+		scalar Intermediate_8 = Intermediate_7 * Intermediate_6;
+		scalar Intermediate_9 = Intermediate_8 / Intermediate_5;
+		scalar Intermediate_10 = 0.5;
+		scalar Intermediate_11 = Intermediate_1 - Intermediate_10;
+		scalar Intermediate_12 = abs(Intermediate_11);
+		scalar Intermediate_13 = Intermediate_12 + Intermediate_9;
+		Tensor_350[i*1 + 0] += Intermediate_13;
+	}
+}
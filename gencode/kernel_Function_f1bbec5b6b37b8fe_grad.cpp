@@ -0,0 +1,44 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_f1bbec5b6b37b8fe_grad(int n, const scalar* __restrict__ Tensor_339, const scalar* __restrict__ Tensor_340, const scalar* __restrict__ Tensor_341, const integer* __restrict__ Tensor_342, const scalar* __restrict__ Tensor_353, const scalar* __restrict__ Tensor_354, scalar* __restrict__ Tensor_355, scalar* __restrict__ Tensor_356, scalar* __restrict__ Tensor_357) {
+	// 26 ops, 1 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = 1;
+		scalar Intermediate_1 = Tensor_341[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 + Intermediate_0;
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_2;
+		scalar Intermediate_4 = Tensor_339[i*1 + 0];
+		scalar Intermediate_5 = Tensor_340[i*1 + 0];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_4;
+		scalar Intermediate_7 = Tensor_353[i*1 + 0];
+		scalar Intermediate_8 = Intermediate_7 * Intermediate_6;
+		scalar Intermediate_9 = Intermediate_8 / Intermediate_3;
+		scalar Intermediate_10 = -(Intermediate_7);
+		integer Intermediate_11 = 0;
+		scalar Intermediate_12 = 0.5;
+		scalar Intermediate_13 = Intermediate_1 - Intermediate_12;
+		int Intermediate_14 = Intermediate_13 < Intermediate_11;
+		
+                scalar Intermediate_15;
+                if (Intermediate_14) 
+                    Intermediate_15 = Intermediate_10;
+                else 
+                    Intermediate_15 = Intermediate_7;
+                
+		scalar Intermediate_16 = Intermediate_15 - Intermediate_9;
+		integer Intermediate_17 = Tensor_342[i*1 + 0];
+		
+		scalar Intermediate_19 = Tensor_354[Intermediate_17*1 + 0];
+		scalar Intermediate_20 = Intermediate_1 * Intermediate_19;
+		scalar Intermediate_21 = Intermediate_20 + Intermediate_16;
+		scalar Intermediate_22 = Intermediate_20 + Intermediate_21;
+		Tensor_357[i*1 + 0] += Intermediate_22;
+		scalar Intermediate_23 = Intermediate_7 / Intermediate_2;
+		scalar Intermediate_24 = Intermediate_4 * Intermediate_23;
+		Tensor_356[i*1 + 0] += Intermediate_24;
+		scalar Intermediate_25 = Intermediate_5 * Intermediate_23;
+		Tensor_355[i*1 + 0] += Intermediate_25;
+	}
+}
@@ -0,0 +1,50 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_f1bbec5b6b37b8fe_tangent(int n, const scalar* __restrict__ Tensor_339, const scalar* __restrict__ Tensor_340, const scalar* __restrict__ Tensor_341, const integer* __restrict__ Tensor_342, const scalar* __restrict__ Tensor_381, const scalar* __restrict__ Tensor_382, const scalar* __restrict__ Tensor_383, scalar* __restrict__ Tensor_350, scalar* __restrict__ Tensor_352, scalar* __restrict__ Tensor_384, scalar* __restrict__ Tensor_385) {
+	// 31 ops, 2 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		integer Intermediate_0 = Tensor_342[i*1 + 0];
+		scalar Intermediate_1 = Tensor_341[i*1 + 0];
+		scalar Intermediate_2 = Tensor_383[i*1 + 0];
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_1;
+		scalar Intermediate_4 = Intermediate_3 + Intermediate_3;
+		Tensor_385[Intermediate_0*1 + 0] += Intermediate_4;
+		
+		integer Intermediate_6 = 1;
+		scalar Intermediate_7 = Intermediate_1 + Intermediate_6;
+		scalar Intermediate_8 = Tensor_339[i*1 + 0];
+		scalar Intermediate_9 = Tensor_340[i*1 + 0];
+		scalar Intermediate_10 = Intermediate_9 * Intermediate_8;
+		scalar Intermediate_11 = Intermediate_10 / Intermediate_7;
+		scalar Intermediate_12 = Intermediate_2 * Intermediate_11;
+		scalar Intermediate_13 = Tensor_381[i*1 + 0];
+		scalar Intermediate_14 = Intermediate_9 * Intermediate_13;
+		scalar Intermediate_15 = Tensor_382[i*1 + 0];
+		scalar Intermediate_16 = Intermediate_8 * Intermediate_15;
+		scalar Intermediate_17 = Intermediate_16 + Intermediate_14;
+		scalar Intermediate_18 = Intermediate_17 - Intermediate_12;
+		scalar Intermediate_19 = Intermediate_18 / Intermediate_7;
+		scalar Intermediate_20 = -(Intermediate_2);
+		integer Intermediate_21 = 0;
+		scalar Intermediate_22 = 0.5;
+		scalar Intermediate_23 = Intermediate_1 - Intermediate_22;
+		int Intermediate_24 = Intermediate_23 < Intermediate_21;
+		
+                scalar Intermediate_25;
+                if (Intermediate_24) 
+                    Intermediate_25 = Intermediate_20;
+                else 
+                    Intermediate_25 = Intermediate_2;
+                
+		scalar Intermediate_26 = Intermediate_25 + Intermediate_19;
+		Tensor_384[i*1 + 0] += Intermediate_26;
+		scalar Intermediate_27 = Intermediate_1 * Intermediate_1;
+		Tensor_352[Intermediate_0*1 + 0] += Intermediate_27;
+		
+		scalar Intermediate_29 = abs(Intermediate_23);
+		scalar Intermediate_30 = Intermediate_11 + Intermediate_29;
+		Tensor_350[i*1 + 0] += Intermediate_30;
+	}
+}
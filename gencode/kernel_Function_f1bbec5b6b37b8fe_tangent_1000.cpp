@@ -0,0 +1,29 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_f1bbec5b6b37b8fe_tangent_1000(int n, const scalar* __restrict__ Tensor_339, const scalar* __restrict__ Tensor_340, const scalar* __restrict__ Tensor_341, const integer* __restrict__ Tensor_342, const scalar* __restrict__ Tensor_392, scalar* __restrict__ Tensor_350, scalar* __restrict__ Tensor_352, scalar* __restrict__ Tensor_393) {
+	// 17 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_341[i*1 + 0];
+		integer Intermediate_1 = 1;
+		scalar Intermediate_2 = Intermediate_1 + Intermediate_0;
+		scalar Intermediate_3 = Tensor_392[i*1 + 0];
+		scalar Intermediate_4 = Tensor_340[i*1 + 0];
+		scalar Intermediate_5 = Intermediate_4 * Intermediate_3;
+		scalar Intermediate_6 = Intermediate_5 / Intermediate_2;
+		Tensor_393[i*1 + 0] += Intermediate_6;
+		integer Intermediate_7 = Tensor_342[i*1 + 0];
+		scalar Intermediate_8 = Intermediate_0 * Intermediate_0;
+		Tensor_352[Intermediate_7*1 + 0] += Intermediate_8;
+		
+		scalar Intermediate_10 = Tensor_339[i*1 + 0];
+		scalar Intermediate_11 = Intermediate_4 * Intermediate_10;
+		scalar Intermediate_12 = Intermediate_11 / Intermediate_2;
+		scalar Intermediate_13 = 0.5;
+		scalar Intermediate_14 = Intermediate_0 - Intermediate_13;
+		scalar Intermediate_15 = abs(Intermediate_14);
+		scalar Intermediate_16 = Intermediate_15 + Intermediate_12;
+		Tensor_350[i*1 + 0] += Intermediate_16;
+	}
+}
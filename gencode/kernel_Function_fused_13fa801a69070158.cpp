@@ -0,0 +1,28 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_fused_13fa801a69070158(int n, const scalar* __restrict__ Tensor_311, scalar* __restrict__ Tensor_322) {
+	// 16 ops, 0 removed by simplification
+	integer i;
+	scalar Reduce_15 = 0;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_311[i*3 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		integer Intermediate_2 = 1;
+		scalar Intermediate_3 = Intermediate_2 + Intermediate_1;
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_3;
+		scalar Intermediate_5 = Tensor_311[i*3 + 1];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_5;
+		scalar Intermediate_7 = Intermediate_2 + Intermediate_6;
+		scalar Intermediate_8 = Intermediate_7 * Intermediate_7;
+		scalar Intermediate_9 = Intermediate_8 + Intermediate_4;
+		scalar Intermediate_10 = Tensor_311[i*3 + 2];
+		scalar Intermediate_11 = Intermediate_10 * Intermediate_10;
+		scalar Intermediate_12 = Intermediate_2 + Intermediate_11;
+		scalar Intermediate_13 = Intermediate_12 * Intermediate_12;
+		scalar Intermediate_14 = Intermediate_13 + Intermediate_9;
+		Reduce_15 += Intermediate_14;
+		
+	}
+	Tensor_322[0] += Reduce_15;
+}
@@ -0,0 +1,43 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_fused_38526b892c41d4ab(int n, const scalar* __restrict__ Tensor_115, const scalar* __restrict__ Tensor_116, const scalar* __restrict__ Tensor_143, scalar* __restrict__ Tensor_117, scalar* __restrict__ Tensor_118, scalar* __restrict__ Tensor_145) {
+	// 27 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_116[i*3 + 0];
+		scalar Intermediate_1 = Tensor_115[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		Tensor_117[i*3 + 0] += Intermediate_2;
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_2;
+		scalar Intermediate_4 = Tensor_116[i*3 + 1];
+		scalar Intermediate_5 = Intermediate_1 * Intermediate_4;
+		Tensor_117[i*3 + 1] += Intermediate_5;
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_5;
+		scalar Intermediate_7 = Intermediate_6 + Intermediate_3;
+		scalar Intermediate_8 = Tensor_116[i*3 + 2];
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_1;
+		Tensor_117[i*3 + 2] += Intermediate_9;
+		scalar Intermediate_10 = Intermediate_9 * Intermediate_9;
+		scalar Intermediate_11 = Intermediate_10 + Intermediate_7;
+		scalar Intermediate_12 = Intermediate_0 * Intermediate_0;
+		scalar Intermediate_13 = Intermediate_4 * Intermediate_4;
+		scalar Intermediate_14 = Intermediate_13 + Intermediate_12;
+		scalar Intermediate_15 = Intermediate_8 * Intermediate_8;
+		scalar Intermediate_16 = Intermediate_15 + Intermediate_14;
+		Tensor_118[i*1 + 0] += Intermediate_16;
+		scalar Intermediate_17 = Intermediate_16 * Intermediate_11;
+		scalar Intermediate_18 = Tensor_143[i*1 + 0];
+		scalar Intermediate_19 = Intermediate_18 + Intermediate_17;
+		scalar Intermediate_20 = Intermediate_19 * Intermediate_19;
+		integer Intermediate_21 = 1;
+		scalar Intermediate_22 = Intermediate_21 + Intermediate_20;
+		scalar Intermediate_23 = sqrt(Intermediate_22);
+		scalar Intermediate_24 = Intermediate_9 * Intermediate_23;
+		Tensor_145[i*3 + 2] += Intermediate_24;
+		scalar Intermediate_25 = Intermediate_5 * Intermediate_23;
+		Tensor_145[i*3 + 1] += Intermediate_25;
+		scalar Intermediate_26 = Intermediate_2 * Intermediate_23;
+		Tensor_145[i*3 + 0] += Intermediate_26;
+	}
+}
@@ -0,0 +1,31 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_fused_9a64d250ebfe0559(int n, const scalar* __restrict__ Tensor_501, scalar* __restrict__ Tensor_504, scalar* __restrict__ Tensor_517) {
+	// 16 ops, 0 removed by simplification
+	integer i;
+	scalar Reduce_15 = 0;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_501[i*3 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		integer Intermediate_2 = 1;
+		scalar Intermediate_3 = Intermediate_2 + Intermediate_1;
+		Tensor_504[i*3 + 0] += Intermediate_3;
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_3;
+		scalar Intermediate_5 = Tensor_501[i*3 + 1];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_5;
+		scalar Intermediate_7 = Intermediate_2 + Intermediate_6;
+		Tensor_504[i*3 + 1] += Intermediate_7;
+		scalar Intermediate_8 = Intermediate_7 * Intermediate_7;
+		scalar Intermediate_9 = Intermediate_8 + Intermediate_4;
+		scalar Intermediate_10 = Tensor_501[i*3 + 2];
+		scalar Intermediate_11 = Intermediate_10 * Intermediate_10;
+		scalar Intermediate_12 = Intermediate_2 + Intermediate_11;
+		Tensor_504[i*3 + 2] += Intermediate_12;
+		scalar Intermediate_13 = Intermediate_12 * Intermediate_12;
+		scalar Intermediate_14 = Intermediate_13 + Intermediate_9;
+		Reduce_15 += Intermediate_14;
+		
+	}
+	Tensor_517[0] += Reduce_15;
+}
@@ -0,0 +1,48 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_fused_a630331191b28909(int n, const scalar* __restrict__ Tensor_171, const scalar* __restrict__ Tensor_192, scalar* __restrict__ Tensor_176, scalar* __restrict__ Tensor_193, scalar* __restrict__ Tensor_194) {
+	// 32 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_192[i*3 + 2];
+		scalar Intermediate_1 = Tensor_171[i*3 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_1;
+		scalar Intermediate_3 = sqrt(Intermediate_2);
+		scalar Intermediate_4 = Intermediate_1 * Intermediate_3;
+		integer Intermediate_5 = 1;
+		scalar Intermediate_6 = Intermediate_5 + Intermediate_4;
+		Tensor_176[i*3 + 0] += Intermediate_6;
+		scalar Intermediate_7 = Intermediate_6 * Intermediate_6;
+		scalar Intermediate_8 = Tensor_171[i*3 + 1];
+		scalar Intermediate_9 = Intermediate_8 * Intermediate_8;
+		scalar Intermediate_10 = sqrt(Intermediate_9);
+		scalar Intermediate_11 = Intermediate_8 * Intermediate_10;
+		scalar Intermediate_12 = Intermediate_5 + Intermediate_11;
+		Tensor_176[i*3 + 1] += Intermediate_12;
+		scalar Intermediate_13 = Intermediate_12 * Intermediate_12;
+		scalar Intermediate_14 = Intermediate_13 + Intermediate_7;
+		scalar Intermediate_15 = Tensor_171[i*3 + 2];
+		scalar Intermediate_16 = Intermediate_15 * Intermediate_15;
+		scalar Intermediate_17 = sqrt(Intermediate_16);
+		scalar Intermediate_18 = Intermediate_15 * Intermediate_17;
+		scalar Intermediate_19 = Intermediate_5 + Intermediate_18;
+		Tensor_176[i*3 + 2] += Intermediate_19;
+		scalar Intermediate_20 = Intermediate_19 * Intermediate_19;
+		scalar Intermediate_21 = Intermediate_20 + Intermediate_14;
+		scalar Intermediate_22 = Intermediate_21 * Intermediate_0;
+		Tensor_194[i*3 + 2] += Intermediate_22;
+		scalar Intermediate_23 = Tensor_192[i*3 + 1];
+		scalar Intermediate_24 = Intermediate_21 * Intermediate_23;
+		Tensor_194[i*3 + 1] += Intermediate_24;
+		scalar Intermediate_25 = Tensor_192[i*3 + 0];
+		scalar Intermediate_26 = Intermediate_21 * Intermediate_25;
+		Tensor_194[i*3 + 0] += Intermediate_26;
+		scalar Intermediate_27 = Intermediate_6 * Intermediate_25;
+		scalar Intermediate_28 = Intermediate_12 * Intermediate_23;
+		scalar Intermediate_29 = Intermediate_28 + Intermediate_27;
+		scalar Intermediate_30 = Intermediate_19 * Intermediate_0;
+		scalar Intermediate_31 = Intermediate_30 + Intermediate_29;
+		Tensor_193[i*1 + 0] += Intermediate_31;
+	}
+}
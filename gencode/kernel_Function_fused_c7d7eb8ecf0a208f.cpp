@@ -0,0 +1,34 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_fused_c7d7eb8ecf0a208f(int n, const scalar* __restrict__ Tensor_171, scalar* __restrict__ Tensor_176, scalar* __restrict__ Tensor_189) {
+	// 21 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_171[i*3 + 0];
+		scalar Intermediate_1 = Intermediate_0 * Intermediate_0;
+		scalar Intermediate_2 = sqrt(Intermediate_1);
+		scalar Intermediate_3 = Intermediate_0 * Intermediate_2;
+		integer Intermediate_4 = 1;
+		scalar Intermediate_5 = Intermediate_4 + Intermediate_3;
+		Tensor_176[i*3 + 0] += Intermediate_5;
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_5;
+		scalar Intermediate_7 = Tensor_171[i*3 + 1];
+		scalar Intermediate_8 = Intermediate_7 * Intermediate_7;
+		scalar Intermediate_9 = sqrt(Intermediate_8);
+		scalar Intermediate_10 = Intermediate_7 * Intermediate_9;
+		scalar Intermediate_11 = Intermediate_4 + Intermediate_10;
+		Tensor_176[i*3 + 1] += Intermediate_11;
+		scalar Intermediate_12 = Intermediate_11 * Intermediate_11;
+		scalar Intermediate_13 = Intermediate_12 + Intermediate_6;
+		scalar Intermediate_14 = Tensor_171[i*3 + 2];
+		scalar Intermediate_15 = Intermediate_14 * Intermediate_14;
+		scalar Intermediate_16 = sqrt(Intermediate_15);
+		scalar Intermediate_17 = Intermediate_14 * Intermediate_16;
+		scalar Intermediate_18 = Intermediate_4 + Intermediate_17;
+		Tensor_176[i*3 + 2] += Intermediate_18;
+		scalar Intermediate_19 = Intermediate_18 * Intermediate_18;
+		scalar Intermediate_20 = Intermediate_19 + Intermediate_13;
+		Tensor_189[i*1 + 0] += Intermediate_20;
+	}
+}
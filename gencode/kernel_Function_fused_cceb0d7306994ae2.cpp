@@ -0,0 +1,44 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_fused_cceb0d7306994ae2(int n, const scalar* __restrict__ Tensor_171, const scalar* __restrict__ Tensor_195, const scalar* __restrict__ Tensor_196, scalar* __restrict__ Tensor_176, scalar* __restrict__ Tensor_197, scalar* __restrict__ Tensor_198) {
+	// 28 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_196[i*3 + 2];
+		scalar Intermediate_1 = Tensor_195[i*1 + 0];
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		Tensor_198[i*3 + 2] += Intermediate_2;
+		scalar Intermediate_3 = Tensor_196[i*3 + 1];
+		scalar Intermediate_4 = Intermediate_1 * Intermediate_3;
+		Tensor_198[i*3 + 1] += Intermediate_4;
+		scalar Intermediate_5 = Tensor_196[i*3 + 0];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		Tensor_198[i*3 + 0] += Intermediate_6;
+		scalar Intermediate_7 = Tensor_171[i*3 + 0];
+		scalar Intermediate_8 = Intermediate_7 * Intermediate_7;
+		scalar Intermediate_9 = sqrt(Intermediate_8);
+		scalar Intermediate_10 = Intermediate_7 * Intermediate_9;
+		integer Intermediate_11 = 1;
+		scalar Intermediate_12 = Intermediate_11 + Intermediate_10;
+		Tensor_176[i*3 + 0] += Intermediate_12;
+		scalar Intermediate_13 = Intermediate_5 * Intermediate_12;
+		scalar Intermediate_14 = Tensor_171[i*3 + 1];
+		scalar Intermediate_15 = Intermediate_14 * Intermediate_14;
+		scalar Intermediate_16 = sqrt(Intermediate_15);
+		scalar Intermediate_17 = Intermediate_14 * Intermediate_16;
+		scalar Intermediate_18 = Intermediate_11 + Intermediate_17;
+		Tensor_176[i*3 + 1] += Intermediate_18;
+		scalar Intermediate_19 = Intermediate_3 * Intermediate_18;
+		scalar Intermediate_20 = Intermediate_19 + Intermediate_13;
+		scalar Intermediate_21 = Tensor_171[i*3 + 2];
+		scalar Intermediate_22 = Intermediate_21 * Intermediate_21;
+		scalar Intermediate_23 = sqrt(Intermediate_22);
+		scalar Intermediate_24 = Intermediate_21 * Intermediate_23;
+		scalar Intermediate_25 = Intermediate_11 + Intermediate_24;
+		Tensor_176[i*3 + 2] += Intermediate_25;
+		scalar Intermediate_26 = Intermediate_0 * Intermediate_25;
+		scalar Intermediate_27 = Intermediate_26 + Intermediate_20;
+		Tensor_197[i*1 + 0] += Intermediate_27;
+	}
+}
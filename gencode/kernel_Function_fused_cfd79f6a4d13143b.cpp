@@ -0,0 +1,57 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_fused_cfd79f6a4d13143b(int n, const scalar* __restrict__ Tensor_115, const scalar* __restrict__ Tensor_116, const scalar* __restrict__ Tensor_143, const scalar* __restrict__ Tensor_148, scalar* __restrict__ Tensor_117, scalar* __restrict__ Tensor_118, scalar* __restrict__ Tensor_149, scalar* __restrict__ Tensor_150) {
+	// 40 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_148[i*3 + 2];
+		scalar Intermediate_1 = Tensor_115[i*1 + 0];
+		scalar Intermediate_2 = Tensor_116[i*3 + 0];
+		scalar Intermediate_3 = Intermediate_2 * Intermediate_1;
+		Tensor_117[i*3 + 0] += Intermediate_3;
+		scalar Intermediate_4 = Intermediate_3 * Intermediate_3;
+		scalar Intermediate_5 = Tensor_116[i*3 + 1];
+		scalar Intermediate_6 = Intermediate_5 * Intermediate_1;
+		Tensor_117[i*3 + 1] += Intermediate_6;
+		scalar Intermediate_7 = Intermediate_6 * Intermediate_6;
+		scalar Intermediate_8 = Intermediate_7 + Intermediate_4;
+		scalar Intermediate_9 = Tensor_116[i*3 + 2];
+		scalar Intermediate_10 = Intermediate_9 * Intermediate_1;
+		Tensor_117[i*3 + 2] += Intermediate_10;
+		scalar Intermediate_11 = Intermediate_10 * Intermediate_10;
+		scalar Intermediate_12 = Intermediate_11 + Intermediate_8;
+		scalar Intermediate_13 = Intermediate_2 * Intermediate_2;
+		scalar Intermediate_14 = Intermediate_5 * Intermediate_5;
+		scalar Intermediate_15 = Intermediate_14 + Intermediate_13;
+		scalar Intermediate_16 = Intermediate_9 * Intermediate_9;
+		scalar Intermediate_17 = Intermediate_16 + Intermediate_15;
+		Tensor_118[i*1 + 0] += Intermediate_17;
+		scalar Intermediate_18 = Intermediate_17 * Intermediate_12;
+		scalar Intermediate_19 = Tensor_143[i*1 + 0];
+		scalar Intermediate_20 = Intermediate_19 + Intermediate_18;
+		scalar Intermediate_21 = Intermediate_20 * Intermediate_20;
+		integer Intermediate_22 = 1;
+		scalar Intermediate_23 = Intermediate_22 + Intermediate_21;
+		scalar Intermediate_24 = sqrt(Intermediate_23);
+		scalar Intermediate_25 = Intermediate_24 * Intermediate_0;
+		Tensor_150[i*3 + 2] += Intermediate_25;
+		scalar Intermediate_26 = Tensor_148[i*3 + 1];
+		scalar Intermediate_27 = Intermediate_24 * Intermediate_26;
+		Tensor_150[i*3 + 1] += Intermediate_27;
+		scalar Intermediate_28 = Tensor_148[i*3 + 0];
+		scalar Intermediate_29 = Intermediate_24 * Intermediate_28;
+		Tensor_150[i*3 + 0] += Intermediate_29;
+		integer Intermediate_30 = 2;
+		scalar Intermediate_31 = Intermediate_24 * Intermediate_30;
+		scalar Intermediate_32 = Intermediate_3 * Intermediate_28;
+		scalar Intermediate_33 = Intermediate_6 * Intermediate_26;
+		scalar Intermediate_34 = Intermediate_33 + Intermediate_32;
+		scalar Intermediate_35 = Intermediate_10 * Intermediate_0;
+		scalar Intermediate_36 = Intermediate_35 + Intermediate_34;
+		scalar Intermediate_37 = Intermediate_36 / Intermediate_31;
+		scalar Intermediate_38 = Intermediate_20 * Intermediate_37;
+		scalar Intermediate_39 = Intermediate_38 + Intermediate_38;
+		Tensor_149[i*1 + 0] += Intermediate_39;
+	}
+}
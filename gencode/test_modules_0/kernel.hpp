@@ -0,0 +1,4 @@
+
+void Function_658e14ad59577175(int n, const scalar* __restrict__ Tensor_491, scalar* __restrict__ Tensor_493);
+
+void Function_658e14ad59577175_grad(int n, const scalar* __restrict__ Tensor_494, scalar* __restrict__ Tensor_495);
@@ -0,0 +1,28 @@
+#include "code.hpp"
+
+static PyObject* Function_test_modules(PyObject *self, FUNCTION_ARGS) {
+	assert(FUNCTION_NARGS == 2);
+	integer options = (integer) PyInt_AsLong(FUNCTION_ARG(1));
+	PyObject* Py_Variable_634 = FUNCTION_ARG(0);
+	ArrayRef Ref_Variable_634(getInput(Py_Variable_634, arrayType<scalar>(), "test_modules:0"));
+	if (Ref_Variable_634.array == NULL) return NULL;
+	arrType<scalar, 3> Variable_634;
+	getArray(Ref_Variable_634.array, Variable_634, true, 0L);
+
+	arrType<scalar, 3> Variable_635(10, true, true, 0L);
+	/* ['tests.py:789:test_modules', 'python.py:167:pytest_pyfunc_call', '_callers.py:121:_multicall', '_manager.py:120:_hookexec', '_hooks.py:512:__call__', 'python.py:1707:runtest', 'runner.py:184:pytest_runtest_call', '_callers.py:121:_multicall', '_manager.py:120:_hookexec', '_hooks.py:512:__call__', 'runner.py:250:<lambda>', 'runner.py:361:from_call', 'runner.py:249:call_and_report', 'runner.py:139:runtestprotocol', 'runner.py:118:pytest_runtest_protocol', '_callers.py:121:_multicall', '_manager.py:120:_hookexec', '_hooks.py:512:__call__', 'main.py:408:pytest_runtestloop', '_callers.py:121:_multicall', '_manager.py:120:_hookexec', '_hooks.py:512:__call__', 'main.py:384:_main', 'main.py:330:wrap_session', 'main.py:377:pytest_cmdline_main', '_callers.py:121:_multicall', '_manager.py:120:_hookexec', '_hooks.py:512:__call__', '__init__.py:229:_main', '__init__.py:253:_console_main', '__main__.py:9:<module>', '<frozen runpy>:88:_run_code', '<frozen runpy>:198:_run_module_as_main'] */
+	Function_b01e7a6482c22724(10, &Variable_634(0), &Variable_635(0));
+
+	PyObject* outputs = PyTuple_CreateNone(1);
+	PyTuple_SetItem(outputs, 0, putArray(Variable_635, false));
+	PyObject* output = PyTuple_GetItem(outputs, 0);
+	Py_INCREF(output);
+	Py_DECREF(outputs);
+	return output;
+}
+
+PyMethodDef ExtraMethods[] = {
+	{"test_modules",(PyCFunction)(void(*)(void))Function_test_modules, FUNCTION_FLAGS, "boo"},
+
+		{NULL, NULL, 0, NULL}        /* Sentinel */
+	};
@@ -0,0 +1,4 @@
+
+void Function_b01e7a6482c22724(int n, const scalar* __restrict__ Tensor_496, scalar* __restrict__ Tensor_498);
+
+void Function_b01e7a6482c22724_grad(int n, const scalar* __restrict__ Tensor_499, scalar* __restrict__ Tensor_500);
@@ -0,0 +1,19 @@
+#include "common.hpp"
+#include "gpu.hpp"
+
+void Function_b01e7a6482c22724_grad(int n, const scalar* __restrict__ Tensor_499, scalar* __restrict__ Tensor_500) {
+	// 7 ops, 0 removed by simplification
+	integer i;
+	for (i = 0; i < n; i++) {
+		scalar Intermediate_0 = Tensor_499[i*3 + 2];
+		integer Intermediate_1 = 3;
+		scalar Intermediate_2 = Intermediate_1 * Intermediate_0;
+		Tensor_500[i*3 + 2] += Intermediate_2;
+		scalar Intermediate_3 = Tensor_499[i*3 + 1];
+		scalar Intermediate_4 = Intermediate_1 * Intermediate_3;
+		Tensor_500[i*3 + 1] += Intermediate_4;
+		scalar Intermediate_5 = Tensor_499[i*3 + 0];
+		scalar Intermediate_6 = Intermediate_1 * Intermediate_5;
+		Tensor_500[i*3 + 0] += Intermediate_6;
+	}
+}
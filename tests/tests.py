@@ -1,6 +1,10 @@
-from adpy.variable import Variable, Function, Zeros, IntegerVariable
+from adpy import config
+from adpy.variable import Variable, Function, Module, Zeros, IntegerVariable
 from adpy.tensor import Kernel, Tensor
 
+import os
+import shutil
+import tempfile
 import numpy as np
 
 def test_arithmetic():
@@ -38,6 +42,7 @@ def test_reduction():
     n = 100
     a = Variable((n, 1))
     b = Variable((n, 1))
+    c = IntegerVariable((n, 1))
 
     def func(a, b):
         return (a*b).sum(), (a+b).reduce_max()
@@ -47,17 +52,36 @@ def test_reduction():
 
     x, y = Zeros((1, 1)), Zeros((1,1))
     x, y = Kernel(func)(n, (x, y))(a, b)
-    f = Function('test_reduction', (a, b), (x, y))
+    # the same node stored to two outputs
+    z, w = Kernel(lambda a: (a.sum(), a.sum()))(n, (Zeros((1, 1)), Zeros((1, 1))))(a)
+    u, v = Kernel(lambda a, c: (Tensor.collate(a, c), Tensor.collate(a, c)))(n, (Zeros((n, 1)), Zeros((n, 1))))(a, c)
+    f = Function('test_reduction', (a, b, c), (x, y, z, w, u, v))
+    g = f.getAdjoint()
 
     Function.compile()
 
     ar = np.random.rand(n, 1)
     br = np.random.rand(n, 1)
+    cr = np.random.randint(0, n, (n, 1)).astype(np.int32)
     xr, yr = np_func(ar, br)
-    x, y = f(ar, br)
+    x, y, z, w, u, v = f(ar, br, cr)
 
     assert np.allclose(x, xr)
     assert np.allclose(y, yr)
+    assert np.allclose(z, ar.sum()) and np.allclose(w, ar.sum())
+    ur = np.zeros((n, 1))
+    np.add.at(ur, cr.flatten(), ar)
+    assert np.allclose(u, ur) and np.allclose(v, ur)
+    # interpreted
+    config.compile = False
+    try:
+        results = f(ar, br, cr)
+    finally:
+        config.compile = True
+    assert all([np.allclose(r1, r2) for r1, r2 in zip(results, (x, y, z, w, u, v))])
+    ones = np.ones((1, 1))
+    ag = g(ar, br, cr, 0*ones, 0*ones, ones, ones, np.ones((n, 1)), np.ones((n, 1)))[0]
+    assert np.allclose(ag, 4)
 
 def test_indirect_access():
 
@@ -156,6 +180,842 @@ def test_gradient():
         ad = (ag*ap + bg*bp + cg*cp).sum()
         assert np.allclose(fd, ad)
 
+def test_simplify():
+    from adpy.scalar import Scalar, NegOp, ConstantOp
+    from adpy.optimize import simplify
+
+    x, y = Scalar(), Scalar()
+    ops = [x, y, ConstantOp(1.), ConstantOp(0.)]
+    ops += [x*1., (x*1.) + 0., -x, -(-x), x*y, y*x, (-x)*(-y), (-x)*y, x - x]
+    replace = simplify(ops)
+    assert replace[(x*1.) + 0.] is x
+    assert replace[-(-x)] is x
+    assert replace[x*y] is replace[y*x]
+    assert replace[(-x)*(-y)] is replace[x*y]
+    assert isinstance(replace[(-x)*y], NegOp)
+    assert replace[(-x)*y].args[0] is replace[x*y]
+    assert replace[x - x] is ConstantOp(0.)
+
+    n = 100
+    a = Variable((n, 1))
+    b = Variable((n, 1))
+
+    def func(a, b):
+        x = -(-a)*1 + 0*b
+        return Tensor.max(abs(x*b), (b*a)**2) - b*a, -a/(-b)
+
+    def np_func(a, b):
+        return np.maximum(np.abs(a*b), (a*b)**2) - a*b, a/b
+
+    kernel = Kernel(func)
+    x, y = kernel()(a, b)
+    f = Function('test_simplify', (a, b), (x, y))
+    g = f.getAdjoint()
+    assert kernel.tensorFunc._opsRemoved > 0
+    assert kernel.tensorFunc.grad._opsRemoved > 0
+
+    Function.compile()
+
+    ar = np.random.rand(n, 1) - 0.5
+    br = np.random.rand(n, 1) + 1
+    xr, yr = np_func(ar, br)
+    x, y = f(ar, br)
+    assert np.allclose(x, xr)
+    assert np.allclose(y, yr)
+
+    eps = 1e-7
+    ap = 2*eps*(np.random.rand(n, 1)-0.5)
+    bp = 2*eps*(np.random.rand(n, 1)-0.5)
+    x2, y2 = f(ar + ap, br + bp)
+    xg, yg = np.random.rand(n, 1), np.random.rand(n, 1)
+    fd = (xg*(x2-x) + yg*(y2-y)).sum()
+    ag, bg = g(ar, br, xg, yg)
+    ad = (ag*ap + bg*bp).sum()
+    assert np.allclose(fd, ad)
+
+def test_dead_stores():
+    n = 100
+    a = Variable((n, 1))
+    b = Variable((n, 1))
+    y = IntegerVariable((n, 1))
+
+    def func(a, b, y):
+        return a*a + 0*b, b.extract(y)*0
+
+    kernel = Kernel(func)
+    x, z = kernel()(a, b, y)
+    f = Function('test_dead_stores', (a, b, y), (x, z))
+    g = f.getAdjoint()
+    assert kernel.tensorFunc._inputsUsed == [True, False, False]
+    assert kernel.tensorFunc._outputsUsed == [True, False]
+    assert kernel.tensorFunc.grad._outputsUsed == [True, False, False]
+
+    Function.compile()
+
+    ar = np.random.rand(n, 1)
+    br = np.random.rand(n, 1)
+    yr = np.random.randint(0, n, (n, 1)).astype(np.int32)
+    x, z = f(ar, br, yr)
+    assert np.allclose(x, ar*ar)
+    assert np.allclose(z, 0)
+    xg, zg = np.random.rand(n, 1), np.random.rand(n, 1)
+    ag, bg, yg = g(ar, br, yr, xg, zg)
+    assert np.allclose(ag, 2*ar*xg)
+    assert np.allclose(bg, 0)
+    assert np.allclose(yg, 0)
+
+def test_fusion():
+    n = 100
+    a = Variable((n, 1))
+    b = Variable((n, 3))
+
+    def func(a, b):
+        return a*b, b.dot(b)
+
+    def func2(x, y, a):
+        return x.dot(x)*y + a
+
+    def func3(z, x):
+        return (z*z + 1).sqrt()*x
+
+    def np_func(a, b):
+        x, y = a*b, (b*b).sum(axis=1, keepdims=1)
+        z = (x*x).sum(axis=1, keepdims=1)*y + a
+        return np.sqrt(z*z + 1)*x, y
+
+    x, y = Kernel(func)()(a, b)
+    z = Kernel(func2)()(x, y, a)
+    w = Kernel(func3)()(z, x)
+    f = Function('test_fusion', (a, b), (w, y))
+    g = f.getAdjoint()
+
+    Function.compile()
+    assert len(f._kernels) == 1
+
+    ar = np.random.rand(n, 1)
+    br = np.random.rand(n, 3)
+    wr, yr = np_func(ar, br)
+    w, y = f(ar, br)
+    assert np.allclose(w, wr)
+    assert np.allclose(y, yr)
+
+    eps = 1e-7
+    ap = 2*eps*(np.random.rand(n, 1)-0.5)
+    bp = 2*eps*(np.random.rand(n, 3)-0.5)
+    w2, y2 = f(ar + ap, br + bp)
+    wg, yg = np.random.rand(n, 3), np.random.rand(n, 1)
+    fd = (wg*(w2-w)).sum() + (yg*(y2-y)).sum()
+    ag, bg = g(ar, br, wg, yg)
+    ad = (ag*ap).sum() + (bg*bp).sum()
+    assert np.allclose(fd, ad)
+
+def test_memory_plan():
+    n = 100
+    a = Variable((n, 3))
+
+    def func(a):
+        return a*2
+
+    def func2(x):
+        return x.dot(x)
+
+    def func3(y, a):
+        return y*a
+
+    def func4(z):
+        return z + 1
+
+    # x and z have disjoint live ranges and share a slot
+    fuse = config.fuse
+    config.fuse = False
+    try:
+        x = Kernel(func)()(a)
+        y = Kernel(func2)()(x)
+        z = Kernel(func3)()(y, a)
+        w = Kernel(func4)()(z)
+        f = Function('test_memory_plan', (a,), (w,))
+        Function.compile()
+    finally:
+        config.fuse = fuse
+    assert len(f._memorySlots) == 2
+    assert f.getPeakMemory() == n*(3 + 1)*8
+
+    ar = np.random.rand(n, 3)
+    w = f(ar)
+    assert np.allclose(w, (2*ar*2*ar).sum(axis=1, keepdims=1)*ar + 1)
+    w = f(ar)
+    assert np.allclose(w, (2*ar*2*ar).sum(axis=1, keepdims=1)*ar + 1)
+
+def test_checkpoint():
+    n = 100
+    a = Variable((n, 3))
+
+    def func(a):
+        return (a*a).sqrt()*a + 1
+
+    def func2(x):
+        return x.dot(x)
+
+    def func3(y, x):
+        return y*x
+
+    x = Kernel(func)()(a)
+    y = Kernel(func2)()(x)
+    z = Kernel(func3)()(y, x)
+    f = Function('test_checkpoint', (a,), (z,))
+    g = f.getAdjoint()
+    gs = f.getAdjoint('store')
+    # x and y are taped, one of the two fits in the budget
+    budget = n*3*8
+    gb = f.getAdjoint(budget)
+    assert set(gs._leaves.keys()) == set([x.name, y.name])
+    assert len(gb._leaves) == 1 and gb.getTapeMemory() <= budget
+    assert f.getTapeMemory() == n*(3 + 1)*8
+
+    Function.compile()
+    flops = lambda func: sum([op.func._flops for op in func._kernels])
+    assert flops(gs) < flops(gb) < flops(g)
+
+    ar = np.random.rand(n, 3)
+    zg = np.random.rand(n, 3)
+    ag = g(ar, zg)
+    # the forward call fills the tape
+    f(ar)
+    assert np.allclose(gs(ar, zg), ag)
+    assert np.allclose(gb(ar, zg), ag)
+    f(ar + 1)
+    f(ar)
+    assert np.allclose(gs(ar, zg), ag)
+
+def test_vectorize():
+    n = 1000
+    m = 200
+    a = Variable((n, 3))
+    b = Variable((n, 3))
+    c = IntegerVariable((m, 1))
+
+    def func(a, b):
+        return (a*b).sqrt() + a, a.dot(b).sum(), (a - b).dot(b).reduce_min()
+
+    def func2(a, c):
+        return Tensor.collate(a.extract(c), c)
+
+    def np_func(a, b, c):
+        y = np.zeros_like(a)
+        np.add.at(y, c.flatten(), a[c.flatten()])
+        return np.sqrt(a*b) + a, (a*b).sum(), ((a - b)*b).sum(axis=1).min(), y
+
+    vectorize = config.vectorize
+    config.vectorize = True
+    try:
+        x, s, t = Zeros((n, 3)), Zeros((1, 1)), Zeros((1, 1))
+        kernel = Kernel(func)
+        x, s, t = kernel(n, (x, s, t))(a, b)
+        kernel2 = Kernel(func2)
+        y = kernel2(m, (Zeros((n, 3)),))(a, c)
+        f = Function('test_vectorize', (a, b, c), (x, s, t, y))
+        Function.compile()
+    finally:
+        config.vectorize = vectorize
+    # scatters are left to the compiler
+    assert kernel.tensorFunc._vectorized
+    assert not kernel2.tensorFunc._vectorized
+    assert f.module.vectorized[kernel.tensorFunc.name] > 0
+
+    ar = np.random.rand(n, 3)
+    br = np.random.rand(n, 3)
+    cr = np.random.randint(0, n, (m, 1)).astype(np.int32)
+    for xr, x in zip(np_func(ar, br, cr), f(ar, br, cr)):
+        assert np.allclose(x, xr)
+
+def test_scatter():
+    n = 50
+    m = 400
+    w = Variable((m, 2))
+    a = Variable((n, 2))
+    o = IntegerVariable((m, 1))
+    nb = IntegerVariable((m, 1))
+
+    def func(w, a, o, nb):
+        return Tensor.collate(w*a.extract(o), o, -w, nb)
+
+    def np_func(w, a, o, nb):
+        o, nb = o.flatten(), nb.flatten()
+        y = np.zeros((n, 2))
+        np.add.at(y, o, w*a[o])
+        np.add.at(y, nb, -w)
+        return y
+
+    openmp = config.openmp
+    config.openmp = True
+    try:
+        funcs = {}
+        for scatter in ['atomic', 'private', 'color']:
+            y = Kernel(func, scatter=scatter)(m, (Zeros((n, 2)),))(w, a, o, nb)
+            f = Function('test_scatter_{}'.format(scatter), (w, a, o, nb), (y,))
+            # the adjoint of extract scatters too
+            funcs[scatter] = f, f.getAdjoint()
+        Function.compile()
+    finally:
+        config.openmp = openmp
+
+    wr = np.random.rand(m, 2)
+    ar = np.random.rand(n, 2)
+    orr = np.random.randint(0, n, (m, 1)).astype(np.int32)
+    nbr = np.random.randint(0, n, (m, 1)).astype(np.int32)
+    yg = np.random.rand(n, 2)
+    yr = np_func(wr, ar, orr, nbr)
+    agr = np.zeros((n, 2))
+    np.add.at(agr, orr.flatten(), wr*yg[orr.flatten()])
+    for scatter, (f, g) in funcs.items():
+        assert f._kernels[0].func._scatter == scatter
+        assert np.allclose(f(wr, ar, orr, nbr), yr)
+        wg, ag = g(wr, ar, orr, nbr, yg)[:2]
+        assert np.allclose(ag, agr)
+    # colors run in a fixed order
+    f, g = funcs['color']
+    assert (f(wr, ar, orr, nbr) == f(wr, ar, orr, nbr)).all()
+
+def test_parallel_reduction():
+    n = 5000
+    a = Variable((n, 1))
+    b = Variable((n, 1))
+
+    def func(a, b):
+        return (a+b).sum(), (a-b).reduce_max(), (a-b).reduce_min()
+
+    def blocked_sum(x):
+        # blocks of 1024 summed in order, combined pairwise
+        partials = []
+        for start in range(0, len(x), 1024):
+            acc = 0.
+            for y in x[start:start+1024]:
+                acc += y
+            partials.append(acc)
+        stride = 1
+        while stride < len(partials):
+            for k in range(0, len(partials) - stride, 2*stride):
+                partials[k] += partials[k + stride]
+            stride *= 2
+        return partials[0]
+
+    openmp, reproducible = config.openmp, config.reproducible
+    config.openmp = True
+    funcs = []
+    try:
+        for flag in [False, True]:
+            config.reproducible = flag
+            outputs = Zeros((1, 1)), Zeros((1, 1)), Zeros((1, 1))
+            x, y, z = Kernel(func)(n, outputs)(a, b)
+            funcs.append(Function('test_parallel_reduction_{}'.format(int(flag)), (a, b), (x, y, z)))
+        Function.compile()
+    finally:
+        config.openmp, config.reproducible = openmp, reproducible
+
+    ar = np.random.rand(n, 1) - 0.5
+    br = np.random.rand(n, 1) - 0.5
+    for f in funcs:
+        x, y, z = f(ar, br)
+        assert np.allclose(x, (ar+br).sum())
+        assert np.allclose(y, max((ar-br).max(), 0))
+        assert np.allclose(z, min((ar-br).min(), 0))
+    x, y, z = funcs[1](ar, br)
+    assert x[0, 0] == blocked_sum(list((ar+br).flatten()))
+
+def test_interpreter():
+    n = 50
+    m = 200
+    a = Variable((n, 3))
+    w = Variable((m, 1))
+    o = IntegerVariable((m, 1))
+
+    def func(a):
+        r = a.dot(a)
+        x = Tensor.max(r.sqrt(), r*0.5)*a
+        return x + 1, x.dot(x).sum()
+
+    def func2(x, w, o):
+        return Tensor.collate(x.extract(o)*w, o)
+
+    x, s = Kernel(func)(n, (Zeros((n, 3)), Zeros((1, 1))))(a)
+    y = Kernel(func2)(m, (Zeros((n, 3)),))(x, w, o)
+    f = Function('test_interpreter', (a, w, o), (y, s))
+    g = f.getAdjoint()
+    gs = f.getAdjoint('store')
+    Function.compile()
+
+    ar = np.random.rand(n, 3)
+    wr = np.random.rand(m, 1)
+    orr = np.random.randint(0, n, (m, 1)).astype(np.int32)
+    yg = np.random.rand(n, 3)
+    sg = np.random.rand(1, 1)
+    results = [f(ar, wr, orr), g(ar, wr, orr, yg, sg)]
+    gs(ar, wr, orr, yg, sg)
+    try:
+        config.compile = False
+        f(ar, wr, orr)
+        interpreted = [f(ar, wr, orr), g(ar, wr, orr, yg, sg), gs(ar, wr, orr, yg, sg)]
+    finally:
+        config.compile = True
+    for x, y in zip(results[0] + results[1] + results[1][:2], interpreted[0] + interpreted[1] + interpreted[2][:2]):
+        assert np.allclose(x, y)
+
+def test_profile():
+    n = 100
+    a = Variable((n, 3))
+
+    def func(a):
+        return a*a + 1
+
+    def func2(x):
+        return x.dot(x).sum()
+
+    x = Kernel(func)()(a)
+    s = Kernel(func2)(n, (Zeros((1, 1)),))(x)
+    f = Function('test_profile', (a,), (s,))
+    profile, counters = config.profile, config.profile_counters
+    config.profile, config.profile_counters = True, True
+    try:
+        Function.compile()
+    finally:
+        config.profile, config.profile_counters = profile, counters
+
+    ar = np.random.rand(n, 3)
+    Function.resetProfile()
+    for i in range(0, 3):
+        f(ar)
+    profile = Function.getProfile()
+    assert profile['test_profile']['kind'] == 'function'
+    assert profile['test_profile']['calls'] == 3
+    for op in f._kernels:
+        entry = profile[op.name]
+        assert entry['kind'] == 'kernel'
+        assert entry['calls'] == 3 and entry['iterations'] == 3*n
+        assert entry['loads'] == 3*n*op.func._loads
+        assert entry['time'] <= profile['test_profile']['time']
+        # perf_event is often not allowed in containers
+        assert entry['cycles'] == -1 or entry['cycles'] > 0
+    Function.resetProfile()
+    assert Function.getProfile()['test_profile']['calls'] == 0
+
+def test_call_options():
+    from adpy.variable import StaticVariable
+    n = 10
+    a = Variable((n, 1))
+    s = StaticVariable((n, 1))
+    x = Kernel(lambda a: a*2)(n, (s,))(a)
+    f = Function('test_call_options', (a, s), (x,))
+    Function.compile()
+
+    ar = np.random.rand(n, 1)
+    sr = np.zeros((n, 1))
+    assert np.allclose(f(ar, sr, zero_static=True), 2*ar)
+    # static outputs accumulate over calls until zeroed
+    assert f(ar, sr, return_static=False) is None
+    assert np.allclose(f(ar, sr), 4*ar)
+    # written in place, strided or other dtypes are not copied
+    assert np.allclose(sr, 4*ar)
+    sb = np.zeros((n, 2))
+    sb[:, :1] = sr
+    for arg in [sb[:, :1], sr.astype(np.float32)]:
+        try:
+            f(ar, arg)
+            assert False
+        except (TypeError, ValueError):
+            pass
+    assert np.allclose(sr, 4*ar) and np.allclose(sb[:, :1], sr)
+
+def test_batch():
+    n = 20
+    m = 50
+    k = 4
+    a = Variable((n, 3))
+    o = IntegerVariable((m, 1))
+
+    def func(a, o):
+        x = a.extract(o)
+        return Tensor.collate(x*x, o), x.dot(x).sum()
+
+    y, s = Kernel(func)(m, (Zeros((n, 3)), Zeros((1, 1))))(a, o)
+    f = Function('test_batch', (a, o), (y, s))
+    g = f.getAdjoint()
+    fb = f.getBatched(shared=(o,))
+    # cotangents batched, primal inputs shared
+    gb = g.getBatched(shared=(a, o))
+    Function.compile()
+
+    ar = np.random.rand(k, n, 3)
+    orr = np.random.randint(0, n, (m, 1)).astype(np.int32)
+    yg = np.random.rand(k, n, 3)
+    sg = np.random.rand(k, 1, 1)
+    yb, sb = fb(ar, orr)
+    assert yb.shape == (k, n, 3) and sb.shape == (k, 1, 1)
+    agb = gb(ar[0], orr, yg, sg)[0]
+    for b in range(0, k):
+        yr, sr = f(ar[b], orr)
+        assert np.allclose(yb[b], yr) and np.allclose(sb[b], sr)
+        assert np.allclose(agb[b], g(ar[0], orr, yg[b], sg[b])[0])
+    # strided batches are copied once and counted
+    Function.resetConversions()
+    assert np.allclose(fb(np.concatenate([ar, ar], axis=2)[:, :, :3], orr)[0], yb)
+    assert Function.getConversions() == {'test_batch_batch:0': 1}
+    try:
+        config.compile = False
+        assert np.allclose(fb(ar, orr)[0], yb)
+    finally:
+        config.compile = True
+
+def test_tangent():
+    n = 50
+    a = Variable((n, 1))
+    b = Variable((n, 1))
+    c = Variable((n, 1))
+    y = IntegerVariable((n, 1))
+
+    def func(a, b, c, y):
+        return a*b/(c + 1) + abs(c - 0.5), Tensor.collate(c*c, y)
+
+    def func2(x, y, z):
+        u = z.extract(y)*x
+        return Tensor.max(u, x**2).sqrt().sum()
+
+    def func3(x, s):
+        return x*s.scalar()
+
+    x, z = Kernel(func)()(a, b, c, y)
+    s = Kernel(func2)(n, (Zeros((1, 1)),))(x, y, z)
+    w = Kernel(func3)()(x, s)
+    f = Function('test_tangent', (a, b, c, y), (w,))
+    g = f.getAdjoint()
+    t = f.getTangent()
+    ta = f.getTangent((a,))
+    Function.compile()
+
+    ar = np.random.rand(n, 1)
+    br = np.random.rand(n, 1)
+    cr = np.random.rand(n, 1)
+    yr = np.random.randint(0, n, (n, 1)).astype(np.int32)
+    av = np.random.rand(n, 1)
+    bv = np.random.rand(n, 1)
+    cv = np.random.rand(n, 1)
+    wg = np.random.rand(n, 1)
+    wt, wd = t(ar, br, cr, yr, av, bv, cv)
+    assert np.allclose(wt, f(ar, br, cr, yr))
+    ag, bg, cg, yg = g(ar, br, cr, yr, wg)
+    assert np.allclose((wd*wg).sum(), (ag*av + bg*bv + cg*cv).sum())
+    wa = ta(ar, br, cr, yr, av)[1]
+    assert np.allclose((wa*wg).sum(), (ag*av).sum())
+    try:
+        config.compile = False
+        assert np.allclose(t(ar, br, cr, yr, av, bv, cv)[1], wd)
+    finally:
+        config.compile = True
+
+def test_hessian_vector():
+    n = 30
+    a = Variable((n, 1))
+    b = Variable((n, 1))
+    y = IntegerVariable((n, 1))
+
+    def func(a, b, y):
+        x = a.extract(y)
+        return Tensor.collate(x*x*b, y)
+
+    def func2(z, a, b):
+        return ((z*z + 1).sqrt()*b + a*a*a/(b + 1)).sum()
+
+    z = Kernel(func)(n, (Zeros((n, 1)),))(a, b, y)
+    s = Kernel(func2)(n, (Zeros((1, 1)),))(z, a, b)
+    f = Function('test_hessian_vector', (a, b, y), (s,))
+    g = f.getAdjoint()
+    h = f.getHessianVector()
+    # no second Function with the same names
+    assert f.getHessianVector() is h
+    h2 = f.getHessianVector([b])
+    assert h2 is not h and f.getHessianVector([b]) is h2
+    Function.compile()
+
+    ar = np.random.rand(n, 1)
+    br = np.random.rand(n, 1)
+    yr = np.random.randint(0, n, (n, 1)).astype(np.int32)
+    av = np.random.rand(n, 1)
+    bv = np.random.rand(n, 1)
+    sg = np.ones((1, 1))
+    ag, bg, yg, ah, bh = h(ar, br, yr, sg, av, bv)
+    agr, bgr, _ = g(ar, br, yr, sg)
+    assert np.allclose(ag, agr) and np.allclose(bg, bgr)
+    eps = 1e-5
+    agp, bgp, _ = g(ar + eps*av, br + eps*bv, yr, sg)
+    agm, bgm, _ = g(ar - eps*av, br - eps*bv, yr, sg)
+    assert np.allclose(ah, (agp - agm)/(2*eps))
+    assert np.allclose(bh, (bgp - bgm)/(2*eps))
+    ag, bg, _, ah, bh = h2(ar, br, yr, sg, bv)
+    agp, bgp, _ = g(ar, br + eps*bv, yr, sg)
+    agm, bgm, _ = g(ar, br - eps*bv, yr, sg)
+    assert np.allclose(ah, (agp - agm)/(2*eps))
+    assert np.allclose(bh, (bgp - bgm)/(2*eps))
+
+def test_specialization():
+    n = 20
+    a = Variable((n, 3))
+    b = Variable((n, 1))
+    c = Variable((2*n, 3))
+
+    def func(a, scale=1.):
+        return a*a*scale
+
+    kernel = Kernel(func)
+    x = kernel()(a)
+    funcA = kernel.tensorFunc
+    y = kernel()(b)
+    # the rows are not part of the signature
+    z = kernel()(c)
+    assert kernel.tensorFunc is funcA
+    w = kernel()(a, scale=2.)
+    assert kernel.misses == 3 and kernel.hits == 1
+    assert z.shape == (2*n, 3)
+    # keyword args of other types and unhashable ones are traced again
+    kernel()(a, scale=2)
+    assert kernel.misses == 4
+    kernel2 = Kernel(lambda a, weights: a*weights[0] + weights[1])
+    v = kernel2()(a, weights=[2., 3.])
+    kernel2()(a, weights=[2., 3.])
+    assert kernel2.misses == 2 and kernel2.hits == 0
+    # nor is a kernel generated with other config
+    optimize = config.optimize
+    config.optimize = not optimize
+    try:
+        kernel()(a)
+    finally:
+        config.optimize = optimize
+    assert kernel.misses == 5 and kernel.tensorFunc is not funcA
+    f = Function('test_specialization', (a, b, c), (x, y, z, w, v))
+    Function.compile()
+
+    ar = np.random.rand(n, 3)
+    br = np.random.rand(n, 1)
+    cr = np.random.rand(2*n, 3)
+    xr, yr, zr, wr, vr = f(ar, br, cr)
+    assert np.allclose(xr, ar*ar) and np.allclose(yr, br*br)
+    assert np.allclose(zr, cr*cr) and np.allclose(wr, 2*ar*ar)
+    assert np.allclose(vr, 2*ar + 3)
+
+def test_kernel_identity():
+    n = 10
+    a = Variable((n, 3))
+    b = Variable((n, 3))
+    c = Variable((n, 1))
+
+    def flux(u):
+        return u*u + 1
+
+    def flux2(v):
+        return v*v + 1
+
+    x = Kernel(flux)()(a)
+    y = Kernel(flux2)()(b)
+    z = Kernel(flux)()(c)
+    funcX, funcY, funcZ = [x.args[0].func, y.args[0].func, z.args[0].func]
+    assert funcX is funcY and funcX is not funcZ
+    f = Function('test_kernel_identity', (a, b, c), (x, y, z))
+    Function.compile()
+    assert [name for name in f.module.kernelCodeFiles if name.startswith(funcX.name)] == [funcX.name, funcX.name + '_grad']
+
+    ar, br, cr = np.random.rand(n, 3), np.random.rand(n, 3), np.random.rand(n, 1)
+    xr, yr, zr = f(ar, br, cr)
+    assert np.allclose(xr, ar*ar + 1) and np.allclose(yr, br*br + 1) and np.allclose(zr, cr*cr + 1)
+    # names do not depend on the kernels traced before
+    Kernel(lambda u: u*2)()(a)
+    assert Kernel(flux2)()(a).args[0].func.name == funcX.name
+
+def test_modules():
+    n = 10
+    results = []
+    modules = []
+    for index, background in enumerate(['thread', 'process']):
+        with Module('test_modules_{}'.format(index)) as module:
+            a = Variable((n, 3))
+            x = Kernel(lambda a: a*(index + 2))()(a)
+            f = Function('test_modules', (a,), (x,))
+        # the next module is built while this one compiles
+        modules.append((module.build(background=background), f))
+
+    ar = np.random.rand(n, 3)
+    for index, (module, f) in enumerate(modules):
+        module.load()
+        assert module.ready() and f.module is module
+        assert not any([x.endswith('.lock') for x in os.listdir(os.path.join(module.codeDir, 'cache'))])
+        assert np.allclose(f(ar), ar*(index + 2))
+    # both stay loaded side by side
+    assert modules[0][0].module is not modules[1][0].module
+    assert np.allclose(modules[0][1](ar), ar*2)
+
+def test_cache_pruning():
+    from adpy.compile import prune_gencode, prune_cache
+    tmpDir = tempfile.mkdtemp()
+    try:
+        # objects and kernel sources of earlier graphs
+        names = ['code.cpp', 'code.o', 'kernel.hpp', 'kernel_Function_a.cpp', 'kernel_Function_a.o', 'kernel_Function_b.cpp', 'kernel_Function_b.o']
+        for name in names:
+            open(os.path.join(tmpDir, name), 'w').close()
+        prune_gencode(tmpDir, ['code.cpp', 'code.o', 'kernel_Function_a.cpp', 'kernel_Function_a.o'])
+        assert sorted(os.listdir(tmpDir)) == names[:5]
+        shutil.rmtree(tmpDir)
+        os.makedirs(tmpDir)
+        # least recently used first
+        for index in range(0, 4):
+            path = os.path.join(tmpDir, 'graph-{}.so'.format(index))
+            with open(path, 'wb') as f:
+                f.write(b'0'*100)
+            os.utime(path, (index, [2, 0, 1, 3][index]))
+        prune_cache(tmpDir, 250, keep=[os.path.join(tmpDir, 'graph-1.so')])
+        assert sorted(os.listdir(tmpDir)) == ['graph-1.so', 'graph-3.so']
+    finally:
+        shutil.rmtree(tmpDir)
+
+def test_tiered():
+    n = 10
+    a = Variable((n, 3))
+    x = Kernel(lambda a: a*a + 1)()(a)
+    s = Kernel(lambda x: x.dot(x).sum())(n, (Zeros((1, 1)),))(x)
+    f = Function('test_tiered', (a,), (x, s))
+    g = f.getAdjoint(policy='store')
+    y = Kernel(lambda a: 2*a)()(a)
+    h = Function('test_tiered_unrelated', (a,), (y,))
+    module = f.module
+    tiers = []
+    module.tierUpHooks.append(lambda m: tiers.append(m.tier))
+    Function.compile(tiered=True)
+    assert module.tier == 'interpreter' and f._func is None
+
+    ar = np.random.rand(n, 3)
+    xg, sg = np.random.rand(n, 3), np.ones((1, 1))
+    xr = ar*ar + 1
+    agr = xg*2*ar + 4*xr*ar*sg
+    results = [f(ar), g(ar, xg, sg)]
+    assert np.allclose(results[1], agr)
+    # the adjoint reads the tape of the interpreted forward, no switch
+    # before it runs
+    f(ar)
+    assert not module.tierUp(wait=True)
+    assert np.allclose(h(ar), 2*ar)
+    assert module.tier == 'interpreter' and tiers == []
+    assert np.allclose(g(ar, xg, sg), agr)
+    # a forward writing the tape switches
+    assert all([np.allclose(u, v) for u, v in zip(results[0], f(ar))])
+    assert module.tier == 'compiled' and tiers == ['compiled']
+    assert f._func is not None and g._func is not None
+    assert np.allclose(g(ar, xg, sg), agr)
+    assert np.allclose(h(ar), 2*ar)
+
+def test_tiered_state():
+    from adpy.variable import StaticVariable
+    n = 10
+    a = Variable((n, 1))
+    s = StaticVariable((n, 1))
+    t = Zeros((n, 1))
+    t.static = True
+    x, y = Kernel(lambda a: (a*2, a*3))(n, (s, t))(a)
+    f = Function('test_tiered_state', (a, s), (x, y))
+    b = Variable((n, 1))
+    z = Kernel(lambda b: b + 1)()(b)
+    g = Function('test_tiered_state_reuse', (b,), (z,), io_map={0: 0})
+    module = f.module
+    Function.compile(tiered=True)
+
+    ar, sr = np.random.rand(n, 1), np.zeros((n, 1))
+    xr, yr = f(ar, sr)
+    assert np.allclose(g(ar), ar + 1)
+    assert module.tier == 'interpreter'
+    # the static input accumulates in place, the static array and the
+    # output reused by the next call are copied into the module
+    module.wait()
+    xr, yr = f(ar, sr)
+    assert module.tier == 'compiled'
+    assert np.allclose(xr, 4*ar) and np.allclose(sr, 4*ar) and np.allclose(yr, 6*ar)
+    assert np.allclose(g(ar), ar + 2)
+
+def test_tiered_failure():
+    import subprocess
+    n = 10
+    a = Variable((n, 1))
+    x = Kernel(lambda a: a*2)()(a)
+    f = Function('test_tiered_failure', (a,), (x,))
+    module = f.module
+    # the compiler rejects the flag
+    Function.compile(tiered=True, compiler_args={'extra_compile_args': ['-fno-such-flag']})
+
+    ar = np.random.rand(n, 1)
+    while not module.ready():
+        assert np.allclose(f(ar), 2*ar)
+    assert module.failed()
+    # the calls stay in the interpreter, wait raises the error
+    assert np.allclose(f(ar), 2*ar) and module.tier == 'interpreter'
+    for i in range(0, 2):
+        try:
+            module.wait()
+            assert False
+        except subprocess.CalledProcessError:
+            pass
+    assert np.allclose(f(ar), 2*ar) and module.tier == 'interpreter'
+
+def test_input_conversion():
+    n = 20
+    a = Variable((n, 3))
+    b = Variable((n, 1))
+    c = IntegerVariable((n, 1))
+
+    def func(a, b, c):
+        return a.extract(c)*b
+
+    x = Kernel(func)()(a, b, c)
+    f = Function('test_input_conversion', (a, b, c), (x,))
+    Function.compile()
+
+    ar, br = np.random.rand(n, 3), np.random.rand(n, 1)
+    cr = np.random.randint(0, n, (n, 1)).astype(np.int32)
+    xr = ar[cr.flatten()]*br
+    Function.resetConversions()
+    # used in place
+    tmpDir = tempfile.mkdtemp()
+    try:
+        am = np.memmap(os.path.join(tmpDir, 'a.dat'), dtype=np.float64, mode='w+', shape=ar.shape)
+        am[:] = ar
+        assert np.allclose(f(am, memoryview(br), cr), xr)
+        del am
+    finally:
+        shutil.rmtree(tmpDir)
+    assert Function.getConversions() == {}
+    # strided, float32 and int64 arrays are converted
+    ab = np.random.rand(n, 6)
+    ab[:, ::2] = ar
+    assert np.allclose(f(ab[:, ::2], br.astype(np.float32), cr.astype(np.int64)), ar[cr.flatten()]*br.astype(np.float32))
+    assert np.allclose(f(ar, br, cr.astype(np.int64)), xr)
+    assert Function.getConversions() == {'test_input_conversion:0': 1, 'test_input_conversion:1': 1, 'test_input_conversion:2': 2}
+
+def test_deep_graph():
+    # construction and differentiation only, compiling kernels
+    # this deep takes minutes
+    n = 10
+    depth = 5000
+    a = Variable((n, 1))
+
+    def func(a):
+        x = a
+        for i in range(0, depth):
+            x = x*0.999 + 0.001
+        return x
+
+    kernel = Kernel(func)
+    x = kernel()(a)
+    f = Function('test_deep_graph', (a,), (x,))
+    g = f.getAdjoint()
+
+    grad = kernel.tensorFunc.grad
+    assert len(grad._outputs) == 1
+    assert grad._outputs[0] is not None
+    Function.reset()
+
 if __name__ == '__main__':
     #test_arithmetic()
     #test_reduction()